@@ -0,0 +1,67 @@
+"""Micro-benchmarks of version and spec parsing
+
+Usage: python benchmarks/bench_parse.py
+"""
+import re
+import timeit
+
+from pyenv_inspect.spec import PyenvPythonSpec
+from pyenv_inspect.version import (
+    VERSION_PATTERN, Version, parse_version_fields,
+)
+
+
+STRING_VERSIONS = ['3', '3.12', '3.11.9', '3.13.0rc2t', '3.14-dev']
+NUMBER = 100_000
+
+
+def bench(label: str, func) -> float:
+    elapsed = min(timeit.repeat(
+        lambda: [func(s) for s in STRING_VERSIONS], number=NUMBER // 10,
+        repeat=5,
+    ))
+    per_call = elapsed / (NUMBER // 10) / len(STRING_VERSIONS) * 1e9
+    print(f'{label:<40} {per_call:8.1f} ns/call')
+    return per_call
+
+
+def _parse_version_fields_regex(string_version: str, *, _regex=re.compile(
+    VERSION_PATTERN,
+)):
+    # the regex-based parser used before the hand-written one
+    match = _regex.fullmatch(string_version)
+    if not match:
+        return None
+    fields = match.groupdict()
+    base = tuple(map(int, fields['base'].split('.')))
+    pre = None
+    if _pre := fields['pre']:
+        if _pre.startswith('rc'):
+            pre = ('rc', int(_pre[2:]))
+        else:
+            pre = (_pre[0], int(_pre[1:]))
+    return base, pre, bool(fields['dev']), bool(fields['free_threaded'])
+
+
+def _main() -> None:
+    regex = bench('regex parser', _parse_version_fields_regex)
+    scanner = bench('hand-written parser', parse_version_fields)
+    print(f'{"":<40} {regex / scanner:8.1f}x')
+    parse_version = Version.from_string_version
+    parse_spec = PyenvPythonSpec.from_string_spec
+    uncached = bench(
+        'Version.from_string_version (miss)',
+        lambda s: parse_version.__wrapped__(Version, s))
+    cached = bench(
+        'Version.from_string_version (hit)', lambda s: parse_version(s))
+    print(f'{"":<40} {uncached / cached:8.1f}x')
+    uncached = bench(
+        'PyenvPythonSpec.from_string_spec (miss)',
+        lambda s: parse_spec.__wrapped__(PyenvPythonSpec, s))
+    cached = bench(
+        'PyenvPythonSpec.from_string_spec (hit)', lambda s: parse_spec(s))
+    print(f'{"":<40} {uncached / cached:8.1f}x')
+
+
+if __name__ == '__main__':
+    _main()
@@ -0,0 +1,168 @@
+"""Benchmark suite of the resolve path on synthetic pyenv trees
+
+Usage: python benchmarks/bench_resolve.py [--sizes 10,100,1000,10000]
+                                          [--json PATH] [--compare PATH]
+
+Every tree mixes CPython versions, free-threaded builds, pre-releases,
+pyenv-virtualenv symlinks and unsupported names. `--json` saves the results,
+`--compare` prints them side by side with previously saved results.
+"""
+import argparse
+import json
+import logging
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Optional
+
+from pyenv_inspect.inspect import find_pyenv_python_executable
+from pyenv_inspect.inventory import PyenvInventory
+from pyenv_inspect.path import get_pyenv_python_executable_path
+from pyenv_inspect.spec import PyenvPythonSpec
+from pyenv_inspect.version import Version
+
+
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+MIN_TIME = 0.2
+
+
+def make_tree(versions_dir: Path, size: int) -> list[str]:
+    """Creates `size` entries in `versions_dir`, returns CPython names"""
+    versions_dir.mkdir(parents=True)
+    cpython_names: list[str] = []
+    for index in range(size):
+        minor = 8 + index % 7
+        kind = index % 10
+        if kind == 7 and cpython_names:
+            name = f'env-{index}'
+            env_path = versions_dir / cpython_names[-1] / 'envs' / name
+            env_path.mkdir(parents=True)
+            (versions_dir / name).symlink_to(env_path)
+            continue
+        if kind == 8:
+            if index == 8:
+                name = 'pypy3.10-7.3.15'
+            elif index == 18:
+                name = 'miniconda3-latest'
+            else:
+                name = f'pypy3.{minor}-7.3.{index}'
+            (versions_dir / name).mkdir()
+            continue
+        if kind == 6:
+            name = f'3.{minor}.{index}t'
+        elif kind == 9:
+            name = f'3.{minor}.{index}rc1'
+        else:
+            name = f'3.{minor}.{index}'
+        exec_path = versions_dir / name / 'bin' / 'python'
+        exec_path.parent.mkdir(parents=True)
+        exec_path.touch(mode=0o755)
+        cpython_names.append(name)
+    return cpython_names
+
+
+def measure(func: Callable[[], object]) -> float:
+    """Returns the best time of a single call, in microseconds"""
+    best = float('inf')
+    total = 0.0
+    while total < MIN_TIME:
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        total += elapsed
+    return best * 1e6
+
+
+def clear_parse_caches() -> None:
+    Version.from_string_version.cache_clear()
+    PyenvPythonSpec.from_string_spec.cache_clear()
+
+
+def bench_tree(versions_dir: Path, size: int) -> dict[str, float]:
+    cpython_names = make_tree(versions_dir, size)
+    # move mtime out of the racy window of the inventory
+    os.utime(versions_dir, ns=(0, 0))
+    warm_inventory = PyenvInventory(versions_dir)
+    # the first call scans the tree, which may take longer than MIN_TIME
+    find_pyenv_python_executable('3.12', inventory=warm_inventory)
+    exact_name = cpython_names[-1]
+    version_dir = versions_dir / exact_name
+    names = os.listdir(versions_dir)
+
+    def find_cold():
+        clear_parse_caches()
+        find_pyenv_python_executable(
+            '3.12', inventory=PyenvInventory(versions_dir))
+
+    def parse_all():
+        clear_parse_caches()
+        for name in names:
+            spec = PyenvPythonSpec.from_string_spec(name)
+            if spec.is_supported():
+                Version.from_string_version(spec.version)
+
+    return {
+        'find partial spec, cold': measure(find_cold),
+        'find partial spec, warm': measure(
+            lambda: find_pyenv_python_executable(
+                '3.12', inventory=warm_inventory)),
+        'find constraint, warm': measure(
+            lambda: find_pyenv_python_executable(
+                '>=3.10,<3.13', inventory=warm_inventory)),
+        'find exact spec, warm': measure(
+            lambda: find_pyenv_python_executable(
+                exact_name, inventory=warm_inventory)),
+        'parse all names, uncached': measure(parse_all),
+        'validate executable': measure(
+            lambda: get_pyenv_python_executable_path(version_dir)),
+    }
+
+
+def print_report(
+    results: dict[str, dict[str, float]],
+    baseline: Optional[dict[str, dict[str, float]]] = None,
+) -> None:
+    header = f'{"entries":>8}  {"operation":<28}{"time, us":>12}'
+    if baseline:
+        header += f'{"baseline, us":>14}{"ratio":>8}'
+    print(header)
+    for size, timings in results.items():
+        for operation, timing in timings.items():
+            line = f'{size:>8}  {operation:<28}{timing:>12.1f}'
+            if baseline:
+                base_timing = baseline.get(size, {}).get(operation)
+                if base_timing:
+                    line += f'{base_timing:>14.1f}{timing / base_timing:>8.2f}'
+            print(line)
+
+
+def _main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+        help='comma-separated numbers of entries',
+    )
+    parser.add_argument('--json', type=Path, help='save results to file')
+    parser.add_argument(
+        '--compare', type=Path, help='compare with results saved to file')
+    args = parser.parse_args()
+    # unsupported names are logged as warnings
+    logging.getLogger('pyenv_inspect').setLevel(logging.ERROR)
+    results: dict[str, dict[str, float]] = {}
+    for size in map(int, args.sizes.split(',')):
+        with TemporaryDirectory() as tmp_dir:
+            results[str(size)] = bench_tree(
+                Path(tmp_dir) / 'versions', size)
+    baseline = None
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+    print_report(results, baseline)
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=4) + '\n')
+
+
+if __name__ == '__main__':
+    _main()
@@ -0,0 +1,44 @@
+"""Benchmark of sorting many versions
+
+Usage: python benchmarks/bench_sort.py [COUNT]
+"""
+import random
+import sys
+import time
+
+from pyenv_inspect.version import Version
+
+
+def make_versions(count: int) -> list[Version]:
+    rnd = random.Random(0)
+    versions = []
+    for _ in range(count):
+        base = (3, rnd.randint(0, 14), rnd.randint(0, 20))[:rnd.randint(1, 3)]
+        pre = None
+        if rnd.random() < 0.1:
+            pre = (rnd.choice(['a', 'b', 'rc']), rnd.randint(1, 5))
+        dev = rnd.random() < 0.05
+        versions.append(Version(base=base, pre=pre, dev=dev))
+    return versions
+
+
+def _main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    versions = make_versions(count)
+    # warm up lazily computed attributes, if any
+    sorted(versions[:1000])
+    timings = []
+    for _ in range(5):
+        start = time.perf_counter()
+        sorted(versions)
+        timings.append(time.perf_counter() - start)
+    version = versions[0]
+    size = sys.getsizeof(version)
+    if hasattr(version, '__dict__'):
+        size += sys.getsizeof(version.__dict__)
+    print(f'sorted {count} versions: {min(timings) * 1000:.1f} ms, '
+          f'{size} bytes per instance (without fields)')
+
+
+if __name__ == '__main__':
+    _main()
@@ -1,7 +1,53 @@
-from .inspect import find_pyenv_python_executable
+# virtualenv-pyenv imports the package on every virtualenv startup, so
+# submodules are imported on first access to an attribute (PEP 562)
+_LAZY_ATTRIBUTES = {
+    'PyenvInventory': 'inventory',
+    'PyenvVersionsWatcher': 'watch',
+    'find_all_pyenv_python_executables': 'inspect',
+    'find_pyenv_python_executable': 'inspect',
+    'find_pyenv_python_executables': 'inspect',
+    'find_selected_pyenv_python_executable': 'selection',
+    'iter_pyenv_versions': 'inventory',
+}
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .inspect import (
+        find_all_pyenv_python_executables, find_pyenv_python_executable,
+        find_pyenv_python_executables,
+    )
+    from .inventory import PyenvInventory, iter_pyenv_versions
+    from .selection import find_selected_pyenv_python_executable
+    from .watch import PyenvVersionsWatcher
 
 
 __version__ = '0.5.0'
 
 
-__all__ = ['__version__', 'find_pyenv_python_executable']
+__all__ = [
+    '__version__',
+    'PyenvInventory',
+    'PyenvVersionsWatcher',
+    'find_all_pyenv_python_executables',
+    'find_pyenv_python_executable',
+    'find_pyenv_python_executables',
+    'find_selected_pyenv_python_executable',
+    'iter_pyenv_versions',
+]
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(
+            f'module {__name__!r} has no attribute {name!r}') from None
+    # unlike importlib.import_module(), shows up in `-X importtime` output
+    module = __import__(f'{__name__}.{module_name}', fromlist=[name])
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
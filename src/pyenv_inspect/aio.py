@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Iterable
+from functools import partial
+from pathlib import Path
+from typing import Callable, TypeVar
+
+from .constraint import VersionConstraint
+from .index import VersionIndex
+from .inspect import (
+    _get_exact_version_name, _get_executable_path, _get_executable_paths,
+    _get_requested_version, _get_requested_versions, _select_best_match,
+    _select_best_matches,
+)
+from .inventory import PyenvInventory, default_inventory
+from .spec import PyenvPythonSpec
+
+
+log = logging.getLogger(__name__)
+
+_T = TypeVar('_T')
+
+_inflight_scans: dict[
+    tuple[asyncio.AbstractEventLoop, PyenvInventory],
+    asyncio.Future[VersionIndex],
+] = {}
+
+
+async def afind_pyenv_python_executable(
+    spec: PyenvPythonSpec | VersionConstraint | str,
+    *, inventory: PyenvInventory | None = None,
+    skip_broken: bool = False,
+) -> Path | None:
+    """asyncio counterpart of `find_pyenv_python_executable`
+
+    Filesystem work runs in the default executor of the running loop.
+    Concurrent calls sharing an inventory share one in-flight scan.
+    """
+    requested_version = _get_requested_version(spec)
+    log.debug('requested %s', requested_version)
+    if inventory is None:
+        inventory = default_inventory
+    exact_name = _get_exact_version_name(requested_version)
+    if exact_name is not None:
+        version_dir = await _run(inventory.get_version_directory, exact_name)
+        if version_dir is not None:
+            log.debug('accepted %s', requested_version)
+            return await _run(
+                _get_executable_path, inventory, version_dir,
+                requested_version, skip_broken,
+            )
+        log.debug('%s not found, falling back to scan', exact_name)
+    best_match_dir = _select_best_match(
+        await _get_index(inventory), requested_version)
+    if not best_match_dir:
+        return None
+    return await _run(
+        _get_executable_path, inventory, best_match_dir, requested_version,
+        skip_broken,
+    )
+
+
+async def afind_pyenv_python_executables(
+    specs: Iterable[PyenvPythonSpec | VersionConstraint | str],
+    *, inventory: PyenvInventory | None = None,
+    skip_broken: bool = False,
+) -> dict[PyenvPythonSpec | VersionConstraint | str, Path | None]:
+    """asyncio counterpart of `find_pyenv_python_executables`"""
+    requested_versions = _get_requested_versions(specs)
+    if inventory is None:
+        inventory = default_inventory
+    best_match_dirs = _select_best_matches(
+        await _get_index(inventory), requested_versions.values())
+    return await _run(
+        _get_executable_paths, inventory, requested_versions, best_match_dirs,
+        skip_broken,
+    )
+
+
+async def _get_index(inventory: PyenvInventory) -> VersionIndex:
+    loop = asyncio.get_running_loop()
+    key = (loop, inventory)
+    future = _inflight_scans.get(key)
+    if future is None:
+        future = loop.run_in_executor(None, inventory.get_index)
+        _inflight_scans[key] = future
+        future.add_done_callback(lambda _: _inflight_scans.pop(key, None))
+    else:
+        log.debug('joining in-flight scan')
+    # a cancelled awaiter must not cancel the scan shared with others
+    return await asyncio.shield(future)
+
+
+async def _run(func: Callable[..., _T], *args) -> _T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, partial(func, *args))
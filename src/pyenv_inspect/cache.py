@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+
+log = logging.getLogger(__name__)
+
+
+CACHE_ENV_VAR = 'PYENV_INSPECT_CACHE'
+CACHE_FORMAT = 1
+
+_TRUTHY = ('1', 'true', 'yes', 'on')
+
+
+def is_cache_enabled() -> bool:
+    return os.environ.get(CACHE_ENV_VAR, '').strip().lower() in _TRUTHY
+
+
+def get_cache_directory(pyenv_root: Path) -> Path:
+    xdg_cache_home = os.environ.get('XDG_CACHE_HOME')
+    if xdg_cache_home:
+        import hashlib
+
+        digest = hashlib.sha1(os.fsencode(pyenv_root)).hexdigest()[:16]
+        return Path(xdg_cache_home) / 'pyenv-inspect' / digest
+    return pyenv_root / '.pyenv-inspect'
+
+
+# json, hashlib and tempfile are imported on use: the cache is disabled by
+# default, and these imports make up most of the package import time
+
+
+def read_cache_file(path: Path) -> dict[str, Any] | None:
+    import json
+
+    try:
+        with open(path, 'rb') as fobj:
+            data = json.load(fobj)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        log.debug('cannot read cache file %s: %s', path, exc)
+        return None
+    if not isinstance(data, dict) or data.get('format') != CACHE_FORMAT:
+        log.debug('ignoring cache file %s: unknown format', path)
+        return None
+    return data
+
+
+def write_cache_file(path: Path, data: dict[str, Any]) -> None:
+    """Atomically replaces the cache file, errors are logged and ignored"""
+    import json
+    import tempfile
+
+    data = {'format': CACHE_FORMAT, **data}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as fobj:
+                json.dump(data, fobj, separators=(',', ':'))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as exc:
+        log.debug('cannot write cache file %s: %s', path, exc)
+
+
+def remove_cache_file(path: Path) -> None:
+    """Removes the cache file if it exists, errors are logged and ignored"""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    except OSError as exc:
+        log.debug('cannot remove cache file %s: %s', path, exc)
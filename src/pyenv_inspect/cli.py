@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from . import __version__
+from .constraint import VersionConstraint, is_string_constraint
+from .exceptions import PyenvInspectError, SpecParseError
+from .inspect import find_pyenv_python_executable
+from .inventory import PyenvInventory
+from .spec import PyenvPythonSpec
+
+
+log = logging.getLogger(__name__)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = _make_parser()
+    args = parser.parse_args(argv)
+    logging.basicConfig(
+        format='%(levelname)s: %(message)s',
+        level=logging.DEBUG if args.verbose else logging.ERROR,
+    )
+    try:
+        return args.command(args)
+    except PyenvInspectError as exc:
+        print(f'{parser.prog}: error: {exc}', file=sys.stderr)
+        return 2
+
+
+def _make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='pyenv-inspect',
+        description='Find Python executables installed with pyenv',
+    )
+    parser.add_argument(
+        '--version', action='version', version=f'%(prog)s {__version__}')
+    parser.add_argument(
+        '-v', '--verbose', action='store_true', help='log debug messages')
+    subparsers = parser.add_subparsers(required=True, metavar='COMMAND')
+
+    find_parser = subparsers.add_parser(
+        'find', help='find executables matching specs',
+        description=(
+            'Print a JSON object per spec, one per line, in the order of '
+            'specs. Specs are read from standard input, one per line, if '
+            'none are passed or the only spec is "-". Exit status is 1 if '
+            'any spec is invalid or has no match.'
+        ),
+    )
+    find_parser.add_argument(
+        'specs', nargs='*', metavar='SPEC',
+        help='version prefix (3.12) or constraint (">=3.10,<3.13,t")',
+    )
+    find_parser.add_argument(
+        '--versions-dir', type=Path,
+        help='pyenv versions directory (default: $PYENV_ROOT/versions)',
+    )
+    find_parser.set_defaults(command=_find)
+
+    serve_parser = subparsers.add_parser(
+        'serve', help='run the resolver daemon',
+        description='Serve lookups over a Unix domain socket.',
+    )
+    serve_parser.add_argument(
+        '--socket', type=Path,
+        help='socket path (default: $PYENV_ROOT/.pyenv-inspect/daemon.sock)',
+    )
+    serve_parser.add_argument(
+        '--versions-dir', type=Path,
+        help='pyenv versions directory (default: $PYENV_ROOT/versions)',
+    )
+    serve_parser.set_defaults(command=_serve)
+
+    return parser
+
+
+def _find(args: argparse.Namespace) -> int:
+    specs: Iterable[str] = args.specs
+    if not specs or specs == ['-']:
+        specs = _read_specs(sys.stdin)
+    inventory = None
+    if args.versions_dir:
+        inventory = PyenvInventory(args.versions_dir)
+    all_found = True
+    for string_spec in specs:
+        result = _find_one(string_spec, inventory)
+        if result['executable'] is None:
+            all_found = False
+        # flushed per line, so consumers can read results as they come
+        print(json.dumps(result), flush=True)
+    return 0 if all_found else 1
+
+
+def _find_one(
+    string_spec: str, inventory: PyenvInventory | None,
+) -> dict[str, Any]:
+    result: dict[str, Any] = {
+        'string_spec': string_spec,
+        'spec': None,
+        'executable': None,
+        'error': None,
+    }
+    try:
+        if not string_spec:
+            raise SpecParseError
+        spec: PyenvPythonSpec | VersionConstraint
+        if is_string_constraint(string_spec):
+            spec = VersionConstraint.from_string_constraint(string_spec)
+            result['spec'] = spec.to_dict()
+        else:
+            spec = PyenvPythonSpec.from_string_spec(string_spec)
+            result['spec'] = spec.to_dict()
+            spec.is_supported(raise_exception=True)
+        exec_path = find_pyenv_python_executable(spec, inventory=inventory)
+    except PyenvInspectError as exc:
+        result['error'] = {'type': type(exc).__name__, 'message': str(exc)}
+        return result
+    if exec_path is not None:
+        result['executable'] = str(exec_path)
+    return result
+
+
+def _read_specs(lines: Iterable[str]) -> Iterator[str]:
+    for line in lines:
+        string_spec = line.strip()
+        if string_spec:
+            yield string_spec
+
+
+def _serve(args: argparse.Namespace) -> int:
+    # the daemon and its dependencies are not needed for other commands
+    from .daemon import serve
+
+    serve(args.socket, versions_dir=args.versions_dir)
+    return 0
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import enum
+from collections.abc import Callable
+from functools import lru_cache
+from operator import eq, ge, gt, le, lt, ne
+from typing import NamedTuple
+
+from .exceptions import ConstraintParseError, VersionParseError
+from .version import PARSE_CACHE_SIZE, Version
+
+
+FREE_THREADED_SELECTOR = 't'
+
+_OPERATOR_CHARS = '<>=!'
+
+
+class Operator(enum.Enum):
+    LT = '<'
+    LE = '<='
+    GT = '>'
+    GE = '>='
+    EQ = '=='
+    NE = '!='
+
+
+# two-character operators are checked first
+_OPERATORS = sorted(Operator, key=lambda operator: -len(operator.value))
+
+_COMPARATORS: dict[Operator, Callable[[Version, Version], bool]] = {
+    Operator.LT: lt,
+    Operator.LE: le,
+    Operator.GT: gt,
+    Operator.GE: ge,
+    Operator.EQ: eq,
+    Operator.NE: ne,
+}
+
+
+class ConstraintClause(NamedTuple):
+    operator: Operator
+    version: Version
+
+    def __str__(self) -> str:
+        return f'{self.operator.value}{self.version}'
+
+    def matches(self, version: Version) -> bool:
+        return _COMPARATORS[self.operator](version, self.version)
+
+
+class VersionConstraint(NamedTuple):
+    """Comma-joined version clauses, e.g., `>=3.10,<3.13`
+
+    Every clause is an operator (`<`, `<=`, `>`, `>=`, `==`, `!=`) followed
+    by a version; versions are compared with `Version` ordering, so `==3.12`
+    matches 3.12 and 3.12.0 but not 3.12.4. The `t` clause (or the `t`
+    suffix of any clause version) selects free-threaded builds instead of
+    the default ones. Pre-releases and dev versions match only if some
+    clause version is a pre-release or a dev version, respectively.
+    """
+    string_constraint: str
+    clauses: tuple[ConstraintClause, ...]
+    free_threaded: bool
+
+    @classmethod
+    @lru_cache(maxsize=PARSE_CACHE_SIZE)
+    def from_string_constraint(
+        cls, string_constraint: str,
+    ) -> VersionConstraint:
+        free_threaded = False
+        parsed_clauses: list[tuple[Operator, Version]] = []
+        for string_clause in string_constraint.split(','):
+            string_clause = string_clause.strip()
+            if string_clause == FREE_THREADED_SELECTOR:
+                free_threaded = True
+                continue
+            for operator in _OPERATORS:
+                if string_clause.startswith(operator.value):
+                    break
+            else:
+                raise ConstraintParseError(string_constraint)
+            try:
+                version = Version.from_string_version(
+                    string_clause[len(operator.value):].strip())
+            except VersionParseError:
+                raise ConstraintParseError(string_constraint) from None
+            free_threaded = free_threaded or version.free_threaded
+            parsed_clauses.append((operator, version))
+        # versions of different threading models cannot be compared
+        clauses = tuple(
+            ConstraintClause(operator, Version(
+                version.base, version.pre, version.dev, free_threaded))
+            for operator, version in parsed_clauses
+        )
+        return cls(string_constraint, clauses, free_threaded)
+
+    def __str__(self) -> str:
+        return self.string_constraint
+
+    def __contains__(self, version: object) -> bool:
+        if not isinstance(version, Version):
+            return False
+        if version.free_threaded != self.free_threaded:
+            return False
+        if version.pre and not self.allows_pre():
+            return False
+        if version.dev and not self.allows_dev():
+            return False
+        return all(clause.matches(version) for clause in self.clauses)
+
+    def allows_pre(self) -> bool:
+        return any(clause.version.pre for clause in self.clauses)
+
+    def allows_dev(self) -> bool:
+        return any(clause.version.dev for clause in self.clauses)
+
+    def to_dict(self) -> dict:
+        return {
+            'string_constraint': self.string_constraint,
+            'clauses': [str(clause) for clause in self.clauses],
+            'free_threaded': self.free_threaded,
+        }
+
+
+def is_string_constraint(string: str) -> bool:
+    """Returns `True` if the string should be parsed as a constraint
+
+    Constraints start with an operator or have several clauses; neither
+    is possible for pyenv version names.
+    """
+    return (bool(string) and string[0] in _OPERATOR_CHARS) or ',' in string
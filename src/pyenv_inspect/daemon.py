@@ -0,0 +1,340 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from . import exceptions
+from .constraint import VersionConstraint
+from .exceptions import DaemonError, PyenvInspectError, SpecParseError
+from .inspect import find_pyenv_python_executable
+from .inventory import PyenvInventory, default_inventory
+from .path import get_pyenv_root
+from .spec import PyenvPythonSpec
+from .watch import PyenvVersionsWatcher
+
+
+log = logging.getLogger(__name__)
+
+
+SOCKET_NAME = 'daemon.sock'
+DEFAULT_TIMEOUT = 5.0
+
+_HAS_AF_UNIX = hasattr(socket, 'AF_UNIX')
+
+
+def get_socket_path(pyenv_root: Path | None = None) -> Path:
+    """Returns the default daemon socket path, under the pyenv root"""
+    if pyenv_root is None:
+        pyenv_root = get_pyenv_root()
+    return pyenv_root / '.pyenv-inspect' / SOCKET_NAME
+
+
+def resolve_specs(
+    specs: Iterable[str], inventory: PyenvInventory | None = None,
+) -> list[dict[str, Any]]:
+    """Resolves specs one by one, reporting errors per spec
+
+    Every result is a dict with the `spec` string, the `executable` path
+    or `None`, and the `error` dict (`type` and `message`) or `None`.
+    """
+    if inventory is None:
+        inventory = default_inventory
+    results = []
+    with inventory.batch():
+        for spec in specs:
+            executable: str | None = None
+            error: dict[str, str] | None = None
+            try:
+                if not spec:
+                    raise SpecParseError
+                exec_path = find_pyenv_python_executable(
+                    spec, inventory=inventory)
+            except PyenvInspectError as exc:
+                error = {'type': type(exc).__name__, 'message': str(exc)}
+            else:
+                if exec_path is not None:
+                    executable = str(exec_path)
+            results.append(
+                {'spec': spec, 'executable': executable, 'error': error})
+    return results
+
+
+if _HAS_AF_UNIX:
+    class _RequestHandler(socketserver.StreamRequestHandler):
+        server: _Server
+
+        def handle(self) -> None:
+            for line in self.rfile:
+                try:
+                    request = json.loads(line)
+                    specs = request['specs']
+                    if not isinstance(specs, list) or not all(
+                        isinstance(spec, str) for spec in specs
+                    ):
+                        raise TypeError('specs must be a list of strings')
+                except (ValueError, KeyError, TypeError) as exc:
+                    response: dict[str, Any] = {
+                        'error': {'type': 'DaemonError', 'message': str(exc)},
+                    }
+                else:
+                    response = self._resolve(specs)
+                self.wfile.write(json.dumps(response).encode() + b'\n')
+                self.wfile.flush()
+
+        def _resolve(self, specs: list[str]) -> dict[str, Any]:
+            try:
+                return {
+                    'results': resolve_specs(specs, self.server.inventory),
+                }
+            except Exception as exc:
+                # keep the connection and the daemon alive
+                log.exception('cannot resolve %r', specs)
+                return {
+                    'error': {
+                        'type': 'DaemonError',
+                        'message': f'internal error: {exc!r}',
+                    },
+                }
+
+    class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+        inventory: PyenvInventory
+
+        def server_bind(self) -> None:
+            super().server_bind()
+            # only the owner may connect; nobody can before listen()
+            os.chmod(self.server_address, 0o600)
+
+        def server_activate(self) -> None:
+            self._connections: set[socket.socket] = set()
+            self._connections_lock = threading.Lock()
+            super().server_activate()
+
+        def process_request(self, request, client_address) -> None:
+            with self._connections_lock:
+                self._connections.add(request)
+            super().process_request(request, client_address)
+
+        def shutdown_request(self, request) -> None:
+            with self._connections_lock:
+                self._connections.discard(request)
+            super().shutdown_request(request)
+
+        def server_close(self) -> None:
+            super().server_close()
+            # clients keep connections open, so they have to be closed too
+            with self._connections_lock:
+                connections = list(self._connections)
+            for connection in connections:
+                try:
+                    connection.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+
+
+class PyenvInspectDaemon:
+    """Resolver daemon listening on a Unix domain socket
+
+    The daemon keeps the version table warm with `PyenvVersionsWatcher`
+    and answers newline-delimited JSON requests `{"specs": [...]}` with
+    `{"results": [...]}` (see `resolve_specs`). A stale socket file left by
+    a dead daemon is replaced. If `socket_path` is not passed,
+    `get_socket_path()` is used.
+    """
+
+    def __init__(
+        self, socket_path: Path | None = None,
+        *, versions_dir: Path | None = None,
+    ) -> None:
+        if not _HAS_AF_UNIX:
+            raise DaemonError('Unix domain sockets are not supported')
+        if socket_path is None:
+            socket_path = get_socket_path()
+        self.socket_path = socket_path
+        socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        _remove_stale_socket(socket_path)
+        self._watcher = PyenvVersionsWatcher(versions_dir)
+        try:
+            self._server = _Server(str(socket_path), _RequestHandler)
+        except BaseException:
+            self._watcher.close()
+            raise
+        self._server.inventory = self._watcher
+        log.debug('listening on %s', socket_path)
+
+    def __enter__(self) -> PyenvInspectDaemon:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def shutdown(self) -> None:
+        """Stops `serve_forever()` running in another thread"""
+        self._server.shutdown()
+
+    def close(self) -> None:
+        self._server.server_close()
+        self._watcher.close()
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+
+
+def _remove_stale_socket(socket_path: Path) -> None:
+    if not os.path.exists(socket_path):
+        return
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path))
+    except (ConnectionRefusedError, FileNotFoundError):
+        log.debug('removing stale socket %s', socket_path)
+        os.unlink(socket_path)
+        return
+    finally:
+        sock.close()
+    raise DaemonError(f'daemon is already running: {socket_path}')
+
+
+class PyenvInspectClient:
+    """Client of `PyenvInspectDaemon` with in-process fallback
+
+    The connection is kept open between calls. If the daemon is not
+    running, does not respond within `timeout` seconds, or Unix domain
+    sockets are not supported, specs are resolved in-process with
+    `inventory` (the default inventory if not passed), so the results are
+    the same either way. Errors reported by the daemon are raised as the
+    corresponding `PyenvInspectError` subclasses.
+    """
+
+    def __init__(
+        self, socket_path: Path | None = None,
+        *, timeout: float = DEFAULT_TIMEOUT,
+        inventory: PyenvInventory | None = None,
+    ) -> None:
+        self._socket_path = socket_path
+        self._timeout = timeout
+        self._inventory = inventory
+        self._sock: socket.socket | None = None
+        self._rfile: Any = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> PyenvInspectClient:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def is_connected(self) -> bool:
+        return self._sock is not None
+
+    def find_pyenv_python_executable(
+        self, spec: PyenvPythonSpec | VersionConstraint | str,
+    ) -> Path | None:
+        return self.find_pyenv_python_executables([spec])[spec]
+
+    def find_pyenv_python_executables(
+        self, specs: Iterable[PyenvPythonSpec | VersionConstraint | str],
+    ) -> dict[PyenvPythonSpec | VersionConstraint | str, Path | None]:
+        specs = list(dict.fromkeys(specs))
+        # str() of a constraint is its string
+        string_specs = [
+            spec.string_spec if isinstance(spec, PyenvPythonSpec)
+            else str(spec)
+            for spec in specs
+        ]
+        results = self._request(string_specs)
+        if results is None:
+            results = resolve_specs(string_specs, self._inventory)
+        exec_paths: dict[
+            PyenvPythonSpec | VersionConstraint | str, Path | None,
+        ] = {}
+        for spec, result in zip(specs, results):
+            error = result['error']
+            if error:
+                raise _get_error_class(error['type'])(error['message'])
+            executable = result['executable']
+            exec_paths[spec] = Path(executable) if executable else None
+        return exec_paths
+
+    def close(self) -> None:
+        with self._lock:
+            self._disconnect()
+
+    def _request(self, specs: list[str]) -> list[dict[str, Any]] | None:
+        if not _HAS_AF_UNIX:
+            return None
+        request = json.dumps({'specs': specs}).encode() + b'\n'
+        with self._lock:
+            try:
+                sock = self._sock or self._connect()
+                sock.sendall(request)
+                line = self._rfile.readline()
+                if not line:
+                    raise ConnectionResetError('connection closed')
+                response = json.loads(line)
+            except (OSError, ValueError, PyenvInspectError) as exc:
+                log.debug('daemon is not available: %s', exc)
+                self._disconnect()
+                return None
+        try:
+            results = response['results']
+        except KeyError:
+            error = response.get('error') or {}
+            raise DaemonError(error.get('message'))
+        if len(results) != len(specs):
+            raise DaemonError('invalid response')
+        return results
+
+    def _connect(self) -> socket.socket:
+        socket_path = self._socket_path
+        if socket_path is None:
+            socket_path = get_socket_path()
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self._timeout)
+        try:
+            sock.connect(str(socket_path))
+        except BaseException:
+            sock.close()
+            raise
+        self._sock = sock
+        self._rfile = sock.makefile('rb')
+        return sock
+
+    def _disconnect(self) -> None:
+        if self._sock is None:
+            return
+        self._rfile.close()
+        self._sock.close()
+        self._sock = None
+        self._rfile = None
+
+
+def _get_error_class(name: str) -> type[PyenvInspectError]:
+    error_class = getattr(exceptions, name, None)
+    if isinstance(error_class, type) and issubclass(
+        error_class, PyenvInspectError,
+    ):
+        return error_class
+    return PyenvInspectError
+
+
+def serve(
+    socket_path: Path | None = None, *, versions_dir: Path | None = None,
+) -> None:
+    """Runs the daemon until interrupted"""
+    with PyenvInspectDaemon(socket_path, versions_dir=versions_dir) as daemon:
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -30,3 +30,15 @@ class VersionParseError(ParseError):
 
 class UnsupportedImplementation(PyenvInspectError):
     message = 'only CPython is currently supported'
+
+
+class ProbeError(PyenvInspectError):
+    message = 'interpreter probe error'
+
+
+class DaemonError(PyenvInspectError):
+    message = 'daemon error'
+
+
+class ConstraintParseError(ParseError):
+    message = 'constraint parse error'
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Optional
+
+from .constraint import Operator, VersionConstraint
+from .version import Version
+
+
+_Entry = tuple[Version, Path]
+# (free_threaded, dev, pre)
+_PartitionKey = tuple[bool, bool, Optional[tuple[str, int]]]
+# (free_threaded, is_pre, dev)
+_SortedPartitionKey = tuple[bool, bool, bool]
+
+
+class _Node:
+    __slots__ = ('children', 'best', 'best_exact')
+
+    def __init__(self) -> None:
+        self.children: dict[int, _Node] = {}
+        # the greatest version in the subtree
+        self.best: _Entry | None = None
+        # the greatest version with the base equal to the path of the node
+        self.best_exact: _Entry | None = None
+
+
+class VersionIndex:
+    """Prefix tree of versions for best-match lookups
+
+    Versions are partitioned by (free_threaded, dev, pre), which must be
+    equal for a match, and every partition is a tree keyed by base
+    components. Every node stores the greatest version of its subtree and
+    the greatest version ending at the node, so a lookup takes as many
+    steps as the requested version has components, regardless of the number
+    of versions. Matching follows `Version.__contains__`: a requested
+    version matches versions it is a prefix of, or only the same base for
+    dev versions. Of equal versions (e.g., 3.12 and 3.12.0), the first one
+    wins, as with a linear scan.
+
+    Constraint lookups use sorted lists of versions, built on first use,
+    and bisect them by the bounds of the constraint.
+    """
+
+    def __init__(self, entries: Iterable[_Entry] = ()) -> None:
+        self._entries: list[_Entry] = []
+        self._partitions: dict[_PartitionKey, _Node] = {}
+        # (versions, entries) in ascending order; of equal versions,
+        # the first added one goes last
+        self._sorted_partitions: dict[
+            _SortedPartitionKey, tuple[list[Version], list[_Entry]],
+        ] | None = None
+        for entry in entries:
+            self.add(entry)
+
+    def add(self, entry: _Entry) -> None:
+        self._entries.append(entry)
+        self._sorted_partitions = None
+        version = entry[0]
+        partition_key = (version.free_threaded, version.dev, version.pre)
+        node = self._partitions.get(partition_key)
+        if node is None:
+            node = self._partitions[partition_key] = _Node()
+        for component in version.base:
+            child = node.children.get(component)
+            if child is None:
+                child = node.children[component] = _Node()
+            node = child
+            if node.best is None or version > node.best[0]:
+                node.best = entry
+        if node.best_exact is None or version > node.best_exact[0]:
+            node.best_exact = entry
+
+    def select_best_match(self, requested_version: Version) -> _Entry | None:
+        """Returns the greatest (version, path) entry matching the version"""
+        node = self._partitions.get((
+            requested_version.free_threaded,
+            requested_version.dev,
+            requested_version.pre,
+        ))
+        for component in requested_version.base:
+            if node is None:
+                return None
+            node = node.children.get(component)
+        if node is None:
+            return None
+        if requested_version.dev:
+            return node.best_exact
+        return node.best
+
+    def select_best_in_range(
+        self, constraint: VersionConstraint,
+    ) -> _Entry | None:
+        """Returns the greatest (version, path) entry within the constraint"""
+        allows_pre = constraint.allows_pre()
+        allows_dev = constraint.allows_dev()
+        best_match: _Entry | None = None
+        for partition_key, (versions, entries) in (
+            self._get_sorted_partitions().items()
+        ):
+            free_threaded, is_pre, dev = partition_key
+            if (
+                free_threaded != constraint.free_threaded
+                or is_pre and not allows_pre
+                or dev and not allows_dev
+            ):
+                continue
+            low, high = _get_bounds(versions, constraint)
+            # only != clauses can reject versions within the bounds
+            for pos in range(high - 1, low - 1, -1):
+                entry = entries[pos]
+                if entry[0] in constraint:
+                    if best_match is None or entry[0] > best_match[0]:
+                        best_match = entry
+                    break
+        return best_match
+
+    def _get_sorted_partitions(
+        self,
+    ) -> dict[_SortedPartitionKey, tuple[list[Version], list[_Entry]]]:
+        sorted_partitions = self._sorted_partitions
+        if sorted_partitions is not None:
+            return sorted_partitions
+        grouped: dict[_SortedPartitionKey, list[tuple[int, _Entry]]] = {}
+        for pos, entry in enumerate(self._entries):
+            version = entry[0]
+            partition_key = (
+                version.free_threaded, version.pre is not None, version.dev)
+            grouped.setdefault(partition_key, []).append((pos, entry))
+        sorted_partitions = {}
+        for partition_key, items in grouped.items():
+            items.sort(key=lambda item: (item[1][0], -item[0]))
+            sorted_partitions[partition_key] = (
+                [entry[0] for _, entry in items],
+                [entry for _, entry in items],
+            )
+        self._sorted_partitions = sorted_partitions
+        return sorted_partitions
+
+
+def _get_bounds(
+    versions: list[Version], constraint: VersionConstraint,
+) -> tuple[int, int]:
+    low = 0
+    high = len(versions)
+    for operator, version in constraint.clauses:
+        if operator is Operator.GE or operator is Operator.EQ:
+            low = max(low, bisect_left(versions, version))
+        elif operator is Operator.GT:
+            low = max(low, bisect_right(versions, version))
+        if operator is Operator.LT:
+            high = min(high, bisect_left(versions, version))
+        elif operator is Operator.LE or operator is Operator.EQ:
+            high = min(high, bisect_right(versions, version))
+    return low, high
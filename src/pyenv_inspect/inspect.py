@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import heapq
 import logging
+from collections.abc import Iterable, Iterator
+from operator import itemgetter
 from pathlib import Path
 
-from .exceptions import ParseError, UnsupportedImplementation
-from .path import (
-    get_pyenv_python_executable_path, get_pyenv_versions_directory,
-)
+from .constraint import VersionConstraint, is_string_constraint
+from .exceptions import PathError
+from .index import VersionIndex
+from .inventory import PyenvInventory, default_inventory
 from .spec import PyenvPythonSpec
 from .version import Version
 
@@ -14,46 +17,200 @@ from .version import Version
 log = logging.getLogger(__name__)
 
 
-def find_pyenv_python_executable(spec: PyenvPythonSpec | str) -> Path | None:
+def find_pyenv_python_executable(
+    spec: PyenvPythonSpec | VersionConstraint | str,
+    *, inventory: PyenvInventory | None = None,
+    skip_broken: bool = False,
+) -> Path | None:
+    """Finds the executable of the greatest version matching the spec"""
+    requested_version = _get_requested_version(spec)
+    log.debug('requested %s', requested_version)
+    if inventory is None:
+        inventory = default_inventory
+    exact_name = _get_exact_version_name(requested_version)
+    if exact_name is not None:
+        version_dir = inventory.get_version_directory(exact_name)
+        if version_dir is not None:
+            log.debug('accepted %s', requested_version)
+            return _get_executable_path(
+                inventory, version_dir, requested_version, skip_broken)
+        log.debug('%s not found, falling back to scan', exact_name)
+    with inventory.batch():
+        best_match_dir = _select_best_match(
+            inventory.get_index(), requested_version)
+        if not best_match_dir:
+            return None
+        return _get_executable_path(
+            inventory, best_match_dir, requested_version, skip_broken)
+
+
+def find_pyenv_python_executables(
+    specs: Iterable[PyenvPythonSpec | VersionConstraint | str],
+    *, inventory: PyenvInventory | None = None,
+    skip_broken: bool = False,
+) -> dict[PyenvPythonSpec | VersionConstraint | str, Path | None]:
+    """Resolves many specs with a single scan of the versions directory"""
+    requested_versions = _get_requested_versions(specs)
+    if inventory is None:
+        inventory = default_inventory
+    with inventory.batch():
+        best_match_dirs = _select_best_matches(
+            inventory.get_index(), requested_versions.values())
+        return _get_executable_paths(
+            inventory, requested_versions, best_match_dirs, skip_broken)
+
+
+def find_all_pyenv_python_executables(
+    spec: PyenvPythonSpec | VersionConstraint | str,
+    limit: int | None = None,
+    *, inventory: PyenvInventory | None = None,
+) -> Iterator[Path]:
+    """Returns an iterator over executables matching the spec, best first"""
+    requested_version = _get_requested_version(spec)
+    log.debug('requested all %s', requested_version)
+    if inventory is None:
+        inventory = default_inventory
+    matches = _select_matches(
+        inventory.get_entries(), requested_version, limit)
+    return _iter_executable_paths(inventory, matches)
+
+
+def _select_matches(
+    entries: Iterable[tuple[Version, Path]],
+    requested_version: Version | VersionConstraint,
+    limit: int | None = None,
+) -> list[tuple[Version, Path]]:
+    matches = [entry for entry in entries if entry[0] in requested_version]
+    # both are stable, so the first of equal versions goes first
+    if limit is None:
+        matches.sort(key=itemgetter(0), reverse=True)
+        return matches
+    return heapq.nlargest(limit, matches, key=itemgetter(0))
+
+
+def _iter_executable_paths(
+    inventory: PyenvInventory, entries: list[tuple[Version, Path]],
+) -> Iterator[Path]:
+    for version, version_dir in entries:
+        try:
+            exec_path = inventory.get_executable_path(version_dir)
+        except PathError as exc:
+            log.debug('skipped %s: %s', version, exc)
+            continue
+        log.debug('accepted %s', version)
+        yield exec_path
+
+
+def _get_requested_versions(
+    specs: Iterable[PyenvPythonSpec | VersionConstraint | str],
+) -> dict[
+    PyenvPythonSpec | VersionConstraint | str, Version | VersionConstraint,
+]:
+    requested_versions: dict[
+        PyenvPythonSpec | VersionConstraint | str,
+        Version | VersionConstraint,
+    ] = {}
+    for spec in specs:
+        if spec not in requested_versions:
+            requested_versions[spec] = _get_requested_version(spec)
+    return requested_versions
+
+
+def _select_best_match(
+    index: VersionIndex, requested_version: Version | VersionConstraint,
+) -> Path | None:
+    if isinstance(requested_version, VersionConstraint):
+        best_match = index.select_best_in_range(requested_version)
+    else:
+        best_match = index.select_best_match(requested_version)
+    if not best_match:
+        return None
+    log.debug('accepted %s', best_match[0])
+    return best_match[1]
+
+
+def _select_best_matches(
+    index: VersionIndex,
+    requested_versions: Iterable[Version | VersionConstraint],
+) -> dict[str, Path | None]:
+    # '3.12' and PyenvPythonSpec('3.12', ...) share a match; constraint
+    # strings cannot be equal to version strings
+    unique_requested_versions = {
+        str(requested_version): requested_version
+        for requested_version in requested_versions
+    }
+    return {
+        key: _select_best_match(index, requested_version)
+        for key, requested_version in unique_requested_versions.items()
+    }
+
+
+def _get_executable_paths(
+    inventory: PyenvInventory,
+    requested_versions: dict[
+        PyenvPythonSpec | VersionConstraint | str,
+        Version | VersionConstraint,
+    ],
+    best_match_dirs: dict[str, Path | None],
+    skip_broken: bool = False,
+) -> dict[PyenvPythonSpec | VersionConstraint | str, Path | None]:
+    unique_requested_versions = {
+        str(requested_version): requested_version
+        for requested_version in requested_versions.values()
+    }
+    with inventory.batch():
+        exec_paths = {
+            key: version_dir and _get_executable_path(
+                inventory, version_dir, unique_requested_versions[key],
+                skip_broken,
+            )
+            for key, version_dir in best_match_dirs.items()
+        }
+    return {
+        spec: exec_paths[str(requested_version)]
+        for spec, requested_version in requested_versions.items()
+    }
+
+
+def _get_executable_path(
+    inventory: PyenvInventory,
+    version_dir: Path,
+    requested_version: Version | VersionConstraint,
+    skip_broken: bool,
+) -> Path | None:
+    try:
+        return inventory.get_executable_path(version_dir)
+    except PathError as exc:
+        if not skip_broken:
+            raise
+        log.debug('%s is broken, trying other matches: %s', version_dir, exc)
+    # the broken one fails fast, its failure is cached
+    return next(_iter_executable_paths(inventory, _select_matches(
+        inventory.get_entries(), requested_version)), None)
+
+
+def _get_requested_version(
+    spec: PyenvPythonSpec | VersionConstraint | str,
+) -> Version | VersionConstraint:
+    if isinstance(spec, VersionConstraint):
+        return spec
     if not isinstance(spec, PyenvPythonSpec):
         if not isinstance(spec, str):
             raise TypeError(f'unexpected spec type: {type(spec)}')
+        if is_string_constraint(spec):
+            return VersionConstraint.from_string_constraint(spec)
         spec = PyenvPythonSpec.from_string_spec(spec)
     spec.is_supported(raise_exception=True)
-    requested_version = Version.from_string_version(spec.version)
-    log.debug('requested %s', requested_version)
-    best_match_version: Version | None = None
-    best_match_dir: Path | None = None
-    versions_dir = get_pyenv_versions_directory()
-    for version_dir in versions_dir.iterdir():
-        if _is_pyenv_virtualenv_symlink(version_dir):
-            continue
-        try:
-            _spec = PyenvPythonSpec.from_string_spec(version_dir.name)
-            _spec.is_supported(raise_exception=True)
-            version = Version.from_string_version(_spec.version)
-        except (ParseError, UnsupportedImplementation) as exc:
-            log.warning('%s: %s', type(exc), exc)
-            continue
-        if version not in requested_version:
-            continue
-        log.debug('proposed %s', version)
-        if not best_match_version or version > best_match_version:
-            best_match_version = version
-            best_match_dir = version_dir
-    if not best_match_version:
+    return Version.from_string_version(spec.version)
+
+
+def _get_exact_version_name(
+    requested_version: Version | VersionConstraint,
+) -> str | None:
+    # fully qualified (3.12.4) and dev (3.14-dev) versions match only
+    # themselves, partial versions and constraints require a scan
+    if isinstance(requested_version, VersionConstraint):
         return None
-    log.debug('accepted %s', best_match_version)
-    return get_pyenv_python_executable_path(best_match_dir)
-
-
-def _is_pyenv_virtualenv_symlink(path: Path) -> bool:
-    # {versions_dir}/{name} -> {versions_dir}/{version}/envs/{name}
-    if not path.is_symlink():
-        return False
-    real_path = path.resolve()
-    return (
-        real_path.is_relative_to(path.parent)
-        and real_path.parent.name == 'envs'
-        and real_path.name == path.name
-    )
+    if requested_version.dev or len(requested_version.base) == 3:
+        return str(requested_version)
+    return None
@@ -0,0 +1,413 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from stat import S_ISDIR, S_ISLNK
+from typing import NamedTuple
+
+from .cache import (
+    get_cache_directory, is_cache_enabled, read_cache_file, remove_cache_file,
+    write_cache_file,
+)
+from .exceptions import ParseError, PathError, UnsupportedImplementation
+from .index import VersionIndex
+from .path import get_pyenv_versions_directories
+from .spec import PyenvPythonSpec
+from .validation import ExecutableValidator
+from .version import Version
+
+
+log = logging.getLogger(__name__)
+
+
+# (versions_dir, st_dev, st_ino, st_mtime_ns)
+_StatKey = tuple[Path, int, int, int]
+
+# mtime resolution is filesystem-dependent (up to 2 seconds on FAT), so a scan
+# made within this window after the last modification is not trusted
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+class _InventoryState(NamedTuple):
+    key: _StatKey
+    scanned_at_ns: int
+    entries: list[tuple[Version, Path]]
+
+    def is_racy(self) -> bool:
+        return self.scanned_at_ns - self.key[3] < _RACY_WINDOW_NS
+
+
+class PyenvInventory:
+    """Parsed contents of pyenv versions directories, rescanned on change"""
+
+    def __init__(
+        self, versions_dir: Path | Sequence[Path] | None = None,
+        *, persistent: bool | None = None,
+    ) -> None:
+        # None: the directories follow PYENV_ROOT
+        self._versions_dirs: list[Path] | None = None
+        if isinstance(versions_dir, Path):
+            self._versions_dirs = [versions_dir]
+        elif versions_dir is not None:
+            self._versions_dirs = list(versions_dir)
+        self._persistent = persistent
+        self._states: dict[Path, _InventoryState] = {}
+        # (per-directory entries, merged entries)
+        self._merged: tuple[
+            list[list[tuple[Version, Path]]], list[tuple[Version, Path]],
+        ] | None = None
+        # (entries, index of the entries)
+        self._version_index: tuple[
+            list[tuple[Version, Path]], VersionIndex,
+        ] | None = None
+        # executables of a persistent inventory, loaded from the cache file
+        # and checked with a single stat() call before use
+        self._executables: dict[Path, Path] = {}
+        self._validator = ExecutableValidator()
+        # the state is replaced as a whole without relying on the GIL;
+        # threads that need a rescan wait for a single one
+        self._scan_lock = threading.Lock()
+        # cache file writes are deferred while a batch is open
+        self._batch_depth = 0
+        self._unsaved: set[Path] = set()
+        self._batch_lock = threading.Lock()
+
+    @classmethod
+    def from_pyenv_roots(
+        cls, pyenv_roots: Iterable[Path], *, persistent: bool | None = None,
+    ) -> PyenvInventory:
+        """Creates an inventory of several roots in the order of priority"""
+        return cls(
+            [pyenv_root / 'versions' for pyenv_root in pyenv_roots],
+            persistent=persistent,
+        )
+
+    def get_versions_directory(self) -> Path:
+        """Returns the versions directory with the highest priority"""
+        return self.get_versions_directories()[0]
+
+    def get_versions_directories(self) -> list[Path]:
+        if self._versions_dirs is not None:
+            return self._versions_dirs
+        return get_pyenv_versions_directories()
+
+    def is_persistent(self) -> bool:
+        if self._persistent is None:
+            return is_cache_enabled()
+        return self._persistent
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Writes the cache file once for all lookups made in the block"""
+        with self._batch_lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._batch_lock:
+                self._batch_depth -= 1
+                unsaved = set() if self._batch_depth else self._unsaved
+                if not self._batch_depth:
+                    self._unsaved = set()
+            for versions_dir in unsaved:
+                self._save(versions_dir)
+
+    def get_entries(self) -> list[tuple[Version, Path]]:
+        versions_dirs = self.get_versions_directories()
+        if len(versions_dirs) == 1:
+            return self._get_directory_entries(versions_dirs[0])
+        entries_by_dir: list[list[tuple[Version, Path]]] = []
+        for versions_dir in versions_dirs:
+            try:
+                entries_by_dir.append(
+                    self._get_directory_entries(versions_dir))
+            except PathError as exc:
+                log.debug('skipped %s', exc)
+        return self._merge(entries_by_dir)
+
+    def get_index(self) -> VersionIndex:
+        """Returns the index of entries, built again only when they change"""
+        entries = self.get_entries()
+        cached = self._version_index
+        if cached and cached[0] is entries:
+            return cached[1]
+        index = VersionIndex(entries)
+        self._version_index = (entries, index)
+        return index
+
+    def get_version_directory(self, name: str) -> Path | None:
+        """Looks up a single entry by name without scanning the directories"""
+        for versions_dir in self.get_versions_directories():
+            version_dir = versions_dir / name
+            try:
+                stat = version_dir.lstat()
+            except FileNotFoundError:
+                continue
+            if S_ISLNK(stat.st_mode) and _is_pyenv_virtualenv_link_target(
+                str(version_dir), name,
+            ):
+                continue
+            return version_dir
+        return None
+
+    def get_executable_path(self, version_dir: Path) -> Path:
+        if not self.is_persistent():
+            return self._validator.get_executable_path(version_dir)
+        exec_path = self._executables.get(version_dir)
+        # the cache file may outlive the executable
+        if exec_path is not None and os.path.isfile(exec_path):
+            return exec_path
+        self._executables.pop(version_dir, None)
+        exec_path = self._validator.get_executable_path(version_dir)
+        self._executables[version_dir] = exec_path
+        if version_dir.parent in self._states:
+            self._request_save(version_dir.parent)
+        return exec_path
+
+    def invalidate(self) -> None:
+        with self._scan_lock:
+            versions_dirs = list(self._states)
+            self._states = {}
+            self._merged = None
+            self._version_index = None
+            self._executables = {}
+            self._validator.invalidate()
+            if self.is_persistent():
+                # otherwise the next lookup loads the same state again
+                try:
+                    versions_dirs.extend(self.get_versions_directories())
+                except PathError:
+                    pass
+                for versions_dir in dict.fromkeys(versions_dirs):
+                    remove_cache_file(self._get_cache_path(versions_dir))
+
+    def _get_directory_entries(
+        self, versions_dir: Path,
+    ) -> list[tuple[Version, Path]]:
+        requested_at_ns = time.time_ns()
+        try:
+            stat = versions_dir.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            raise PathError(
+                f'pyenv versions path does not exist: {versions_dir}',
+            ) from None
+        if not S_ISDIR(stat.st_mode):
+            raise PathError(
+                f'pyenv versions path is not a directory: {versions_dir}')
+        key = (versions_dir, stat.st_dev, stat.st_ino, stat.st_mtime_ns)
+        state = self._states.get(versions_dir)
+        if state and state.key == key and not state.is_racy():
+            return state.entries
+        with self._scan_lock:
+            state = self._states.get(versions_dir)
+            # a scan made by another thread while this one was waiting
+            # is as fresh as its own one would be
+            if state and state.key == key and (
+                not state.is_racy() or state.scanned_at_ns >= requested_at_ns
+            ):
+                return state.entries
+            persistent = self.is_persistent()
+            if persistent:
+                state = self._load(key)
+                if state:
+                    return state.entries
+            log.debug('scanning %s', versions_dir)
+            state = _InventoryState(
+                key=key,
+                scanned_at_ns=time.time_ns(),
+                entries=list(_scan_versions_directory(versions_dir)),
+            )
+            self._executables = {
+                version_dir: exec_path
+                for version_dir, exec_path in self._executables.items()
+                if version_dir.parent != versions_dir
+            }
+            self._states = {**self._states, versions_dir: state}
+        if persistent:
+            self._request_save(versions_dir)
+        return state.entries
+
+    def _merge(
+        self, entries_by_dir: list[list[tuple[Version, Path]]],
+    ) -> list[tuple[Version, Path]]:
+        # entry lists are replaced on rescan, so the merged list is valid
+        # as long as all of them are the same objects
+        merged = self._merged
+        if merged and len(merged[0]) == len(entries_by_dir) and all(
+            cached is current
+            for cached, current in zip(merged[0], entries_by_dir)
+        ):
+            return merged[1]
+        # earlier directories shadow the same names in later ones
+        names: set[str] = set()
+        entries: list[tuple[Version, Path]] = []
+        for dir_entries in entries_by_dir:
+            for version, version_dir in dir_entries:
+                if version_dir.name in names:
+                    continue
+                names.add(version_dir.name)
+                entries.append((version, version_dir))
+        self._merged = (entries_by_dir, entries)
+        return entries
+
+    def _get_cache_path(self, versions_dir: Path) -> Path:
+        return get_cache_directory(versions_dir.parent) / 'inventory.json'
+
+    def _load(self, key: _StatKey) -> _InventoryState | None:
+        versions_dir = key[0]
+        data = read_cache_file(self._get_cache_path(versions_dir))
+        if not data:
+            return None
+        try:
+            if (
+                data['versions_dir'] != str(versions_dir)
+                or tuple(data['key']) != key[1:]
+            ):
+                return None
+            state = _InventoryState(
+                key=key,
+                scanned_at_ns=data['scanned_at_ns'],
+                entries=[
+                    (_version_from_cache(fields), versions_dir / name)
+                    for name, *fields in data['entries']
+                ],
+            )
+            if state.is_racy():
+                return None
+            executables = {
+                versions_dir / name: Path(exec_path)
+                for name, exec_path in data['executables'].items()
+            }
+        except (KeyError, TypeError, ValueError) as exc:
+            log.debug('invalid inventory cache: %s', exc)
+            return None
+        log.debug('loaded %s from cache', versions_dir)
+        self._executables = {
+            **{
+                version_dir: exec_path
+                for version_dir, exec_path in self._executables.items()
+                if version_dir.parent != versions_dir
+            },
+            **executables,
+        }
+        self._states = {**self._states, versions_dir: state}
+        return state
+
+    def _request_save(self, versions_dir: Path) -> None:
+        with self._batch_lock:
+            if self._batch_depth:
+                self._unsaved.add(versions_dir)
+                return
+        self._save(versions_dir)
+
+    def _save(self, versions_dir: Path) -> None:
+        state = self._states.get(versions_dir)
+        if not state:
+            return
+        write_cache_file(self._get_cache_path(versions_dir), {
+            'versions_dir': str(versions_dir),
+            'key': state.key[1:],
+            'scanned_at_ns': state.scanned_at_ns,
+            'entries': [
+                (version_dir.name, *_version_to_cache(version))
+                for version, version_dir in state.entries
+            ],
+            'executables': {
+                version_dir.name: str(exec_path)
+                for version_dir, exec_path in self._executables.copy().items()
+                if version_dir.parent == versions_dir
+            },
+        })
+
+
+def _version_to_cache(version: Version) -> tuple:
+    return version.base, version.pre, version.dev, version.free_threaded
+
+
+def _version_from_cache(fields: list) -> Version:
+    base, pre, dev, free_threaded = fields
+    return Version(
+        base=tuple(base),
+        pre=tuple(pre) if pre else None,
+        dev=dev,
+        free_threaded=free_threaded,
+    )
+
+
+def iter_pyenv_versions(
+    versions_dir: Path | None = None,
+) -> Iterator[tuple[PyenvPythonSpec, Version, Path]]:
+    """Lazily yields installed CPython versions"""
+    if versions_dir is None:
+        # earlier roots shadow the same names in later ones, as in the index
+        names: set[str] = set()
+        for versions_dir in get_pyenv_versions_directories():
+            for spec, version, version_dir in iter_pyenv_versions(
+                versions_dir,
+            ):
+                if version_dir.name not in names:
+                    names.add(version_dir.name)
+                    yield spec, version, version_dir
+        return
+    # DirEntry methods use d_type from readdir(), so regular entries cost
+    # no extra syscalls, and only symlinks are read with readlink()
+    with os.scandir(versions_dir) as entries:
+        for entry in entries:
+            if _is_pyenv_virtualenv_symlink(entry):
+                continue
+            parsed = _parse_entry_name(entry.name)
+            if parsed is None:
+                continue
+            spec, version = parsed
+            yield spec, version, versions_dir / entry.name
+
+
+def _parse_entry_name(name: str) -> tuple[PyenvPythonSpec, Version] | None:
+    try:
+        spec = PyenvPythonSpec.from_string_spec(name)
+        spec.is_supported(raise_exception=True)
+        version = Version.from_string_version(spec.version)
+    except (ParseError, UnsupportedImplementation) as exc:
+        log.warning('%s: %s', type(exc), exc)
+        return None
+    return spec, version
+
+
+def _scan_versions_directory(
+    versions_dir: Path,
+) -> Iterator[tuple[Version, Path]]:
+    for _, version, version_dir in iter_pyenv_versions(versions_dir):
+        yield version, version_dir
+
+
+def _is_pyenv_virtualenv_symlink(entry: os.DirEntry) -> bool:
+    if not entry.is_symlink():
+        return False
+    return _is_pyenv_virtualenv_link_target(entry.path, entry.name)
+
+
+def _is_pyenv_virtualenv_link_target(path: str, name: str) -> bool:
+    # {versions_dir}/{name} -> {versions_dir}/{version}/envs/{name}
+    try:
+        target = os.readlink(path)
+    except OSError:
+        return False
+    versions_dir = os.path.dirname(path)
+    target = os.path.normpath(os.path.join(versions_dir, target))
+    envs_dir, target_name = os.path.split(target)
+    if target_name != name or os.path.basename(envs_dir) != 'envs':
+        return False
+    if envs_dir.startswith(os.path.join(versions_dir, '')):
+        return True
+    # the link may point through another symlink, e.g., a symlinked home
+    real_envs_dir = os.path.realpath(envs_dir)
+    return real_envs_dir.startswith(
+        os.path.join(os.path.realpath(versions_dir), ''))
+
+
+default_inventory = PyenvInventory()
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import ast
+import logging
+import os
+from pathlib import Path
+from typing import NamedTuple
+
+from .version import Version, parse_version_fields
+
+
+log = logging.getLogger(__name__)
+
+
+_SYSCONFIGDATA_PREFIX = '_sysconfigdata'
+_SYSCONFIGDATA_VARS = frozenset([
+    'ABIFLAGS', 'MACHDEP', 'MULTIARCH', 'Py_DEBUG', 'Py_GIL_DISABLED',
+    'SOABI',
+])
+
+
+class StaticInterpreterInfo(NamedTuple):
+    """Interpreter metadata read from the installation files"""
+    version_dir: Path
+    # the version parsed from the directory name refined with
+    # the exact version from patchlevel.h and the build configuration
+    version: Version
+    patchlevel: str | None
+    abiflags: str | None
+    free_threaded: bool
+    debug: bool
+    platform: str | None
+    multiarch: str | None
+    soabi: str | None
+
+
+def read_static_metadata(
+    version_dir: Path, version: Version | None = None,
+) -> StaticInterpreterInfo:
+    """Reads interpreter metadata without running the interpreter
+
+    Sources are `include/python*/patchlevel.h` (the exact version),
+    `lib/python*/_sysconfigdata_*.py` (ABI flags, free-threading, debug
+    build, platform) and `bin/python*t` names. Fields that cannot be found
+    are `None`. If `version` is not passed, it is parsed from the directory
+    name.
+    """
+    if version is None:
+        version = Version.from_string_version(version_dir.name)
+    patchlevel = _read_patchlevel(version_dir)
+    sysconfigdata_path = _find_sysconfigdata(version_dir, version)
+    build_vars: dict[str, object] = {}
+    abiflags: str | None = None
+    platform: str | None = None
+    multiarch: str | None = None
+    if sysconfigdata_path:
+        build_vars = _read_build_vars(sysconfigdata_path)
+        # _sysconfigdata_{abiflags}_{platform}_{multiarch}.py
+        name_parts = sysconfigdata_path.stem[
+            len(_SYSCONFIGDATA_PREFIX) + 1:].split('_', 2)
+        if len(name_parts) == 3:
+            abiflags, platform, multiarch = name_parts
+    abiflags = _get_str(build_vars, 'ABIFLAGS', abiflags)
+    if 'Py_GIL_DISABLED' in build_vars:
+        free_threaded = bool(build_vars['Py_GIL_DISABLED'])
+    elif abiflags is not None:
+        free_threaded = 't' in abiflags
+    else:
+        free_threaded = version.free_threaded or _has_free_threaded_binary(
+            version_dir)
+    if 'Py_DEBUG' in build_vars:
+        debug = bool(build_vars['Py_DEBUG'])
+    else:
+        debug = abiflags is not None and 'd' in abiflags
+    exact_version = version
+    if patchlevel:
+        # dev builds are marked with '+', e.g., 3.14.0a7+
+        fields = parse_version_fields(patchlevel.rstrip('+'))
+        if fields:
+            base, pre, _, _ = fields
+            exact_version = Version(
+                base=base, pre=pre, dev=version.dev,
+                free_threaded=free_threaded,
+            )
+    elif version.free_threaded != free_threaded:
+        exact_version = Version(
+            base=version.base, pre=version.pre, dev=version.dev,
+            free_threaded=free_threaded,
+        )
+    return StaticInterpreterInfo(
+        version_dir=version_dir,
+        version=exact_version,
+        patchlevel=patchlevel,
+        abiflags=abiflags,
+        free_threaded=free_threaded,
+        debug=debug,
+        platform=_get_str(build_vars, 'MACHDEP', platform),
+        multiarch=_get_str(build_vars, 'MULTIARCH', multiarch),
+        soabi=_get_str(build_vars, 'SOABI', None),
+    )
+
+
+def _read_patchlevel(version_dir: Path) -> str | None:
+    include_dir = version_dir / 'include'
+    # pyenv-win keeps headers directly in the include directory
+    candidates = [include_dir / 'patchlevel.h']
+    candidates.extend(
+        path / 'patchlevel.h' for path in _iter_subdirs(include_dir, 'python'))
+    for path in candidates:
+        try:
+            with open(path, encoding='utf-8', errors='replace') as fobj:
+                for line in fobj:
+                    parts = line.split(None, 2)
+                    if len(parts) == 3 and parts[:2] == [
+                        '#define', 'PY_VERSION',
+                    ]:
+                        return parts[2].strip().strip('"')
+        except OSError:
+            continue
+    return None
+
+
+def _find_sysconfigdata(version_dir: Path, version: Version) -> Path | None:
+    found: list[Path] = []
+    for lib_dir in _iter_subdirs(version_dir / 'lib', 'python'):
+        try:
+            with os.scandir(lib_dir) as entries:
+                found.extend(
+                    lib_dir / entry.name for entry in entries
+                    if entry.name.startswith(_SYSCONFIGDATA_PREFIX)
+                    and entry.name.endswith('.py')
+                )
+        except OSError:
+            continue
+    if not found:
+        return None
+    found.sort()
+    # prefer the build matching the threading model of the directory name
+    for path in found:
+        if ('_t' in path.stem[len(_SYSCONFIGDATA_PREFIX):]) == (
+            version.free_threaded
+        ):
+            return path
+    return found[0]
+
+
+def _read_build_vars(path: Path) -> dict[str, object]:
+    # the file is a pretty-printed dict literal with one key per line;
+    # picking the few needed keys is much faster than evaluating it
+    build_vars: dict[str, object] = {}
+    try:
+        with open(path, encoding='utf-8', errors='replace') as fobj:
+            for line in fobj:
+                line = line.strip()
+                if line.startswith('build_time_vars'):
+                    line = line.partition('{')[2].strip()
+                if not line.startswith("'"):
+                    continue
+                key, sep, value = line.partition(': ')
+                key = key.strip("'")
+                if not sep or key not in _SYSCONFIGDATA_VARS:
+                    continue
+                try:
+                    build_vars[key] = ast.literal_eval(value.rstrip(',}'))
+                except (ValueError, SyntaxError):
+                    log.debug('cannot parse %s in %s', key, path)
+                    continue
+                if len(build_vars) == len(_SYSCONFIGDATA_VARS):
+                    break
+    except OSError as exc:
+        log.debug('cannot read %s: %s', path, exc)
+    return build_vars
+
+
+def _has_free_threaded_binary(version_dir: Path) -> bool:
+    # bin/python3.13t
+    try:
+        with os.scandir(version_dir / 'bin') as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith('python') and name.endswith('t'):
+                    fields = parse_version_fields(name[len('python'):])
+                    if fields and fields[3]:
+                        return True
+    except OSError:
+        pass
+    return False
+
+
+def _iter_subdirs(path: Path, prefix: str) -> list[Path]:
+    try:
+        with os.scandir(path) as entries:
+            return sorted(
+                path / entry.name for entry in entries
+                if entry.name.startswith(prefix) and entry.is_dir()
+            )
+    except OSError:
+        return []
+
+
+def _get_str(
+    build_vars: dict[str, object], key: str, default: str | None,
+) -> str | None:
+    value = build_vars.get(key)
+    if isinstance(value, str):
+        return value
+    return default
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
+from stat import S_ISREG
+from typing import Callable
 
 from .exceptions import PathError
 
@@ -17,15 +19,31 @@ else:
     _PYTHON_EXECUTABLE = 'bin/python'
 
 
-def get_pyenv_root() -> Path:
+def get_pyenv_roots() -> list[Path]:
+    """Returns pyenv roots in the order of priority"""
     for env_var in _PYENV_ROOT_ENV_VARS:
         try:
-            pyenv_root = Path(os.environ[env_var]).resolve()
+            env_value = os.environ[env_var]
             break
         except KeyError:
             pass
     else:
-        pyenv_root = Path.home() / _PYENV_ROOT_DEFAULT
+        return [_check_pyenv_root(Path.home() / _PYENV_ROOT_DEFAULT)]
+    # e.g., a per-user root followed by a shared one
+    paths = [
+        Path(path).resolve() for path in env_value.split(os.pathsep) if path
+    ] or [Path(env_value).resolve()]
+    if len(paths) == 1:
+        return [_check_pyenv_root(paths[0])]
+    return _collect_valid(_check_pyenv_root, paths)
+
+
+def get_pyenv_root() -> Path:
+    """Returns the pyenv root with the highest priority"""
+    return get_pyenv_roots()[0]
+
+
+def _check_pyenv_root(pyenv_root: Path) -> Path:
     if not pyenv_root.exists():
         raise PathError(f'pyenv root does not exist: {pyenv_root}')
     if not pyenv_root.is_dir():
@@ -34,7 +52,18 @@ def get_pyenv_root() -> Path:
 
 
 def get_pyenv_versions_directory() -> Path:
-    pyenv_root = get_pyenv_root()
+    return _get_versions_directory(get_pyenv_root())
+
+
+def get_pyenv_versions_directories() -> list[Path]:
+    """Returns versions directories of all pyenv roots"""
+    pyenv_roots = get_pyenv_roots()
+    if len(pyenv_roots) == 1:
+        return [_get_versions_directory(pyenv_roots[0])]
+    return _collect_valid(_get_versions_directory, pyenv_roots)
+
+
+def _get_versions_directory(pyenv_root: Path) -> Path:
     versions_dir = (pyenv_root / 'versions').resolve()
     if not versions_dir.exists():
         raise PathError(f'pyenv versions path does not exist: {versions_dir}')
@@ -44,12 +73,39 @@ def get_pyenv_versions_directory() -> Path:
     return versions_dir
 
 
+def _collect_valid(
+    check: Callable[[Path], Path], paths: list[Path],
+) -> list[Path]:
+    valid_paths: list[Path] = []
+    first_error: PathError | None = None
+    for path in paths:
+        try:
+            valid_paths.append(check(path))
+        except PathError as exc:
+            if first_error is None:
+                first_error = exc
+    if not valid_paths:
+        assert first_error is not None
+        raise first_error
+    return valid_paths
+
+
 def get_pyenv_python_executable_path(version_dir: Path) -> Path:
-    exec_path = (version_dir / _PYTHON_EXECUTABLE).resolve()
-    if not exec_path.exists():
-        raise PathError(f'pyenv python binary does not exist: {exec_path}')
-    if not exec_path.is_file():
+    """Returns the resolved path of a validated executable"""
+    exec_path = version_dir / _PYTHON_EXECUTABLE
+    try:
+        stat = os.stat(exec_path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise PathError(
+            f'pyenv python binary does not exist: {exec_path}') from None
+    except OSError as exc:
+        # e.g., a symlink loop
+        raise PathError(
+            f'pyenv python binary is not accessible: {exec_path}: {exc}',
+        ) from None
+    if not S_ISREG(stat.st_mode):
         raise PathError(f'pyenv python binary is not a file: {exec_path}')
+    # the mode bits do not reflect noexec mounts and ACLs
     if not _PYENV_WIN and not os.access(exec_path, os.X_OK):
         raise PathError(f'pyenv python binary is not executable: {exec_path}')
-    return exec_path
+    return exec_path.resolve()
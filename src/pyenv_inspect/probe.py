@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import subprocess
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+from .cache import (
+    get_cache_directory, is_cache_enabled, read_cache_file, write_cache_file,
+)
+from .exceptions import ParseError, PathError, ProbeError
+from .path import get_pyenv_root
+from .version import Version
+
+
+log = logging.getLogger(__name__)
+
+
+# compatible with Python 2.7 and all Python 3 versions
+PROBE_SCRIPT = '''\
+import json, platform, struct, sys, sysconfig
+print(json.dumps({
+    'version_info': list(sys.version_info),
+    'implementation': platform.python_implementation().lower(),
+    'abiflags': getattr(sys, 'abiflags', ''),
+    'gil_disabled': bool(sysconfig.get_config_var('Py_GIL_DISABLED')),
+    'platform': sysconfig.get_platform(),
+    'machine': platform.machine(),
+    'pointer_bits': struct.calcsize('P') * 8,
+}))
+'''
+PROBE_TIMEOUT = 30
+
+_RELEASE_LEVELS = {'alpha': 'a', 'beta': 'b', 'candidate': 'rc'}
+
+# (st_dev, st_ino, st_size, st_mtime_ns)
+_FileKey = tuple[int, int, int, int]
+
+
+class InterpreterInfo(NamedTuple):
+    """Metadata reported by a running interpreter"""
+    executable: Path
+    version: Version
+    implementation: str
+    abiflags: str
+    free_threaded: bool
+    platform: str
+    machine: str
+    pointer_bits: int
+
+    @classmethod
+    def from_dict(cls, info_dict: dict) -> "InterpreterInfo":
+        return cls(
+            executable=Path(info_dict['executable']),
+            version=Version.from_string_version(info_dict['version']),
+            implementation=info_dict['implementation'],
+            abiflags=info_dict['abiflags'],
+            free_threaded=info_dict['free_threaded'],
+            platform=info_dict['platform'],
+            machine=info_dict['machine'],
+            pointer_bits=info_dict['pointer_bits'],
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            'executable': str(self.executable),
+            'version': str(self.version),
+            'implementation': self.implementation,
+            'abiflags': self.abiflags,
+            'free_threaded': self.free_threaded,
+            'platform': self.platform,
+            'machine': self.machine,
+            'pointer_bits': self.pointer_bits,
+        }
+
+
+_memory_cache: dict[Path, tuple[_FileKey, InterpreterInfo]] = {}
+_disk_cache_lock = threading.Lock()
+
+
+def probe_python_executable(
+    exec_path: Path, *, cache: bool | None = None,
+) -> InterpreterInfo:
+    """Runs the interpreter once and returns its metadata
+
+    Results are cached in memory and, if `cache` is true (by default, if the
+    `PYENV_INSPECT_CACHE` environment variable is set), on disk. Cached
+    results are keyed by the executable device, inode, size and mtime.
+    """
+    result = probe_python_executables([exec_path], cache=cache)[exec_path]
+    if isinstance(result, ProbeError):
+        raise result
+    return result
+
+
+def probe_python_executables(
+    exec_paths: Iterable[Path], *,
+    max_workers: int | None = None, cache: bool | None = None,
+) -> dict[Path, InterpreterInfo | ProbeError]:
+    """Probes many interpreters in a pool of worker threads
+
+    Interpreters that cannot be probed are mapped to `ProbeError` instances
+    instead of raising, so one broken interpreter does not hide the others.
+    """
+    if cache is None:
+        cache = is_cache_enabled()
+    results: dict[Path, InterpreterInfo | ProbeError] = {}
+    to_probe: dict[Path, _FileKey] = {}
+    for exec_path in exec_paths:
+        if exec_path in results or exec_path in to_probe:
+            continue
+        try:
+            key = _get_file_key(exec_path)
+        except ProbeError as exc:
+            results[exec_path] = exc
+            continue
+        cached = _memory_cache.get(exec_path)
+        if cached and cached[0] == key:
+            results[exec_path] = cached[1]
+        else:
+            to_probe[exec_path] = key
+    if not to_probe:
+        return results
+    disk_cache_path = _get_disk_cache_path() if cache else None
+    disk_cache: dict[str, dict] = {}
+    if disk_cache_path:
+        disk_cache = _read_disk_cache(disk_cache_path)
+        for exec_path, key in list(to_probe.items()):
+            info = _info_from_disk_cache(disk_cache, exec_path, key)
+            if info:
+                _memory_cache[exec_path] = (key, info)
+                results[exec_path] = info
+                del to_probe[exec_path]
+    if not to_probe:
+        return results
+    if len(to_probe) == 1:
+        probed = [_probe_safe(exec_path) for exec_path in to_probe]
+    else:
+        if max_workers is None:
+            max_workers = min(len(to_probe), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers) as executor:
+            probed = list(executor.map(_probe_safe, to_probe))
+    for (exec_path, key), result in zip(to_probe.items(), probed):
+        results[exec_path] = result
+        if isinstance(result, ProbeError):
+            continue
+        _memory_cache[exec_path] = (key, result)
+        disk_cache[str(exec_path)] = {'key': key, 'info': result.to_dict()}
+    if disk_cache_path:
+        _write_disk_cache(disk_cache_path, disk_cache)
+    return results
+
+
+def _probe_safe(exec_path: Path) -> InterpreterInfo | ProbeError:
+    try:
+        return _probe(exec_path)
+    except ProbeError as exc:
+        return exc
+
+
+def _probe(exec_path: Path) -> InterpreterInfo:
+    log.debug('probing %s', exec_path)
+    try:
+        process = subprocess.run(
+            # -E and -s are supported by Python 2.7, unlike -I
+            [str(exec_path), '-E', '-s', '-c', PROBE_SCRIPT],
+            stdin=subprocess.DEVNULL, capture_output=True,
+            timeout=PROBE_TIMEOUT, check=True,
+        )
+    except (OSError, subprocess.SubprocessError) as exc:
+        raise ProbeError(f'cannot run {exec_path}: {exc}')
+    try:
+        data = json.loads(process.stdout)
+        major, minor, micro, release_level, serial = data['version_info']
+        string_version = f'{major}.{minor}.{micro}'
+        if release_level != 'final':
+            string_version += f'{_RELEASE_LEVELS[release_level]}{serial}'
+        if data['gil_disabled']:
+            string_version += 't'
+        return InterpreterInfo(
+            executable=exec_path,
+            version=Version.from_string_version(string_version),
+            implementation=data['implementation'],
+            abiflags=data['abiflags'],
+            free_threaded=data['gil_disabled'],
+            platform=data['platform'],
+            machine=data['machine'],
+            pointer_bits=data['pointer_bits'],
+        )
+    except (ValueError, KeyError, TypeError, ParseError) as exc:
+        raise ProbeError(f'unexpected output of {exec_path}: {exc!r}')
+
+
+def _get_file_key(exec_path: Path) -> _FileKey:
+    try:
+        stat = os.stat(exec_path)
+    except OSError as exc:
+        raise ProbeError(f'cannot stat {exec_path}: {exc}')
+    return stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def _get_disk_cache_path() -> Path | None:
+    try:
+        pyenv_root = get_pyenv_root()
+    except PathError:
+        return None
+    return get_cache_directory(pyenv_root) / 'probe.json'
+
+
+def _read_disk_cache(path: Path) -> dict[str, dict]:
+    data = read_cache_file(path)
+    if not data or not isinstance(data.get('interpreters'), dict):
+        return {}
+    return data['interpreters']
+
+
+def _write_disk_cache(path: Path, interpreters: dict[str, dict]) -> None:
+    with _disk_cache_lock:
+        # merge entries written by other processes since the cache was read
+        merged = _read_disk_cache(path)
+        merged.update(interpreters)
+        write_cache_file(path, {'interpreters': merged})
+
+
+def _info_from_disk_cache(
+    disk_cache: dict[str, dict], exec_path: Path, key: _FileKey,
+) -> InterpreterInfo | None:
+    try:
+        entry = disk_cache[str(exec_path)]
+        if tuple(entry['key']) != key:
+            return None
+        return InterpreterInfo.from_dict(entry['info'])
+    except (KeyError, TypeError, ValueError, ParseError):
+        return None
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+from .exceptions import ParseError, UnsupportedImplementation
+from .inspect import find_pyenv_python_executable
+from .inventory import PyenvInventory, default_inventory
+from .path import _PYENV_ROOT_ENV_VARS, get_pyenv_root
+
+
+log = logging.getLogger(__name__)
+
+
+VERSION_ENV_VAR = 'PYENV_VERSION'
+VERSION_FILE_NAME = '.python-version'
+SYSTEM_VERSION = 'system'
+
+DEFAULT_TTL = 2.0
+
+_CACHE_MAX_SIZE = 4096
+# pyenv reads only the beginning of each line
+_MAX_LINE_LENGTH = 1024
+
+
+class PyenvVersionSelection(NamedTuple):
+    """Version names selected by pyenv and where they come from
+
+    `origin` is either `PYENV_VERSION environment variable` or the path
+    of the version file, as reported by `pyenv version-origin`.
+    """
+    names: tuple[str, ...]
+    origin: str
+
+
+class PyenvVersionSelector:
+    """Resolves the selected pyenv versions without running pyenv
+
+    The precedence is the same as in pyenv: the `PYENV_VERSION` environment
+    variable, the nearest `.python-version` file found walking up from the
+    directory, the global `$PYENV_ROOT/version` file. Nothing selected
+    means `system`.
+
+    Directory lookups and version files are cached for `ttl` seconds, so
+    a change made with `pyenv local` or `pyenv global` may be picked up with
+    that delay. If `pyenv_root` is not passed, `get_pyenv_root()` is used.
+    """
+
+    def __init__(
+        self, pyenv_root: Path | None = None, *, ttl: float = DEFAULT_TTL,
+    ) -> None:
+        self._pyenv_root = pyenv_root
+        self._ttl = ttl
+        # directory -> (expires_at, nearest version file or None)
+        self._directories: dict[str, tuple[float, str | None]] = {}
+        # version file -> (expires_at, names)
+        self._files: dict[str, tuple[float, tuple[str, ...]]] = {}
+        # pyenv root environment variables -> (expires_at, global file)
+        self._global_files: dict[tuple, tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def get_selection(
+        self, directory: Path | str | None = None,
+    ) -> PyenvVersionSelection:
+        """Returns versions selected for `directory` (the current one
+        if not passed)"""
+        env_version = os.environ.get(VERSION_ENV_VAR)
+        if env_version:
+            names = tuple(name for name in env_version.split(':') if name)
+            return PyenvVersionSelection(
+                names, f'{VERSION_ENV_VAR} environment variable')
+        if directory is None:
+            directory = os.getcwd()
+        version_file = self._find_version_file(os.path.abspath(directory))
+        if version_file is None:
+            version_file = self._get_global_version_file()
+        names = self._read_version_file(version_file) or (SYSTEM_VERSION,)
+        return PyenvVersionSelection(names, version_file)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._directories = {}
+            self._files = {}
+            self._global_files = {}
+
+    def _find_version_file(self, directory: str) -> str | None:
+        now = time.monotonic()
+        directories = self._directories
+        visited: list[str] = []
+        version_file = None
+        while True:
+            cached = directories.get(directory)
+            if cached and cached[0] > now:
+                version_file = cached[1]
+                break
+            visited.append(directory)
+            path = os.path.join(directory, VERSION_FILE_NAME)
+            if os.path.isfile(path):
+                version_file = path
+                break
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                break
+            directory = parent
+        if visited and self._ttl > 0:
+            # every directory on the way shares the result
+            expires_at = now + self._ttl
+            with self._lock:
+                directories = self._directories
+                if len(directories) + len(visited) > _CACHE_MAX_SIZE:
+                    directories.clear()
+                for directory in visited:
+                    directories[directory] = (expires_at, version_file)
+        return version_file
+
+    def _get_global_version_file(self) -> str:
+        if self._pyenv_root is not None:
+            return os.path.join(self._pyenv_root, 'version')
+        # get_pyenv_root() resolves the path, which costs more than the rest
+        # of a cached lookup, so it is cached while the environment is intact
+        env_key = tuple(map(os.environ.get, _PYENV_ROOT_ENV_VARS))
+        now = time.monotonic()
+        cached = self._global_files.get(env_key)
+        if cached and cached[0] > now:
+            return cached[1]
+        version_file = os.path.join(get_pyenv_root(), 'version')
+        if self._ttl > 0:
+            with self._lock:
+                self._global_files = {env_key: (now + self._ttl, version_file)}
+        return version_file
+
+    def _read_version_file(self, path: str) -> tuple[str, ...]:
+        now = time.monotonic()
+        cached = self._files.get(path)
+        if cached and cached[0] > now:
+            return cached[1]
+        names = read_version_file(path)
+        if self._ttl > 0:
+            with self._lock:
+                if len(self._files) >= _CACHE_MAX_SIZE:
+                    self._files.clear()
+                self._files[path] = (now + self._ttl, names)
+        return names
+
+
+def read_version_file(path: Path | str) -> tuple[str, ...]:
+    """Reads version names from a pyenv version file
+
+    The first word of each line is a version name. Empty lines, comments
+    and names that look like paths are skipped, as pyenv does. A missing
+    file has no names.
+    """
+    names: list[str] = []
+    try:
+        with open(path, encoding='utf-8', errors='replace') as fobj:
+            for line in fobj:
+                words = line[:_MAX_LINE_LENGTH].split(None, 1)
+                if not words:
+                    continue
+                name = words[0]
+                if name.startswith('#') or name == '..' or '/' in name:
+                    continue
+                names.append(name)
+    except OSError as exc:
+        log.debug('cannot read %s: %s', path, exc)
+    return tuple(names)
+
+
+def find_selected_pyenv_python_executable(
+    directory: Path | str | None = None,
+    *, selector: PyenvVersionSelector | None = None,
+    inventory: PyenvInventory | None = None,
+) -> Path | None:
+    """Finds the executable of the version pyenv selects for `directory`
+
+    Every selected name is looked up with `find_pyenv_python_executable`,
+    so a prefix such as `3.12` is resolved to the newest installed 3.12.x.
+    The first installed name wins. `None` is returned if nothing is
+    installed or `system` or an installed non-CPython version comes first.
+    """
+    if selector is None:
+        selector = default_selector
+    if inventory is None:
+        inventory = default_inventory
+    selection = selector.get_selection(directory)
+    for name in selection.names:
+        if name == SYSTEM_VERSION:
+            log.debug('system version selected by %s', selection.origin)
+            return None
+        try:
+            exec_path = find_pyenv_python_executable(
+                name, inventory=inventory)
+        except (ParseError, UnsupportedImplementation) as exc:
+            log.debug('%s: %s', name, exc)
+            # pyenv would run it, e.g., PyPy or a pyenv-virtualenv env
+            if _is_installed(inventory, name):
+                return None
+            continue
+        if exec_path is not None:
+            return exec_path
+        log.debug('%s selected by %s is not installed', name, selection.origin)
+    return None
+
+
+def _is_installed(inventory: PyenvInventory, name: str) -> bool:
+    return any(
+        os.path.lexists(versions_dir / name)
+        for versions_dir in inventory.get_versions_directories()
+    )
+
+
+default_selector = PyenvVersionSelector()
@@ -1,9 +1,12 @@
 import enum
-import re
+from functools import lru_cache
 from typing import NamedTuple, Optional
 
 from .exceptions import SpecParseError, UnsupportedImplementation
-from .version import VERSION_PATTERN
+from .version import (
+    PARSE_CACHE_SIZE, VERSION_PATTERN, Version, VersionMatcher, _lazy_regexes,
+    parse_version_fields,
+)
 
 
 class Implementation(enum.Enum):
@@ -11,11 +14,6 @@ class Implementation(enum.Enum):
     UNSUPPORTED = 'unsupported'
 
 
-CPYTHON_SPEC_REGEX = re.compile(
-    rf'(?P<version>{VERSION_PATTERN})'
-)
-
-
 class PyenvPythonSpec(NamedTuple):
     """Contains specification about a Python Interpreter"""
     string_spec: str
@@ -23,14 +21,14 @@ class PyenvPythonSpec(NamedTuple):
     version: Optional[str]
 
     @classmethod
+    @lru_cache(maxsize=PARSE_CACHE_SIZE)
     def from_string_spec(cls, string_spec: str) -> "PyenvPythonSpec":
         is_cpython = string_spec[0].isdigit()
         if is_cpython:
             implementation = Implementation.CPYTHON
-            match = CPYTHON_SPEC_REGEX.fullmatch(string_spec)
-            if not match:
+            if not parse_version_fields(string_spec):
                 raise SpecParseError(string_spec)
-            version = match.group('version')
+            version = string_spec
         else:
             implementation = Implementation.UNSUPPORTED
             version = None
@@ -48,3 +46,13 @@ class PyenvPythonSpec(NamedTuple):
         if not supported and raise_exception:
             raise UnsupportedImplementation
         return supported
+
+    def compile(self) -> VersionMatcher:
+        """Returns a matcher of versions satisfying the spec"""
+        self.is_supported(raise_exception=True)
+        return VersionMatcher(Version.from_string_version(self.version))
+
+
+__getattr__ = _lazy_regexes(__name__, {
+    'CPYTHON_SPEC_REGEX': rf'(?P<version>{VERSION_PATTERN})',
+})
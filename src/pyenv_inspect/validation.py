@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+from .exceptions import PathError
+from .path import get_pyenv_python_executable_path
+
+
+log = logging.getLogger(__name__)
+
+
+DEFAULT_TTL = 2.0
+
+_CACHE_MAX_SIZE = 4096
+
+# (st_dev, st_ino, st_mtime_ns) of a version directory
+_StatKey = tuple[int, int, int]
+
+
+class _Result(NamedTuple):
+    key: _StatKey
+    expires_at: float
+    exec_path: Path | None
+    # the message of PathError for broken versions
+    error: str | None
+
+
+class ExecutableValidator:
+    """Validates executables of version directories, caching the results
+
+    Both valid executables and failures (e.g., a half-finished
+    `pyenv install`) are cached for `ttl` seconds. A result is dropped
+    earlier if the version directory is replaced or modified, which is
+    checked with a single `os.stat()` call.
+    """
+
+    def __init__(self, *, ttl: float = DEFAULT_TTL) -> None:
+        self._ttl = ttl
+        self._results: dict[Path, _Result] = {}
+        self._lock = threading.Lock()
+
+    def get_executable_path(self, version_dir: Path) -> Path:
+        """Same as `get_pyenv_python_executable_path`, but cached"""
+        try:
+            stat = os.stat(version_dir)
+        except OSError:
+            # nothing to key the result by
+            return get_pyenv_python_executable_path(version_dir)
+        key = (stat.st_dev, stat.st_ino, stat.st_mtime_ns)
+        now = time.monotonic()
+        cached = self._results.get(version_dir)
+        if cached and cached.key == key and cached.expires_at > now:
+            if cached.exec_path is None:
+                raise PathError(cached.error)
+            return cached.exec_path
+        try:
+            exec_path = get_pyenv_python_executable_path(version_dir)
+        except PathError as exc:
+            log.debug('%s is broken: %s', version_dir, exc)
+            self._store(version_dir, _Result(
+                key, now + self._ttl, None, exc.message))
+            raise
+        self._store(
+            version_dir, _Result(key, now + self._ttl, exec_path, None))
+        return exec_path
+
+    def discard(self, version_dir: Path) -> None:
+        with self._lock:
+            self._results.pop(version_dir, None)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._results = {}
+
+    def _store(self, version_dir: Path, result: _Result) -> None:
+        if self._ttl <= 0:
+            return
+        with self._lock:
+            if len(self._results) >= _CACHE_MAX_SIZE:
+                self._results.clear()
+            self._results[version_dir] = result
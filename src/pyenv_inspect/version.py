@@ -1,7 +1,6 @@
-import operator
-import re
-from functools import cached_property, partial
-from typing import Callable, Optional, TypeVar, Union, overload
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+from typing import Any, Optional
 
 from .exceptions import VersionParseError
 
@@ -12,48 +11,53 @@ VERSION_PATTERN = (
     r'(?P<free_threaded>t)?'
     r'(?P<dev>-dev)?'
 )
-VERSION_REGEX = re.compile(VERSION_PATTERN)
 
+# parsed instances are immutable, so equal strings share one instance;
+# use `Version.from_string_version.cache_clear()` to drop them
+PARSE_CACHE_SIZE = 4096
 
-class _comparison:
-    op: Callable[[object, object], bool]
 
-    _T = TypeVar('_T')
+_PRE_TYPES = ('a', 'b', 'rc')
 
-    def __set_name__(self, owner, name):
-        self.op = getattr(operator, name)
+_VersionFields = tuple[tuple[int, ...], Optional[tuple[str, int]], bool, bool]
 
-    @overload
-    def __get__(
-        self, instance: None, owner: Optional[type[_T]] = None,
-    ) -> "_comparison":
-        ...
 
-    @overload
-    def __get__(
-        self, instance: _T, owner: Optional[type[_T]] = None,
-    ) -> Callable[[object], bool]:
-        ...
-
-    def __get__(
-        self, instance: Optional[_T], owner: Optional[type[_T]] = None
-    ) -> Union["_comparison", Callable[[object], bool]]:
-        if instance is None:
-            return self
-        return partial(self._compare, instance)
-
-    def _compare(self, left: object, right: object) -> bool:
-        if not isinstance(left, Version):
-            return NotImplemented
-        if not isinstance(right, Version):
-            return NotImplemented
-        if left._free_threaded != right._free_threaded:
-            raise TypeError(
-                f'threading model must be the same: {left}, {right}')
-        return self.op(left._comparable, right._comparable)
+def parse_version_fields(string_version: str) -> Optional[_VersionFields]:
+    """Parses `VERSION_PATTERN` without regular expressions"""
+    # suffixes are stripped in the reverse order of the pattern
+    dev = string_version.endswith('-dev')
+    if dev:
+        string_version = string_version[:-4]
+    free_threaded = string_version.endswith('t')
+    if free_threaded:
+        string_version = string_version[:-1]
+    pre: Optional[tuple[str, int]] = None
+    for pre_type in _PRE_TYPES:
+        pos = string_version.find(pre_type)
+        if pos == -1:
+            continue
+        pre_number = string_version[pos + len(pre_type):]
+        # `isdecimal()` matches exactly the same characters as `\d` does
+        if not pre_number.isdecimal():
+            return None
+        pre = (pre_type, int(pre_number))
+        string_version = string_version[:pos]
+        break
+    parts = string_version.split('.')
+    if len(parts) > 3 or len(parts[0]) != 1:
+        return None
+    for part in parts:
+        if not part.isdecimal():
+            return None
+    return tuple(map(int, parts)), pre, dev, free_threaded
 
 
 class Version:
+    __slots__ = (
+        '_base', '_pre', '_dev', '_free_threaded', '_flags', '_key', '_hash',
+    )
+
+    _key: tuple[tuple[int, ...], int, int, Optional[tuple[str, int]]]
 
     def __init__(
         self,
@@ -66,6 +70,18 @@ class Version:
         self._pre = pre
         self._dev = dev
         self._free_threaded = free_threaded
+        # must be equal for a match
+        self._flags = (free_threaded, dev, pre)
+        base_short = base
+        while base_short and not base_short[-1]:
+            base_short = base_short[:-1]
+        self._key = (
+            base_short,
+            -1 if dev else 0,
+            -1 if pre else 0,
+            pre if pre else None,
+        )
+        self._hash = hash((base_short, pre, dev))
 
     @property
     def base(self) -> tuple[int, ...]:
@@ -83,20 +99,16 @@ class Version:
     def free_threaded(self) -> bool:
         return self._free_threaded
 
-    @cached_property
-    def _base_short(self) -> tuple[int, ...]:
-        base = self._base
-        for offset in range(len(base) - 1, -1, -1):
-            if base[offset]:
-                return base[:offset + 1]
-        return ()
-
-    @cached_property
-    def _hash(self) -> int:
-        return hash((self._base_short, self._pre, self._dev))
+    @classmethod
+    @lru_cache(maxsize=PARSE_CACHE_SIZE)
+    def from_string_version(cls, string_version: str) -> Optional["Version"]:
+        fields = parse_version_fields(string_version)
+        if not fields:
+            raise VersionParseError(string_version)
+        base, pre, dev, free_threaded = fields
+        return cls(base=base, pre=pre, dev=dev, free_threaded=free_threaded)
 
-    @cached_property
-    def _string_version(self) -> str:
+    def __str__(self) -> str:
         string_version = '.'.join(map(str, self._base))
         if self._pre:
             string_version = f'{string_version}{self._pre[0]}{self._pre[1]}'
@@ -106,37 +118,6 @@ class Version:
             string_version = f'{string_version}-dev'
         return string_version
 
-    @cached_property
-    def _comparable(
-        self,
-    ) -> tuple[tuple[int, ...], int, int, Optional[tuple[str, int]]]:
-        return (
-            self._base_short,
-            -1 if self._dev else 0,
-            -1 if self._pre else 0,
-            self._pre if self._pre else None,
-        )
-
-    @classmethod
-    def from_string_version(cls, string_version: str) -> Optional["Version"]:
-        match = VERSION_REGEX.fullmatch(string_version)
-        if not match:
-            raise VersionParseError(string_version)
-        fields = match.groupdict()
-        base = tuple(map(int, fields['base'].split('.')))
-        pre: Optional[tuple[str, int]] = None
-        if _pre := fields['pre']:
-            if _pre.startswith('rc'):
-                pre = ('rc', int(_pre[2:]))
-            else:
-                pre = (_pre[0], int(_pre[1:]))
-        dev = bool(fields['dev'])
-        free_threaded = bool(fields['free_threaded'])
-        return cls(base=base, pre=pre, dev=dev, free_threaded=free_threaded)
-
-    def __str__(self) -> str:
-        return self._string_version
-
     def __repr__(self) -> str:
         return f'Version {self}'
 
@@ -160,9 +141,119 @@ class Version:
             item_base = item._base[:len(self._base)]
         return self._base == item_base
 
-    __eq__ = _comparison()   # type: ignore
-    __ne__ = _comparison()   # type: ignore
-    __lt__ = _comparison()
-    __le__ = _comparison()
-    __gt__ = _comparison()
-    __ge__ = _comparison()
+    def _check_threading_model(self, other: "Version") -> None:
+        if self._free_threaded != other._free_threaded:
+            raise TypeError(
+                f'threading model must be the same: {self}, {other}')
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Version):
+            return NotImplemented
+        self._check_threading_model(other)
+        return self._key == other._key
+
+    def __ne__(self, other: object) -> bool:
+        if not isinstance(other, Version):
+            return NotImplemented
+        self._check_threading_model(other)
+        return self._key != other._key
+
+    def __lt__(self, other: object) -> bool:
+        if not isinstance(other, Version):
+            return NotImplemented
+        self._check_threading_model(other)
+        return self._key < other._key
+
+    def __le__(self, other: object) -> bool:
+        if not isinstance(other, Version):
+            return NotImplemented
+        self._check_threading_model(other)
+        return self._key <= other._key
+
+    def __gt__(self, other: object) -> bool:
+        if not isinstance(other, Version):
+            return NotImplemented
+        self._check_threading_model(other)
+        return self._key > other._key
+
+    def __ge__(self, other: object) -> bool:
+        if not isinstance(other, Version):
+            return NotImplemented
+        self._check_threading_model(other)
+        return self._key >= other._key
+
+
+class VersionMatcher:
+    """Same as `version in requested_version`, precomputed for many versions"""
+    __slots__ = ('_version', '_flags', '_base', '_base_len', '_exact')
+
+    def __init__(self, version: Version) -> None:
+        self._version = version
+        self._flags = version._flags
+        self._base = version._base
+        self._base_len = len(version._base)
+        # dev versions match only the same base
+        self._exact = version._dev
+
+    @property
+    def version(self) -> Version:
+        return self._version
+
+    def __repr__(self) -> str:
+        return f'VersionMatcher {self._version}'
+
+    def matches(self, version: Version) -> bool:
+        if version._flags != self._flags:
+            return False
+        if self._exact:
+            return version._base == self._base
+        return version._base[:self._base_len] == self._base
+
+    def select_best(self, versions: Iterable[Version]) -> Optional[Version]:
+        """Returns the greatest matching version, the first of equal ones"""
+        # `matches()` inlined, with its attributes in locals
+        flags = self._flags
+        base = self._base
+        base_len = self._base_len
+        exact = self._exact
+        best: Optional[Version] = None
+        best_key = None
+        for version in versions:
+            if version._flags != flags:
+                continue
+            if exact:
+                if version._base != base:
+                    continue
+            elif version._base[:base_len] != base:
+                continue
+            # the threading model of matches is the same, so keys are
+            # comparable
+            key = version._key
+            if best is None or key > best_key:
+                best = version
+                best_key = key
+        return best
+
+
+def _lazy_regexes(
+    module_name: str, patterns: dict[str, str],
+) -> Callable[[str], Any]:
+    # parsing does not use the regexes, so they are compiled on first access
+    # only, by the module __getattr__ returned here
+    def __getattr__(name: str) -> Any:
+        if name in patterns:
+            return _compile(patterns[name])
+        raise AttributeError(
+            f'module {module_name!r} has no attribute {name!r}')
+
+    return __getattr__
+
+
+@lru_cache(maxsize=None)
+def _compile(pattern: str) -> Any:
+    import re
+
+    return re.compile(pattern)
+
+
+__getattr__ = _lazy_regexes(__name__, {'VERSION_REGEX': VERSION_PATTERN})
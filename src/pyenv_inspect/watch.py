@@ -0,0 +1,387 @@
+from __future__ import annotations
+
+import ctypes
+import enum
+import logging
+import os
+import select
+import struct
+import sys
+import time
+from collections.abc import Callable, Sequence
+from functools import lru_cache
+from pathlib import Path
+from stat import S_ISLNK
+from typing import NamedTuple
+
+from .inventory import (
+    _RACY_WINDOW_NS, PyenvInventory, _is_pyenv_virtualenv_link_target,
+    _parse_entry_name,
+)
+from .path import get_pyenv_versions_directories
+from .version import Version
+
+
+log = logging.getLogger(__name__)
+
+
+# <sys/inotify.h>
+_IN_ATTRIB = 0x00000004
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+
+_WATCH_MASK = (
+    _IN_ATTRIB | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+    | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR
+)
+_SELF_GONE_MASK = _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_IGNORED
+
+# struct inotify_event {int wd; uint32_t mask, cookie, len; char name[];}
+_EVENT_HEADER = struct.Struct('iIII')
+_READ_SIZE = 64 * 1024
+
+DEFAULT_POLL_INTERVAL = 1.0
+
+
+class WatchEventType(enum.Enum):
+    ADDED = 'added'
+    REMOVED = 'removed'
+    CHANGED = 'changed'
+
+
+class WatchEvent(NamedTuple):
+    type: WatchEventType
+    # for removed entries, the version the entry had
+    version: Version
+    version_dir: Path
+
+
+# (st_ino, is_symlink)
+_EntryKey = tuple[int, bool]
+
+
+class _Entry(NamedTuple):
+    key: _EntryKey
+    # None for skipped entries: unsupported names, pyenv-virtualenv symlinks
+    version: Version | None
+
+
+class PyenvVersionsWatcher(PyenvInventory):
+    """Inventory kept up to date by watching pyenv versions directories
+
+    Changes are picked up with inotify where it is available (Linux) and by
+    polling the directory modification time otherwise. Only changed entries
+    are parsed and checked again, so the cost of an update does not depend
+    on the number of installed versions (the fallback still has to list
+    a directory once it has been modified).
+
+    `poll()` returns added, removed and changed versions since the previous
+    call; the initial contents are available with `get_entries()`. If
+    `versions_dir` is not passed, `get_pyenv_versions_directories()` is
+    called once on creation. The watcher must be closed with `close()` or
+    used as a context manager.
+    """
+
+    def __init__(
+        self, versions_dir: Path | Sequence[Path] | None = None,
+        *, use_inotify: bool = True,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> None:
+        if versions_dir is None:
+            versions_dir = get_pyenv_versions_directories()
+        super().__init__(versions_dir, persistent=False)
+        self._poll_interval = poll_interval
+        self._pending_events: list[WatchEvent] = []
+        self._dirs = [
+            _WatchedDirectory(path, self._on_change, use_inotify=use_inotify)
+            for path in self.get_versions_directories()
+        ]
+        # the watches are set up before the listing, so nothing is missed
+        with self._scan_lock:
+            for watched_dir in self._dirs:
+                watched_dir.rescan()
+            self._pending_events = []
+
+    def __enter__(self) -> PyenvVersionsWatcher:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def is_native(self) -> bool:
+        """Returns `True` if changes are reported by the OS, not polled"""
+        return all(
+            watched_dir.inotify is not None for watched_dir in self._dirs)
+
+    def get_entries(self) -> list[tuple[Version, Path]]:
+        with self._scan_lock:
+            self._read_changes()
+            if len(self._dirs) == 1:
+                return self._dirs[0].get_entries()
+            return self._merge([
+                watched_dir.get_entries() for watched_dir in self._dirs
+            ])
+
+    def poll(self, timeout: float | None = 0) -> list[WatchEvent]:
+        """Returns changes made since the previous call
+
+        Waits up to `timeout` seconds (forever if `None`) for a change
+        if there are none yet.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._scan_lock:
+                self._read_changes()
+                if self._pending_events:
+                    events = self._pending_events
+                    self._pending_events = []
+                    return events
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return []
+            self._wait(remaining)
+
+    def invalidate(self) -> None:
+        with self._scan_lock:
+            for watched_dir in self._dirs:
+                watched_dir.rescan()
+
+    def close(self) -> None:
+        with self._scan_lock:
+            for watched_dir in self._dirs:
+                watched_dir.close()
+
+    def _wait(self, timeout: float | None) -> None:
+        inotifies = [
+            watched_dir.inotify for watched_dir in self._dirs
+            if watched_dir.inotify is not None
+        ]
+        if len(inotifies) < len(self._dirs):
+            if timeout is None or timeout > self._poll_interval:
+                timeout = self._poll_interval
+        if not inotifies:
+            time.sleep(timeout)
+            return
+        try:
+            select.select(inotifies, [], [], timeout)
+        except (OSError, ValueError):
+            # closed by another thread
+            pass
+
+    def _read_changes(self) -> None:
+        for watched_dir in self._dirs:
+            watched_dir.read_changes()
+
+    def _on_change(self, event: WatchEvent | None, version_dir: Path) -> None:
+        self._validator.discard(version_dir)
+        if event is not None:
+            log.debug('%s %s', event.type.value, version_dir)
+            self._pending_events.append(event)
+
+
+class _WatchedDirectory:
+
+    def __init__(
+        self, path: Path,
+        on_change: Callable[[WatchEvent | None, Path], None],
+        *, use_inotify: bool,
+    ) -> None:
+        self.path = path
+        self.inotify: _Inotify | None = None
+        self._on_change = on_change
+        self._index: dict[str, _Entry] = {}
+        self._entries: list[tuple[Version, Path]] | None = None
+        # (st_dev, st_ino, st_mtime_ns) of the last listing, poll mode only
+        self._dir_key: tuple[int, int, int] | None = None
+        self._listed_at_ns = 0
+        if use_inotify:
+            try:
+                self.inotify = _Inotify(path)
+            except OSError as exc:
+                log.debug('inotify is not available: %s', exc)
+
+    def get_entries(self) -> list[tuple[Version, Path]]:
+        entries = self._entries
+        if entries is None:
+            entries = self._entries = [
+                (entry.version, self.path / name)
+                for name, entry in self._index.items()
+                if entry.version is not None
+            ]
+        return entries
+
+    def close(self) -> None:
+        if self.inotify is not None:
+            self.inotify.close()
+            self.inotify = None
+
+    def read_changes(self) -> None:
+        if self.inotify is None:
+            self._poll_changes()
+            return
+        names: dict[str, None] = {}
+        rescan = False
+        for mask, name in self.inotify.read():
+            if mask & _SELF_GONE_MASK:
+                log.debug('%s is gone, switching to polling', self.path)
+                self.close()
+                rescan = True
+                break
+            if mask & _IN_Q_OVERFLOW:
+                log.debug('inotify queue overflow')
+                rescan = True
+            elif name:
+                names[name] = None
+        if rescan:
+            self.rescan()
+            return
+        for name in names:
+            self._update(name, self._read_entry(name))
+
+    def rescan(self) -> None:
+        self._listed_at_ns = time.time_ns()
+        try:
+            stat = os.stat(self.path)
+            self._dir_key = (stat.st_dev, stat.st_ino, stat.st_mtime_ns)
+            with os.scandir(self.path) as it:
+                dir_entries = list(it)
+        except FileNotFoundError:
+            self._dir_key = None
+            dir_entries = []
+        seen: set[str] = set()
+        for dir_entry in dir_entries:
+            name = dir_entry.name
+            seen.add(name)
+            key = (dir_entry.inode(), dir_entry.is_symlink())
+            entry = self._index.get(name)
+            if entry is None or entry.key != key:
+                self._update(name, self._make_entry(name, key))
+        for name in [name for name in self._index if name not in seen]:
+            self._update(name, None)
+
+    def _poll_changes(self) -> None:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            if self._dir_key is not None or self._index:
+                self.rescan()
+            return
+        dir_key = (stat.st_dev, stat.st_ino, stat.st_mtime_ns)
+        if (
+            dir_key == self._dir_key
+            and self._listed_at_ns - dir_key[2] >= _RACY_WINDOW_NS
+        ):
+            return
+        self.rescan()
+
+    def _read_entry(self, name: str) -> _Entry | None:
+        try:
+            stat = os.lstat(os.path.join(self.path, name))
+        except FileNotFoundError:
+            return None
+        return self._make_entry(name, (stat.st_ino, S_ISLNK(stat.st_mode)))
+
+    def _make_entry(self, name: str, key: _EntryKey) -> _Entry:
+        if key[1] and _is_pyenv_virtualenv_link_target(
+            os.path.join(self.path, name), name,
+        ):
+            return _Entry(key, None)
+        parsed = _parse_entry_name(name)
+        return _Entry(key, parsed[1] if parsed else None)
+
+    def _update(self, name: str, entry: _Entry | None) -> None:
+        old_entry = self._index.get(name)
+        if entry is None:
+            if old_entry is None:
+                return
+            del self._index[name]
+        else:
+            if old_entry is not None and old_entry.key == entry.key:
+                return
+            self._index[name] = entry
+        old_version = old_entry.version if old_entry else None
+        version = entry.version if entry else None
+        version_dir = self.path / name
+        if old_version is None and version is None:
+            self._on_change(None, version_dir)
+            return
+        self._entries = None
+        if old_version is None:
+            event = WatchEvent(WatchEventType.ADDED, version, version_dir)
+        elif version is None:
+            event = WatchEvent(
+                WatchEventType.REMOVED, old_version, version_dir)
+        else:
+            event = WatchEvent(WatchEventType.CHANGED, version, version_dir)
+        self._on_change(event, version_dir)
+
+
+class _Inotify:
+
+    def __init__(self, path: Path) -> None:
+        libc = _load_libc()
+        if libc is None:
+            raise OSError('inotify is not supported')
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        wd = libc.inotify_add_watch(fd, os.fsencode(path), _WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(errno, os.strerror(errno), str(path))
+        self._fd = fd
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def read(self) -> list[tuple[int, str]]:
+        """Returns pending events as (mask, name) pairs without blocking"""
+        events: list[tuple[int, str]] = []
+        while self._fd >= 0:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                _, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                events.append((mask, os.fsdecode(name)))
+        return events
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+@lru_cache(maxsize=None)
+def _load_libc() -> ctypes.CDLL | None:
+    if not sys.platform.startswith('linux'):
+        return None
+    # ctypes.util imports subprocess and a lot more
+    import ctypes.util
+
+    try:
+        libc = ctypes.CDLL(
+            ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [
+            ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    except (OSError, AttributeError) as exc:
+        log.debug('cannot load inotify functions: %s', exc)
+        return None
+    return libc
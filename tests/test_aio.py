@@ -0,0 +1,116 @@
+import asyncio
+import time
+
+import pytest
+
+from pyenv_inspect import inventory as inventory_module
+from pyenv_inspect.aio import (
+    afind_pyenv_python_executable, afind_pyenv_python_executables,
+)
+from pyenv_inspect.exceptions import PathError, UnsupportedImplementation
+
+from tests.test_inspect import BaseTestFind
+
+
+class TestAsyncFind(BaseTestFind):
+
+    @pytest.fixture(autouse=True)
+    def count_scans(self, monkeypatch):
+        self.scan_count = 0
+        _scan = inventory_module._scan_versions_directory
+
+        def _slow_counting_scan(versions_dir):
+            self.scan_count += 1
+            time.sleep(0.05)
+            return _scan(versions_dir)
+
+        monkeypatch.setattr(
+            inventory_module, '_scan_versions_directory', _slow_counting_scan)
+
+    def expected_path(self, version):
+        return self.versions_dir / version / self.bin_dir / self.exec_name
+
+    @pytest.mark.parametrize('requested,expected', [
+        ('3', '3.8.3'),
+        ('3.7', '3.7.12'),
+        ('3.7.1', '3.7.1'),
+        ('3.9', None),
+        ('3.7.3', None),
+        ('>=3.7,<3.8', '3.7.12'),
+    ])
+    def test_found(self, requested, expected):
+        self.prepare_versions('3.7.2', '3.7.1', '3.7.12', '3.8.3')
+
+        result = asyncio.run(afind_pyenv_python_executable(requested))
+
+        assert result == (expected and self.expected_path(expected))
+
+    def test_batch(self):
+        self.prepare_versions('3.7.12', '3.8.3')
+
+        result = asyncio.run(afind_pyenv_python_executables(['3.7', '3.9']))
+
+        assert result == {'3.7': self.expected_path('3.7.12'), '3.9': None}
+
+    @pytest.mark.parametrize('requested', ['3.7', '3.7.12'])
+    def test_broken(self, requested):
+        self.prepare_versions('3.7.2', '3.7.12')[1].unlink()
+
+        with pytest.raises(PathError):
+            asyncio.run(afind_pyenv_python_executable(requested))
+
+    @pytest.mark.parametrize('requested,expected', [
+        ('3.7', '3.7.2'),
+        ('3.7.12', None),
+    ])
+    def test_broken_skipped(self, requested, expected):
+        self.prepare_versions('3.7.2', '3.7.12')[1].unlink()
+
+        result = asyncio.run(
+            afind_pyenv_python_executable(requested, skip_broken=True))
+
+        assert result == (expected and self.expected_path(expected))
+
+    def test_batch_broken_skipped(self):
+        self.prepare_versions('3.7.2', '3.7.12')[1].unlink()
+
+        result = asyncio.run(
+            afind_pyenv_python_executables(['3.7'], skip_broken=True))
+
+        assert result == {'3.7': self.expected_path('3.7.2')}
+
+    def test_unsupported(self):
+        with pytest.raises(UnsupportedImplementation):
+            asyncio.run(afind_pyenv_python_executable('fakepython-3.7'))
+
+    def test_concurrent_calls_share_scan(self):
+        self.prepare_versions('3.7.12', '3.8.3')
+
+        async def resolve_many():
+            return await asyncio.gather(
+                *(afind_pyenv_python_executable(spec)
+                  for spec in ['3', '3.7', '3.8'] * 5),
+                afind_pyenv_python_executables(['3.7', '3.8']),
+            )
+
+        results = asyncio.run(resolve_many())
+
+        assert results[:3] == [
+            self.expected_path('3.8.3'),
+            self.expected_path('3.7.12'),
+            self.expected_path('3.8.3'),
+        ]
+        assert self.scan_count == 1
+
+    def test_cancelled_awaiter_does_not_cancel_scan(self):
+        self.prepare_versions('3.8.3')
+
+        async def resolve():
+            first = asyncio.ensure_future(afind_pyenv_python_executable('3'))
+            second = asyncio.ensure_future(afind_pyenv_python_executable('3'))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(resolve()) == self.expected_path('3.8.3')
+        assert self.scan_count == 1
@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+from pyenv_inspect.cache import (
+    CACHE_FORMAT, get_cache_directory, is_cache_enabled, read_cache_file,
+    write_cache_file,
+)
+
+
+@pytest.mark.parametrize('value,expected', [
+    ('1', True),
+    ('yes', True),
+    ('True', True),
+    ('0', False),
+    ('', False),
+])
+def test_is_cache_enabled(monkeypatch, value, expected):
+    monkeypatch.setenv('PYENV_INSPECT_CACHE', value)
+
+    assert is_cache_enabled() is expected
+
+
+def test_get_cache_directory(monkeypatch, tmp_path):
+    monkeypatch.delenv('XDG_CACHE_HOME', raising=False)
+
+    assert get_cache_directory(tmp_path) == tmp_path / '.pyenv-inspect'
+
+
+def test_get_cache_directory_xdg(monkeypatch, tmp_path):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'xdg'))
+
+    cache_dir = get_cache_directory(tmp_path / 'pyenv_root')
+
+    assert cache_dir.parent == tmp_path / 'xdg' / 'pyenv-inspect'
+    assert cache_dir != get_cache_directory(tmp_path / 'other_root')
+
+
+def test_write_read(tmp_path):
+    path = tmp_path / 'cache' / 'data.json'
+
+    write_cache_file(path, {'key': [1, 2]})
+
+    assert read_cache_file(path) == {'format': CACHE_FORMAT, 'key': [1, 2]}
+    assert [p.name for p in path.parent.iterdir()] == ['data.json']
+
+
+def test_read_missing(tmp_path):
+    assert read_cache_file(tmp_path / 'data.json') is None
+
+
+@pytest.mark.parametrize('content', [
+    '{"format": 1',
+    '[]',
+    json.dumps({'format': CACHE_FORMAT + 1}),
+])
+def test_read_invalid(tmp_path, content):
+    path = tmp_path / 'data.json'
+    path.write_text(content)
+
+    assert read_cache_file(path) is None
+
+
+def test_write_error_ignored(tmp_path):
+    path = tmp_path / 'file' / 'data.json'
+    path.parent.touch()
+
+    write_cache_file(path, {})
+
+    assert path.parent.is_file()
@@ -0,0 +1,160 @@
+import io
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from pyenv_inspect.cli import main
+
+from tests.test_inspect import BaseTestFind
+
+
+class TestFind(BaseTestFind):
+
+    @pytest.fixture(autouse=True)
+    def setup_versions(self, setup):
+        self.prepare_versions('3.11.9', '3.12.1', '3.12.4')
+
+    def exec_path(self, version):
+        return str(self.versions_dir / version / self.bin_dir / self.exec_name)
+
+    def run(self, capsys, *argv):
+        exit_code = main(['find', *argv])
+        out = capsys.readouterr().out
+        return exit_code, [json.loads(line) for line in out.splitlines()]
+
+    def test_found(self, capsys):
+        exit_code, results = self.run(capsys, '3.12', '3.11')
+
+        assert exit_code == 0
+        assert results == [
+            {
+                'string_spec': '3.12',
+                'spec': {
+                    'string_spec': '3.12',
+                    'implementation': 'cpython',
+                    'version': '3.12',
+                },
+                'executable': self.exec_path('3.12.4'),
+                'error': None,
+            },
+            {
+                'string_spec': '3.11',
+                'spec': {
+                    'string_spec': '3.11',
+                    'implementation': 'cpython',
+                    'version': '3.11',
+                },
+                'executable': self.exec_path('3.11.9'),
+                'error': None,
+            },
+        ]
+
+    def test_errors_per_item(self, capsys):
+        exit_code, results = self.run(
+            capsys, '3.x', 'pypy3.10-7.3.15', '', '3.13', '3.12.1')
+
+        assert exit_code == 1
+        assert [result['error'] and result['error']['type'] for result in (
+            results
+        )] == [
+            'SpecParseError', 'UnsupportedImplementation', 'SpecParseError',
+            None, None,
+        ]
+        assert results[1]['spec'] == {
+            'string_spec': 'pypy3.10-7.3.15',
+            'implementation': 'unsupported',
+            'version': None,
+        }
+        assert results[3]['executable'] is None
+        assert results[4]['executable'] == self.exec_path('3.12.1')
+
+    def test_constraint(self, capsys):
+        exit_code, results = self.run(capsys, '>=3.11,<3.12.4', '>=3.x')
+
+        assert exit_code == 1
+        assert results == [
+            {
+                'string_spec': '>=3.11,<3.12.4',
+                'spec': {
+                    'string_constraint': '>=3.11,<3.12.4',
+                    'clauses': ['>=3.11', '<3.12.4'],
+                    'free_threaded': False,
+                },
+                'executable': self.exec_path('3.12.1'),
+                'error': None,
+            },
+            {
+                'string_spec': '>=3.x',
+                'spec': None,
+                'executable': None,
+                'error': {
+                    'type': 'ConstraintParseError',
+                    'message': '>=3.x',
+                },
+            },
+        ]
+
+    @pytest.mark.parametrize('argv', [[], ['-']])
+    def test_stdin(self, monkeypatch, capsys, argv):
+        monkeypatch.setattr('sys.stdin', io.StringIO('3.12\n\n  3.11.9  \n'))
+
+        exit_code, results = self.run(capsys, *argv)
+
+        assert exit_code == 0
+        assert [result['executable'] for result in results] == [
+            self.exec_path('3.12.4'), self.exec_path('3.11.9')]
+
+    def test_versions_dir(self, monkeypatch, capsys, tmp_path):
+        monkeypatch.setenv('PYENV_ROOT', str(tmp_path / 'missing'))
+
+        exit_code, results = self.run(
+            capsys, '--versions-dir', str(self.versions_dir), '3.12')
+
+        assert exit_code == 0
+        assert results[0]['executable'] == self.exec_path('3.12.4')
+
+    @pytest.mark.parametrize('name,message', [
+        ('missing', 'does not exist'),
+        ('file', 'is not a directory'),
+    ])
+    def test_versions_dir_error(self, capsys, tmp_path, name, message):
+        (tmp_path / 'file').touch()
+
+        exit_code, results = self.run(
+            capsys, '--versions-dir', str(tmp_path / name), '3.12', '3.11')
+
+        assert exit_code == 1
+        assert [result['error']['type'] for result in results] == [
+            'PathError', 'PathError']
+        assert message in results[0]['error']['message']
+
+    def test_path_error(self, monkeypatch, capsys, tmp_path):
+        monkeypatch.setenv('PYENV_ROOT', str(tmp_path / 'missing'))
+
+        exit_code, results = self.run(capsys, '3.12', '3.11')
+
+        assert exit_code == 1
+        assert [result['error']['type'] for result in results] == [
+            'PathError', 'PathError']
+
+    def test_module(self):
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        process = subprocess.run(
+            [sys.executable, '-m', 'pyenv_inspect', 'find', '3.12'],
+            capture_output=True, text=True, env=env, check=True,
+        )
+
+        assert json.loads(process.stdout)['executable'] == (
+            self.exec_path('3.12.4'))
+
+
+def test_serve_error(monkeypatch, capsys, tmp_path):
+    monkeypatch.setenv('PYENV_ROOT', str(tmp_path / 'missing'))
+
+    exit_code = main(['serve'])
+
+    assert exit_code == 2
+    assert 'pyenv root does not exist' in capsys.readouterr().err
@@ -0,0 +1,109 @@
+import pytest
+
+from pyenv_inspect.constraint import (
+    Operator, VersionConstraint, is_string_constraint,
+)
+from pyenv_inspect.exceptions import ConstraintParseError
+from pyenv_inspect.version import Version
+
+
+@pytest.mark.parametrize('string_constraint,clauses,free_threaded', [
+    ('>=3.10', ['>=3.10'], False),
+    ('>=3.10,<3.13', ['>=3.10', '<3.13'], False),
+    (' >= 3.10 , < 3.13 ', ['>=3.10', '<3.13'], False),
+    ('==3.12.4,!=3.12.1,<=3.12.9', ['==3.12.4', '!=3.12.1', '<=3.12.9'],
+     False),
+    ('>3.12', ['>3.12'], False),
+    ('>=3.13,t', ['>=3.13t'], True),
+    ('t,<3.14', ['<3.14t'], True),
+    ('>=3.13t,<3.14', ['>=3.13t', '<3.14t'], True),
+    ('t', [], True),
+    ('>=3.14.0a1', ['>=3.14.0a1'], False),
+    ('>=3.14-dev', ['>=3.14-dev'], False),
+])
+def test_parse(string_constraint, clauses, free_threaded):
+    constraint = VersionConstraint.from_string_constraint(string_constraint)
+
+    assert constraint.string_constraint == string_constraint
+    assert [str(clause) for clause in constraint.clauses] == clauses
+    assert constraint.free_threaded is free_threaded
+    assert str(constraint) == string_constraint
+
+
+def test_parse_operators():
+    constraint = VersionConstraint.from_string_constraint(
+        '<3,<=3,>3,>=3,==3,!=3')
+
+    assert [clause.operator for clause in constraint.clauses] == [
+        Operator.LT, Operator.LE, Operator.GT, Operator.GE, Operator.EQ,
+        Operator.NE,
+    ]
+
+
+@pytest.mark.parametrize('string_constraint', [
+    '', ',', '>=3.10,', '3.10', '=3.10', '=>3.10', '>=', '>=3.x', '>=3.10 t',
+    'tt', '>=3.10,,<3.13', '<<3',
+])
+def test_parse_error(string_constraint):
+    with pytest.raises(ConstraintParseError):
+        VersionConstraint.from_string_constraint(string_constraint)
+
+
+@pytest.mark.parametrize('string_constraint,string_version,expected', [
+    ('>=3.10,<3.13', '3.10', True),
+    ('>=3.10,<3.13', '3.10.0', True),
+    ('>=3.10,<3.13', '3.12.9', True),
+    ('>=3.10,<3.13', '3.9.18', False),
+    ('>=3.10,<3.13', '3.13.0', False),
+    ('>=3.10,<3.13', '3.13', False),
+    ('>=3.10,<3.13', '3.12.9t', False),
+    ('>=3.10,<3.13', '3.12.0rc1', False),
+    ('>=3.10,<3.13', '3.12-dev', False),
+    ('<=3.12', '3.12.0', True),
+    ('<=3.12', '3.12.1', False),
+    ('>3.12', '3.12.0', False),
+    ('>3.12', '3.12.1', True),
+    ('==3.12', '3.12.0', True),
+    ('==3.12', '3.12.4', False),
+    ('!=3.12.1', '3.12.1', False),
+    ('!=3.12.1', '3.12.2', True),
+    ('>=3.13,t', '3.13.1t', True),
+    ('>=3.13,t', '3.13.1', False),
+    ('t', '3.12.1t', True),
+    ('<3.14.0b1', '3.14.0a7', True),
+    ('<3.14.0b1', '3.13.2', True),
+    ('<3.14.0b1', '3.14.0b1', False),
+    ('>=3.14-dev', '3.14-dev', True),
+    ('>=3.14-dev', '3.14.0', True),
+    ('>=3.14-dev', '3.14.0a1', False),
+])
+def test_contains(string_constraint, string_version, expected):
+    constraint = VersionConstraint.from_string_constraint(string_constraint)
+
+    assert (Version.from_string_version(string_version) in constraint) is (
+        expected)
+
+
+def test_to_dict():
+    constraint = VersionConstraint.from_string_constraint('>=3.13, t')
+
+    assert constraint.to_dict() == {
+        'string_constraint': '>=3.13, t',
+        'clauses': ['>=3.13t'],
+        'free_threaded': True,
+    }
+
+
+@pytest.mark.parametrize('string,expected', [
+    ('>=3.10', True),
+    ('<3.13', True),
+    ('==3.12', True),
+    ('!=3.12', True),
+    ('t,>=3.13', True),
+    ('3.12', False),
+    ('3.13t', False),
+    ('pypy3.10-7.3.15', False),
+    ('', False),
+])
+def test_is_string_constraint(string, expected):
+    assert is_string_constraint(string) is expected
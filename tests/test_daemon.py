@@ -0,0 +1,206 @@
+import os
+import socket
+import threading
+
+import pytest
+
+from pyenv_inspect import daemon as daemon_module
+from pyenv_inspect.constraint import VersionConstraint
+from pyenv_inspect.daemon import (
+    PyenvInspectClient, PyenvInspectDaemon, get_socket_path, resolve_specs,
+)
+from pyenv_inspect.exceptions import (
+    ConstraintParseError, DaemonError, SpecParseError,
+    UnsupportedImplementation,
+)
+from pyenv_inspect.spec import PyenvPythonSpec
+
+from tests.test_inspect import BaseTestFind
+from tests.testlib import posix_test
+
+
+@posix_test
+class TestDaemon(BaseTestFind):
+
+    @pytest.fixture(autouse=True)
+    def setup_daemon(self, setup):
+        self.prepare_versions('3.11.9', '3.12.1', '3.12.4')
+        self.socket_path = get_socket_path()
+
+    @pytest.fixture
+    def daemon(self):
+        daemon = PyenvInspectDaemon()
+        thread = threading.Thread(target=daemon.serve_forever)
+        thread.start()
+        yield daemon
+        daemon.shutdown()
+        thread.join()
+        daemon.close()
+
+    @pytest.fixture
+    def client(self):
+        with PyenvInspectClient() as client:
+            yield client
+
+    def exec_path(self, version):
+        return self.versions_dir / version / self.bin_dir / self.exec_name
+
+    def test_socket_path(self):
+        assert self.socket_path == (
+            self.pyenv_root / '.pyenv-inspect' / 'daemon.sock')
+
+    def test_find(self, daemon, client):
+        assert client.find_pyenv_python_executable('3.12') == (
+            self.exec_path('3.12.4'))
+        assert client.is_connected()
+        assert client.find_pyenv_python_executables([
+            '3.11', PyenvPythonSpec.from_string_spec('3.12.1'), '3.13',
+        ]) == {
+            '3.11': self.exec_path('3.11.9'),
+            PyenvPythonSpec.from_string_spec('3.12.1'):
+                self.exec_path('3.12.1'),
+            '3.13': None,
+        }
+
+    def test_find_constraint(self, daemon, client):
+        constraint = VersionConstraint.from_string_constraint('<3.12.4')
+
+        assert client.find_pyenv_python_executables([
+            constraint, '>=3.11,<3.12',
+        ]) == {
+            constraint: self.exec_path('3.12.1'),
+            '>=3.11,<3.12': self.exec_path('3.11.9'),
+        }
+
+    def test_index_kept_up_to_date(self, daemon, client):
+        assert client.find_pyenv_python_executable('3.13') is None
+
+        self.prepare_version('3.13.0')
+
+        assert client.find_pyenv_python_executable('3.13') == (
+            self.exec_path('3.13.0'))
+
+    @pytest.mark.parametrize('spec,error_class', [
+        ('pypy3.10-7.3.15', UnsupportedImplementation),
+        ('3.x', SpecParseError),
+        ('', SpecParseError),
+        ('>=3.x', ConstraintParseError),
+    ])
+    def test_error(self, daemon, client, spec, error_class):
+        with pytest.raises(error_class):
+            client.find_pyenv_python_executable(spec)
+        assert client.is_connected()
+
+    def test_invalid_request(self, daemon):
+        with socket.socket(socket.AF_UNIX) as sock:
+            sock.connect(str(self.socket_path))
+            sock.sendall(b'{"specs": "3.12"}\nnot json\n')
+            with sock.makefile('rb') as rfile:
+                assert b'DaemonError' in rfile.readline()
+                assert b'DaemonError' in rfile.readline()
+
+    def test_internal_error(self, monkeypatch, daemon, client):
+        def _failing_find(spec, *, inventory=None):
+            raise RuntimeError('boom')
+
+        monkeypatch.setattr(
+            daemon_module, 'find_pyenv_python_executable', _failing_find)
+        with pytest.raises(DaemonError, match='internal error'):
+            client.find_pyenv_python_executable('3.12')
+        monkeypatch.undo()
+
+        assert client.find_pyenv_python_executable('3.12') == (
+            self.exec_path('3.12.4'))
+        assert client.is_connected()
+
+    def test_fallback(self, client):
+        assert client.find_pyenv_python_executable('3.12') == (
+            self.exec_path('3.12.4'))
+        assert not client.is_connected()
+        with pytest.raises(UnsupportedImplementation):
+            client.find_pyenv_python_executable('pypy3.10-7.3.15')
+        with pytest.raises(SpecParseError):
+            client.find_pyenv_python_executable('')
+
+    def test_fallback_daemon_stopped(self, client):
+        daemon = PyenvInspectDaemon()
+        thread = threading.Thread(target=daemon.serve_forever)
+        thread.start()
+        try:
+            client.find_pyenv_python_executable('3.12')
+            assert client.is_connected()
+        finally:
+            daemon.shutdown()
+            thread.join()
+            daemon.close()
+
+        assert client.find_pyenv_python_executable('3.12') == (
+            self.exec_path('3.12.4'))
+        assert not client.is_connected()
+
+    def test_stale_socket_replaced(self):
+        self.socket_path.parent.mkdir(parents=True)
+        with socket.socket(socket.AF_UNIX) as sock:
+            sock.bind(str(self.socket_path))
+
+        with PyenvInspectDaemon():
+            assert self.socket_path.is_socket()
+
+        assert not self.socket_path.exists()
+
+    def test_already_running(self, daemon):
+        with pytest.raises(DaemonError, match='already running'):
+            PyenvInspectDaemon()
+
+    def test_socket_permissions(self, daemon):
+        assert self.socket_path.stat().st_mode & 0o077 == 0
+        assert self.socket_path.parent.stat().st_mode & 0o077 == 0
+
+    def test_umask_not_changed(self, monkeypatch):
+        def _umask(mask):
+            raise AssertionError('umask is process-wide')
+
+        monkeypatch.setattr(os, 'umask', _umask)
+
+        with PyenvInspectDaemon():
+            assert self.socket_path.stat().st_mode & 0o077 == 0
+
+
+@posix_test
+def test_daemon_multiple_roots(monkeypatch, tmp_path):
+    user_root = tmp_path / 'user'
+    shared_root = tmp_path / 'shared'
+    (user_root / 'versions').mkdir(parents=True)
+    exec_path = shared_root / 'versions' / '3.12.4' / 'bin' / 'python'
+    exec_path.parent.mkdir(parents=True)
+    exec_path.touch(mode=0o755)
+    monkeypatch.setenv('PYENV_ROOT', os.pathsep.join(
+        map(str, [user_root, shared_root])))
+    daemon = PyenvInspectDaemon()
+    thread = threading.Thread(target=daemon.serve_forever)
+    thread.start()
+    try:
+        with PyenvInspectClient() as client:
+            assert client.find_pyenv_python_executable('3.12') == exec_path
+            assert client.is_connected()
+    finally:
+        daemon.shutdown()
+        thread.join()
+        daemon.close()
+
+
+def test_resolve_specs(monkeypatch, tmp_path):
+    monkeypatch.setenv('PYENV_ROOT', str(tmp_path))
+    (tmp_path / 'versions').mkdir()
+
+    assert resolve_specs(['3.12', 'pypy3.10-7.3.15']) == [
+        {'spec': '3.12', 'executable': None, 'error': None},
+        {
+            'spec': 'pypy3.10-7.3.15',
+            'executable': None,
+            'error': {
+                'type': 'UnsupportedImplementation',
+                'message': 'only CPython is currently supported',
+            },
+        },
+    ]
@@ -0,0 +1,80 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import pyenv_inspect
+from pyenv_inspect import inventory, spec, version
+
+
+# generous enough for slow machines without bytecode caches; importing
+# the submodules eagerly takes several times as long
+IMPORT_TIME_BUDGET_US = 20_000
+
+# modules that must not be imported to find an executable
+HEAVY_MODULES = {
+    'asyncio', 'concurrent.futures', 'ctypes', 'hashlib', 'json', 'random',
+    'shutil', 'socket', 'subprocess', 'tempfile',
+}
+
+
+def get_import_times(code):
+    """Returns cumulative import times (in us) reported by `-X importtime`"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    import_times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if cumulative.strip().isdigit():
+            import_times[name.strip()] = int(cumulative)
+    return import_times
+
+
+@pytest.fixture(scope='module')
+def baseline_modules():
+    return set(get_import_times('pass'))
+
+
+def test_import_is_lazy(baseline_modules):
+    import_times = get_import_times('import pyenv_inspect')
+
+    assert set(import_times) - baseline_modules == {'pyenv_inspect'}
+    assert import_times['pyenv_inspect'] < IMPORT_TIME_BUDGET_US
+
+
+def test_find_import(baseline_modules):
+    import_times = get_import_times(
+        'from pyenv_inspect import find_pyenv_python_executable\n'
+        'from pyenv_inspect import spec, version\n'
+        "assert 'VERSION_REGEX' not in vars(version)\n"
+        "assert 'CPYTHON_SPEC_REGEX' not in vars(spec)\n"
+    )
+
+    imported = set(import_times) - baseline_modules
+    assert 'pyenv_inspect.inspect' in imported
+    assert not imported & HEAVY_MODULES
+
+
+def test_lazy_attributes():
+    for name in pyenv_inspect.__all__:
+        assert getattr(pyenv_inspect, name) is not None
+    assert pyenv_inspect.PyenvInventory is inventory.PyenvInventory
+    assert set(pyenv_inspect.__all__) <= set(dir(pyenv_inspect))
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError, match='no_such_attribute'):
+        pyenv_inspect.no_such_attribute
+
+
+def test_deferred_regexes():
+    assert version.VERSION_REGEX.fullmatch('3.13.0rc2t')
+    assert spec.CPYTHON_SPEC_REGEX.fullmatch('3.14-dev')
+    with pytest.raises(AttributeError):
+        version.NO_SUCH_REGEX
@@ -0,0 +1,209 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from pyenv_inspect.constraint import VersionConstraint
+from pyenv_inspect.index import VersionIndex
+from pyenv_inspect.version import Version
+
+
+def _select_best_match_linear(entries, requested_version):
+    # reference implementation
+    best_match = None
+    for version, version_dir in entries:
+        if version not in requested_version:
+            continue
+        if not best_match or version > best_match[0]:
+            best_match = (version, version_dir)
+    return best_match
+
+
+def _make_entries(*string_versions):
+    return [
+        (Version.from_string_version(string_version), Path(string_version))
+        for string_version in string_versions
+    ]
+
+
+ENTRIES = _make_entries(
+    '3.12.1', '3.12.4', '3.12.10', '3.12.4t', '3.13.0rc2', '3.13.0rc2t',
+    '3.13.0', '3.13', '3.14-dev', '3.14.0a1', '3.14.0a1-dev', '3.14t-dev',
+    '2.7.18', '3.9', '3.9.0', '3.13.1',
+)
+
+
+@pytest.mark.parametrize('requested_string_version,expected', [
+    ('3', '3.13.1'),
+    ('3.12', '3.12.10'),
+    ('3.12.4', '3.12.4'),
+    ('3.12.5', None),
+    ('3.12t', '3.12.4t'),
+    ('3t', '3.12.4t'),
+    ('3.13', '3.13.1'),
+    ('3.13.0', '3.13.0'),
+    ('3.13.0rc2', '3.13.0rc2'),
+    ('3.13rc2', '3.13.0rc2'),
+    ('3.14-dev', '3.14-dev'),
+    ('3-dev', None),
+    ('3.14.0a1-dev', '3.14.0a1-dev'),
+    ('3.14t-dev', '3.14t-dev'),
+    ('3.14.0a1', '3.14.0a1'),
+    ('2', '2.7.18'),
+    ('4', None),
+    ('3.9', '3.9'),
+])
+def test_select_best_match(requested_string_version, expected):
+    index = VersionIndex(ENTRIES)
+
+    best_match = index.select_best_match(
+        Version.from_string_version(requested_string_version))
+
+    if expected is None:
+        assert best_match is None
+    else:
+        assert best_match is not None
+        assert best_match[1] == Path(expected)
+
+
+def test_select_best_match_first_equal_version_wins():
+    entries = _make_entries('3.12', '3.12.0', '3.11')
+
+    best_match = VersionIndex(entries).select_best_match(
+        Version.from_string_version('3'))
+
+    assert best_match == entries[0]
+
+
+def test_select_best_match_empty():
+    assert VersionIndex().select_best_match(
+        Version.from_string_version('3')) is None
+
+
+def test_add():
+    index = VersionIndex(_make_entries('3.12.1'))
+    index.add(_make_entries('3.12.2')[0])
+
+    best_match = index.select_best_match(Version.from_string_version('3.12'))
+
+    assert best_match == _make_entries('3.12.2')[0]
+
+
+def _random_string_versions(rnd, count):
+    string_versions = []
+    for _ in range(count):
+        base = '.'.join(
+            str(rnd.randint(0, 3)) for _ in range(rnd.randint(1, 3)))
+        pre = ''
+        if len(base) == 5 and rnd.random() < 0.3:
+            pre = f'{rnd.choice(["a", "b", "rc"])}{rnd.randint(1, 2)}'
+        free_threaded = 't' if rnd.random() < 0.3 else ''
+        dev = '-dev' if rnd.random() < 0.2 else ''
+        string_versions.append(f'{base}{pre}{free_threaded}{dev}')
+    return string_versions
+
+
+def test_select_best_match_same_as_linear_random():
+    rnd = random.Random(0)
+    for _ in range(50):
+        entries = _make_entries(*_random_string_versions(rnd, 40))
+        index = VersionIndex(entries)
+        for requested_string_version in _random_string_versions(rnd, 40):
+            requested_version = Version.from_string_version(
+                requested_string_version)
+            assert index.select_best_match(requested_version) == (
+                _select_best_match_linear(entries, requested_version)
+            ), requested_string_version
+
+
+def _select_best_in_range_linear(entries, constraint):
+    # reference implementation
+    best_match = None
+    for version, version_dir in entries:
+        if version not in constraint:
+            continue
+        if not best_match or version > best_match[0]:
+            best_match = (version, version_dir)
+    return best_match
+
+
+@pytest.mark.parametrize('string_constraint,expected', [
+    ('>=3.10,<3.13', '3.12.10'),
+    ('>=3.12.4,<3.12.10', '3.12.4'),
+    ('>3.12.4,<3.12.10', None),
+    ('<3.12.4', '3.12.1'),
+    ('<=3.12.4', '3.12.4'),
+    ('<3', '2.7.18'),
+    ('>=3.13', '3.13.1'),
+    ('>=3.13,!=3.13.1', '3.13.0'),
+    ('==3.13', '3.13.0'),
+    ('==3.13.0', '3.13.0'),
+    ('==3.13.5', None),
+    ('>=4', None),
+    ('>=3.13.0rc1', '3.14.0a1'),
+    ('>=3.13.0rc1,<3.13', '3.13.0rc2'),
+    ('>=3.14-dev', '3.14-dev'),
+    ('>=3.14-dev,<3.14.0a1', '3.14-dev'),
+    ('t', '3.12.4t'),
+    ('t,>=3.13.0a1', '3.13.0rc2t'),
+    ('t,>=3.14-dev', '3.14t-dev'),
+    ('!=3.13.1,!=3.13,!=3.12.10', '3.12.4'),
+])
+def test_select_best_in_range(string_constraint, expected):
+    index = VersionIndex(ENTRIES)
+
+    best_match = index.select_best_in_range(
+        VersionConstraint.from_string_constraint(string_constraint))
+
+    if expected is None:
+        assert best_match is None
+    else:
+        assert best_match is not None
+        assert best_match[1] == Path(expected)
+
+
+def test_select_best_in_range_first_equal_version_wins():
+    entries = _make_entries('3.11', '3.12', '3.12.0', '3.13')
+
+    best_match = VersionIndex(entries).select_best_in_range(
+        VersionConstraint.from_string_constraint('<3.13'))
+
+    assert best_match == entries[1]
+
+
+def test_select_best_in_range_after_add():
+    index = VersionIndex(_make_entries('3.12.1'))
+    constraint = VersionConstraint.from_string_constraint('<3.13')
+    index.select_best_in_range(constraint)
+    index.add(_make_entries('3.12.2')[0])
+
+    assert index.select_best_in_range(constraint) == (
+        _make_entries('3.12.2')[0])
+
+
+def _random_string_constraints(rnd, count):
+    operators = ['<', '<=', '>', '>=', '==', '!=']
+    string_constraints = []
+    for _ in range(count):
+        clauses = [
+            f'{rnd.choice(operators)}{string_version}'
+            for string_version in _random_string_versions(
+                rnd, rnd.randint(1, 3))
+        ]
+        if rnd.random() < 0.2:
+            clauses.append('t')
+        string_constraints.append(','.join(clauses))
+    return string_constraints
+
+
+def test_select_best_in_range_same_as_linear_random():
+    rnd = random.Random(0)
+    for _ in range(50):
+        entries = _make_entries(*_random_string_versions(rnd, 40))
+        index = VersionIndex(entries)
+        for string_constraint in _random_string_constraints(rnd, 40):
+            constraint = VersionConstraint.from_string_constraint(
+                string_constraint)
+            assert index.select_best_in_range(constraint) == (
+                _select_best_in_range_linear(entries, constraint)
+            ), string_constraint
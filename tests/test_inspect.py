@@ -2,14 +2,22 @@ import logging
 
 import pytest
 
-from pyenv_inspect import find_pyenv_python_executable
-from pyenv_inspect.exceptions import UnsupportedImplementation
+from pyenv_inspect import (
+    find_all_pyenv_python_executables, find_pyenv_python_executable,
+    find_pyenv_python_executables,
+)
+from pyenv_inspect import inventory as inventory_module
+from pyenv_inspect import validation as validation_module
+from pyenv_inspect.constraint import VersionConstraint
+from pyenv_inspect.exceptions import (
+    ConstraintParseError, PathError, UnsupportedImplementation,
+)
 from pyenv_inspect.spec import PyenvPythonSpec
 
 from tests.testlib import IS_POSIX, IS_WINDOWS
 
 
-class TestFindPyenvPythonExecutable:
+class BaseTestFind:
     if IS_POSIX:
         exec_name = 'python'
         bin_dir = 'bin'
@@ -41,6 +49,9 @@ class TestFindPyenvPythonExecutable:
         link_path = self.versions_dir / name
         link_path.symlink_to(env_path)
 
+
+class TestFindPyenvPythonExecutable(BaseTestFind):
+
     @pytest.mark.parametrize('requested,expected', [
         ('3', '3.8.3'),
         (PyenvPythonSpec.from_string_spec('3'), '3.8.3'),
@@ -69,3 +80,207 @@ class TestFindPyenvPythonExecutable:
     def test_unsupported(self):
         with pytest.raises(UnsupportedImplementation):
             find_pyenv_python_executable('fakepython-3.7')
+
+    @pytest.mark.parametrize('version', ['3.7.1', '3.13.0rc2t', '3.14-dev'])
+    def test_exact_version_not_scanned(self, monkeypatch, version):
+        self.prepare_versions('3.7.2', '3.7.1', '3.13.0rc2t', '3.14-dev')
+        monkeypatch.setattr(
+            inventory_module, '_scan_versions_directory', None)
+
+        assert find_pyenv_python_executable(version) == (
+            self.versions_dir / version / self.bin_dir / self.exec_name)
+
+    def test_exact_version_fallback(self):
+        self.prepare_versions('3.7.01')
+
+        assert find_pyenv_python_executable('3.7.1') == (
+            self.versions_dir / '3.7.01' / self.bin_dir / self.exec_name)
+
+    def test_exact_version_env_link_ignored(self):
+        self.prepare_env('3.12.8', '3.12.9')
+
+        assert find_pyenv_python_executable('3.12.8') is None
+
+    @pytest.mark.parametrize('requested,expected', [
+        ('>=3.7,<3.8', '3.7.12'),
+        (VersionConstraint.from_string_constraint('>=3.7,<3.8'), '3.7.12'),
+        ('>=3.7.2,!=3.7.12,<3.8', '3.7.2'),
+        ('>=3.8', '3.8.3'),
+        ('>=3.9', None),
+        ('t,>=3.13', '3.13.1t'),
+        ('>=3.13.0rc1', '3.13.0rc2'),
+    ])
+    def test_constraint(self, requested, expected):
+        self.prepare_versions(
+            '3.7.2', '3.7.1', '3.7.12', '3.8.3', '3.13.1t', '3.13.0rc2')
+
+        result = find_pyenv_python_executable(requested)
+
+        assert result == (expected and (
+            self.versions_dir / expected / self.bin_dir / self.exec_name))
+
+    @pytest.mark.parametrize('requested', ['3.7', '3.7.12', '>=3.7'])
+    def test_broken(self, requested):
+        self.prepare_versions('3.7.2', '3.7.12')[1].unlink()
+
+        with pytest.raises(PathError):
+            find_pyenv_python_executable(requested)
+
+    @pytest.mark.parametrize('requested,expected', [
+        ('3.7', '3.7.2'),
+        ('3.7.12', None),
+        ('>=3.7', '3.7.2'),
+    ])
+    def test_broken_skipped(self, requested, expected):
+        self.prepare_versions('3.7.2', '3.7.12')[1].unlink()
+
+        result = find_pyenv_python_executable(requested, skip_broken=True)
+
+        assert result == (expected and (
+            self.versions_dir / expected / self.bin_dir / self.exec_name))
+
+    def test_constraint_parse_error(self):
+        with pytest.raises(ConstraintParseError):
+            find_pyenv_python_executable('>=3.x')
+
+
+class TestFindPyenvPythonExecutables(BaseTestFind):
+
+    def test_found(self):
+        self.prepare_versions('3.7.2', '3.7.1', '3.7.12', '3.8.3', '3.13.1t')
+        spec = PyenvPythonSpec.from_string_spec('3.7')
+
+        result = find_pyenv_python_executables(
+            ['3', spec, '3.7', '3.7.1', '3.9', '3.13t', '<3.8,>=3.7.2'])
+
+        assert result == {
+            '3': self.versions_dir / '3.8.3' / self.bin_dir / self.exec_name,
+            spec: self.versions_dir / '3.7.12' / self.bin_dir / self.exec_name,
+            '3.7': (
+                self.versions_dir / '3.7.12' / self.bin_dir / self.exec_name),
+            '3.7.1': (
+                self.versions_dir / '3.7.1' / self.bin_dir / self.exec_name),
+            '3.9': None,
+            '3.13t': (
+                self.versions_dir / '3.13.1t' / self.bin_dir / self.exec_name),
+            '<3.8,>=3.7.2': (
+                self.versions_dir / '3.7.12' / self.bin_dir / self.exec_name),
+        }
+
+    def test_scanned_once(self, monkeypatch):
+        self.prepare_versions('3.7.2', '3.8.3')
+        scan_count = 0
+        _scan = inventory_module._scan_versions_directory
+
+        def _counting_scan(versions_dir):
+            nonlocal scan_count
+            scan_count += 1
+            return _scan(versions_dir)
+
+        monkeypatch.setattr(
+            inventory_module, '_scan_versions_directory', _counting_scan)
+
+        find_pyenv_python_executables(['3.7', '3.8', '3.9', '3.10'])
+
+        assert scan_count == 1
+
+    def test_broken(self):
+        self.prepare_versions('3.7.2', '3.7.12')[1].unlink()
+
+        with pytest.raises(PathError):
+            find_pyenv_python_executables(['3.7', '3.8'])
+
+    def test_broken_skipped(self):
+        self.prepare_versions('3.7.2', '3.7.12', '3.8.1')[1].unlink()
+
+        result = find_pyenv_python_executables(
+            ['3.7', '3.7.12', '3.8'], skip_broken=True)
+
+        assert result == {
+            '3.7': self.versions_dir / '3.7.2' / self.bin_dir / self.exec_name,
+            '3.7.12': None,
+            '3.8': self.versions_dir / '3.8.1' / self.bin_dir / self.exec_name,
+        }
+
+    def test_empty(self):
+        assert find_pyenv_python_executables([]) == {}
+
+    def test_unsupported(self):
+        with pytest.raises(UnsupportedImplementation):
+            find_pyenv_python_executables(['3.7', 'fakepython-3.7'])
+
+
+class TestFindAllPyenvPythonExecutables(BaseTestFind):
+
+    @pytest.fixture(autouse=True)
+    def setup_versions(self, setup):
+        self.prepare_versions(
+            '3.7.2', '3.7.1', '3.7.12', '3.8.3', '3.8.1', '3.13.1t')
+
+    def exec_paths(self, *versions):
+        return [
+            self.versions_dir / version / self.bin_dir / self.exec_name
+            for version in versions
+        ]
+
+    @pytest.mark.parametrize('requested,expected', [
+        ('3', ['3.8.3', '3.8.1', '3.7.12', '3.7.2', '3.7.1']),
+        ('3.7', ['3.7.12', '3.7.2', '3.7.1']),
+        ('3.7.2', ['3.7.2']),
+        ('>=3.7.2,<3.8.3', ['3.8.1', '3.7.12', '3.7.2']),
+        ('3t', ['3.13.1t']),
+        ('3.9', []),
+    ])
+    def test_found(self, requested, expected):
+        result = find_all_pyenv_python_executables(requested)
+
+        assert list(result) == self.exec_paths(*expected)
+
+    @pytest.mark.parametrize('limit,expected', [
+        (0, []),
+        (1, ['3.8.3']),
+        (3, ['3.8.3', '3.8.1', '3.7.12']),
+        (100, ['3.8.3', '3.8.1', '3.7.12', '3.7.2', '3.7.1']),
+    ])
+    def test_limit(self, limit, expected):
+        result = find_all_pyenv_python_executables('3', limit)
+
+        assert list(result) == self.exec_paths(*expected)
+
+    @pytest.mark.parametrize('limit', [None, 1])
+    def test_equal_versions(self, limit):
+        self.prepare_versions('3.9', '3.9.0')
+
+        result = find_all_pyenv_python_executables('3.9', limit)
+
+        assert next(result) == find_pyenv_python_executable('3.9')
+
+    def test_broken_skipped(self):
+        self.exec_paths('3.7.12')[0].unlink()
+
+        result = find_all_pyenv_python_executables('3.7')
+
+        assert list(result) == self.exec_paths('3.7.2', '3.7.1')
+
+    def test_validated_lazily(self, monkeypatch):
+        validated = []
+        _get_path = validation_module.get_pyenv_python_executable_path
+
+        def _recording_get_path(version_dir):
+            validated.append(version_dir.name)
+            return _get_path(version_dir)
+
+        monkeypatch.setattr(
+            validation_module, 'get_pyenv_python_executable_path',
+            _recording_get_path)
+
+        result = find_all_pyenv_python_executables('3.7')
+
+        assert validated == []
+        assert next(result) == self.exec_paths('3.7.12')[0]
+        assert validated == ['3.7.12']
+
+    def test_unsupported(self):
+        # raised on the call, not on iteration
+        with pytest.raises(UnsupportedImplementation):
+            find_all_pyenv_python_executables('fakepython-3.7')
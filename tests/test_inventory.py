@@ -0,0 +1,621 @@
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from pyenv_inspect import inventory as inventory_module
+from pyenv_inspect import validation as validation_module
+from pyenv_inspect.exceptions import PathError
+from pyenv_inspect.inspect import (
+    find_pyenv_python_executable, find_pyenv_python_executables,
+)
+from pyenv_inspect.inventory import (
+    PyenvInventory, _scan_versions_directory, iter_pyenv_versions,
+)
+from pyenv_inspect.spec import PyenvPythonSpec
+from pyenv_inspect.version import Version
+
+from tests.testlib import posix_test
+
+
+class TestPyenvInventory:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch, tmp_path):
+        self.pyenv_root = tmp_path / 'pyenv_root'
+        monkeypatch.setenv('PYENV_ROOT', str(self.pyenv_root))
+        self.versions_dir = self.pyenv_root / 'versions'
+        self.versions_dir.mkdir(parents=True)
+        self.scan_count = 0
+        _scan = inventory_module._scan_versions_directory
+
+        def _counting_scan(versions_dir):
+            self.scan_count += 1
+            return _scan(versions_dir)
+
+        monkeypatch.setattr(
+            inventory_module, '_scan_versions_directory', _counting_scan)
+
+    def make_old(self):
+        # move mtime out of the racy window
+        os.utime(self.versions_dir, ns=(0, 0))
+
+    def test_entries(self):
+        (self.versions_dir / '3.12.4').mkdir()
+        (self.versions_dir / 'miniconda3-latest').mkdir()
+        inventory = PyenvInventory()
+
+        entries = inventory.get_entries()
+
+        assert entries == [
+            (Version.from_string_version('3.12.4'),
+             self.versions_dir / '3.12.4'),
+        ]
+
+    def test_explicit_versions_dir(self, tmp_path):
+        versions_dir = tmp_path / 'other'
+        versions_dir.mkdir()
+        (versions_dir / '3.11.9').mkdir()
+        inventory = PyenvInventory(versions_dir)
+
+        assert inventory.get_versions_directory() == versions_dir
+        assert inventory.get_entries() == [
+            (Version.from_string_version('3.11.9'), versions_dir / '3.11.9'),
+        ]
+
+    def test_scanned_once(self):
+        (self.versions_dir / '3.12.4').mkdir()
+        self.make_old()
+        inventory = PyenvInventory()
+
+        inventory.get_entries()
+        inventory.get_entries()
+
+        assert self.scan_count == 1
+
+    def test_rescanned_on_change(self):
+        self.make_old()
+        inventory = PyenvInventory()
+        assert inventory.get_entries() == []
+
+        (self.versions_dir / '3.12.4').mkdir()
+
+        assert len(inventory.get_entries()) == 1
+        assert self.scan_count == 2
+
+    def test_rescanned_if_racy(self):
+        inventory = PyenvInventory()
+
+        inventory.get_entries()
+        inventory.get_entries()
+
+        assert self.scan_count == 2
+
+    def test_rescanned_on_root_change(self, monkeypatch, tmp_path):
+        self.make_old()
+        inventory = PyenvInventory()
+        inventory.get_entries()
+        other_versions_dir = tmp_path / 'other_root' / 'versions'
+        other_versions_dir.mkdir(parents=True)
+        monkeypatch.setenv('PYENV_ROOT', str(other_versions_dir.parent))
+
+        inventory.get_entries()
+
+        assert self.scan_count == 2
+
+    def test_missing_versions_directory(self, tmp_path):
+        inventory = PyenvInventory(tmp_path / 'missing')
+
+        with pytest.raises(PathError, match='does not exist'):
+            inventory.get_entries()
+        assert self.scan_count == 0
+
+    def test_invalidate(self):
+        self.make_old()
+        inventory = PyenvInventory()
+        inventory.get_entries()
+
+        inventory.invalidate()
+        inventory.get_entries()
+
+        assert self.scan_count == 2
+
+    def test_deleted_executable_validated_again(self, monkeypatch):
+        version_dir = self.versions_dir / '3.12.4'
+        exec_path = version_dir / 'bin' / 'python'
+        exec_path.parent.mkdir(parents=True)
+        exec_path.touch(mode=0o755)
+        self.make_old()
+        now = time.monotonic()
+        monkeypatch.setattr(
+            validation_module.time, 'monotonic', lambda: now)
+        inventory = PyenvInventory(persistent=False)
+        assert inventory.get_executable_path(version_dir) == exec_path
+
+        exec_path.unlink()
+        now += validation_module.DEFAULT_TTL + 1
+
+        with pytest.raises(PathError):
+            inventory.get_executable_path(version_dir)
+
+    def test_valid_executable_cached(self, monkeypatch):
+        version_dir = self.versions_dir / '3.12.4'
+        exec_path = version_dir / 'bin' / 'python'
+        exec_path.parent.mkdir(parents=True)
+        exec_path.touch(mode=0o755)
+        self.make_old()
+        validation_count = 0
+        _get_path = validation_module.get_pyenv_python_executable_path
+
+        def _counting_get_path(version_dir):
+            nonlocal validation_count
+            validation_count += 1
+            return _get_path(version_dir)
+
+        monkeypatch.setattr(
+            validation_module, 'get_pyenv_python_executable_path',
+            _counting_get_path)
+        inventory = PyenvInventory(persistent=False)
+
+        for _ in range(2):
+            assert inventory.get_executable_path(version_dir) == exec_path
+
+        assert validation_count == 1
+
+
+class TestMultiRootPyenvInventory:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch, tmp_path):
+        self.user_root = tmp_path / 'user'
+        self.shared_root = tmp_path / 'shared'
+        self.user_versions_dir = self.user_root / 'versions'
+        self.shared_versions_dir = self.shared_root / 'versions'
+        for versions_dir in [self.user_versions_dir, self.shared_versions_dir]:
+            versions_dir.mkdir(parents=True)
+        monkeypatch.setenv('PYENV_ROOT', os.pathsep.join(
+            map(str, [self.user_root, self.shared_root])))
+        self.scanned = []
+        _scan = inventory_module._scan_versions_directory
+
+        def _counting_scan(versions_dir):
+            self.scanned.append(versions_dir)
+            return _scan(versions_dir)
+
+        monkeypatch.setattr(
+            inventory_module, '_scan_versions_directory', _counting_scan)
+
+    def make_version(self, versions_dir, name):
+        exec_path = versions_dir / name / 'bin' / 'python'
+        exec_path.parent.mkdir(parents=True)
+        exec_path.touch(mode=0o777)
+        return exec_path
+
+    def make_old(self):
+        for versions_dir in [self.user_versions_dir, self.shared_versions_dir]:
+            os.utime(versions_dir, ns=(0, 0))
+
+    def test_merged(self):
+        self.make_version(self.user_versions_dir, '3.13.0')
+        self.make_version(self.shared_versions_dir, '3.12.4')
+        inventory = PyenvInventory()
+
+        assert inventory.get_versions_directories() == [
+            self.user_versions_dir, self.shared_versions_dir]
+        assert sorted(inventory.get_entries()) == [
+            (Version.from_string_version('3.12.4'),
+             self.shared_versions_dir / '3.12.4'),
+            (Version.from_string_version('3.13.0'),
+             self.user_versions_dir / '3.13.0'),
+        ]
+
+    def test_priority(self):
+        exec_path = self.make_version(self.user_versions_dir, '3.12.4')
+        self.make_version(self.shared_versions_dir, '3.12.4')
+        inventory = PyenvInventory()
+
+        assert inventory.get_entries() == [
+            (Version.from_string_version('3.12.4'),
+             self.user_versions_dir / '3.12.4'),
+        ]
+        assert find_pyenv_python_executable(
+            '3.12', inventory=inventory) == exec_path
+        assert find_pyenv_python_executable(
+            '3.12.4', inventory=inventory) == exec_path
+
+    def test_equal_versions_first_root_wins(self):
+        self.make_version(self.shared_versions_dir, '3.12')
+        exec_path = self.make_version(self.user_versions_dir, '3.12.0')
+
+        assert find_pyenv_python_executable(
+            '3.12', inventory=PyenvInventory()) == exec_path
+
+    def test_exact_lookup_falls_through(self):
+        exec_path = self.make_version(self.shared_versions_dir, '3.11.9')
+
+        assert find_pyenv_python_executable(
+            '3.11.9', inventory=PyenvInventory()) == exec_path
+        assert self.scanned == []
+
+    def test_merged_once(self):
+        self.make_version(self.user_versions_dir, '3.13.0')
+        self.make_version(self.shared_versions_dir, '3.12.4')
+        self.make_old()
+        inventory = PyenvInventory()
+
+        entries = inventory.get_entries()
+
+        assert inventory.get_entries() is entries
+        assert self.scanned == [
+            self.user_versions_dir, self.shared_versions_dir]
+
+    def test_only_changed_root_rescanned(self):
+        self.make_old()
+        inventory = PyenvInventory()
+        inventory.get_entries()
+        self.scanned.clear()
+
+        self.make_version(self.user_versions_dir, '3.13.0')
+
+        assert len(inventory.get_entries()) == 1
+        assert self.scanned == [self.user_versions_dir]
+
+    def test_from_pyenv_roots(self, tmp_path):
+        self.make_version(self.shared_versions_dir, '3.12.4')
+        missing_root = tmp_path / 'missing'
+        inventory = PyenvInventory.from_pyenv_roots(
+            [missing_root, self.shared_root])
+
+        assert inventory.get_versions_directory() == missing_root / 'versions'
+        assert [path for _, path in inventory.get_entries()] == [
+            self.shared_versions_dir / '3.12.4']
+
+    def test_persistent(self, monkeypatch):
+        monkeypatch.delenv('XDG_CACHE_HOME', raising=False)
+        self.make_version(self.user_versions_dir, '3.13.0')
+        self.make_version(self.shared_versions_dir, '3.12.4')
+        self.make_old()
+        find_pyenv_python_executable(
+            '3', inventory=PyenvInventory(persistent=True))
+        self.scanned.clear()
+
+        inventory = PyenvInventory(persistent=True)
+
+        assert len(inventory.get_entries()) == 2
+        assert self.scanned == []
+        for pyenv_root in [self.user_root, self.shared_root]:
+            assert (pyenv_root / '.pyenv-inspect' / 'inventory.json').exists()
+
+    def test_iter_pyenv_versions(self):
+        self.make_version(self.user_versions_dir, '3.12.4')
+        self.make_version(self.shared_versions_dir, '3.12.4')
+        self.make_version(self.shared_versions_dir, '3.11.9')
+
+        assert [path for _, _, path in iter_pyenv_versions()] == [
+            self.user_versions_dir / '3.12.4',
+            self.shared_versions_dir / '3.11.9',
+        ]
+
+
+class TestPersistentPyenvInventory:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch, tmp_path):
+        monkeypatch.delenv('XDG_CACHE_HOME', raising=False)
+        self.pyenv_root = tmp_path / 'pyenv_root'
+        self.versions_dir = self.pyenv_root / 'versions'
+        self.version_dir = self.versions_dir / '3.13.0rc2t'
+        exec_path = self.version_dir / 'bin' / 'python'
+        exec_path.parent.mkdir(parents=True)
+        exec_path.touch(mode=0o777)
+        os.utime(self.versions_dir, ns=(0, 0))
+        self.scan_count = 0
+        _scan = inventory_module._scan_versions_directory
+
+        def _counting_scan(versions_dir):
+            self.scan_count += 1
+            return _scan(versions_dir)
+
+        monkeypatch.setattr(
+            inventory_module, '_scan_versions_directory', _counting_scan)
+
+    def warm_up(self):
+        inventory = PyenvInventory(self.versions_dir, persistent=True)
+        inventory.get_entries()
+        inventory.get_executable_path(self.version_dir)
+        return inventory
+
+    def test_cache_file_written_once_per_lookup(self, monkeypatch):
+        for name in ['3.11.9', '3.12.4', '3.13.0']:
+            exec_path = self.versions_dir / name / 'bin' / 'python'
+            exec_path.parent.mkdir(parents=True)
+            exec_path.touch(mode=0o777)
+        os.utime(self.versions_dir, ns=(0, 0))
+        write_count = 0
+        _write_cache_file = inventory_module.write_cache_file
+
+        def _counting_write_cache_file(path, data):
+            nonlocal write_count
+            write_count += 1
+            _write_cache_file(path, data)
+
+        monkeypatch.setattr(
+            inventory_module, 'write_cache_file', _counting_write_cache_file)
+        inventory = PyenvInventory(self.versions_dir, persistent=True)
+
+        exec_paths = find_pyenv_python_executables(
+            ['3.11', '3.12', '3.13', '3.13.0rc2t', '3.12.4', '3'],
+            inventory=inventory)
+
+        assert write_count == 1
+        loaded_inventory = PyenvInventory(self.versions_dir, persistent=True)
+        loaded_inventory.get_entries()
+        assert set(loaded_inventory._executables.values()) == set(
+            exec_paths.values())
+        assert len(set(exec_paths.values())) == 4
+
+    def test_cache_file_location(self):
+        self.warm_up()
+
+        assert (self.pyenv_root / '.pyenv-inspect' / 'inventory.json').exists()
+
+    def test_cache_file_location_xdg(self, monkeypatch, tmp_path):
+        cache_home = tmp_path / 'cache_home'
+        monkeypatch.setenv('XDG_CACHE_HOME', str(cache_home))
+
+        self.warm_up()
+
+        assert not (self.pyenv_root / '.pyenv-inspect').exists()
+        assert len(list(cache_home.glob('pyenv-inspect/*/inventory.json')))
+
+    def test_loaded_from_cache(self, monkeypatch):
+        warm_inventory = self.warm_up()
+        monkeypatch.setattr(
+            validation_module, 'get_pyenv_python_executable_path', None)
+        inventory = PyenvInventory(self.versions_dir, persistent=True)
+
+        entries = inventory.get_entries()
+        exec_path = inventory.get_executable_path(self.version_dir)
+
+        assert self.scan_count == 1
+        assert entries == warm_inventory.get_entries()
+        assert entries[0][0].pre == ('rc', 2)
+        assert entries[0][0].free_threaded is True
+        assert exec_path == self.version_dir / 'bin' / 'python'
+
+    def test_stale_cache_ignored(self):
+        self.warm_up()
+        (self.versions_dir / '3.12.4').mkdir()
+        os.utime(self.versions_dir, ns=(1, 1))
+        inventory = PyenvInventory(self.versions_dir, persistent=True)
+
+        assert len(inventory.get_entries()) == 2
+        assert self.scan_count == 2
+
+    def test_corrupted_cache_ignored(self):
+        self.warm_up()
+        cache_path = self.pyenv_root / '.pyenv-inspect' / 'inventory.json'
+        cache_path.write_text('{"format": 1, "entries": ')
+        inventory = PyenvInventory(self.versions_dir, persistent=True)
+
+        assert len(inventory.get_entries()) == 1
+        assert self.scan_count == 2
+
+    def test_deleted_executable_not_loaded_from_cache(self):
+        self.warm_up()
+        (self.version_dir / 'bin' / 'python').unlink()
+        inventory = PyenvInventory(self.versions_dir, persistent=True)
+        inventory.get_entries()
+
+        with pytest.raises(PathError):
+            inventory.get_executable_path(self.version_dir)
+        assert self.scan_count == 1
+
+    def test_invalidate_removes_cache_file(self):
+        inventory = self.warm_up()
+        cache_path = self.pyenv_root / '.pyenv-inspect' / 'inventory.json'
+        assert cache_path.exists()
+
+        inventory.invalidate()
+        inventory.get_entries()
+
+        assert self.scan_count == 2
+
+    def test_enabled_by_env_var(self, monkeypatch):
+        monkeypatch.delenv('PYENV_INSPECT_CACHE', raising=False)
+        inventory = PyenvInventory(self.versions_dir)
+        assert inventory.is_persistent() is False
+
+        monkeypatch.setenv('PYENV_INSPECT_CACHE', '1')
+
+        assert inventory.is_persistent() is True
+
+
+@posix_test
+class TestScanVersionsDirectory:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.versions_dir = tmp_path / 'versions'
+        self.versions_dir.mkdir()
+
+    def scan(self, versions_dir=None):
+        return [
+            version_dir.name for _, version_dir
+            in _scan_versions_directory(versions_dir or self.versions_dir)
+        ]
+
+    def prepare_env(self, name, version, *, relative=False):
+        env_path = self.versions_dir / version / 'envs' / name
+        env_path.mkdir(parents=True)
+        link_path = self.versions_dir / name
+        if relative:
+            link_path.symlink_to(Path(version) / 'envs' / name)
+        else:
+            link_path.symlink_to(env_path)
+
+    @pytest.mark.parametrize('relative', [False, True])
+    def test_env_links_skipped(self, relative):
+        self.prepare_env('3.12-env', '3.12.9', relative=relative)
+
+        assert self.scan() == ['3.12.9']
+
+    def test_env_links_via_symlinked_root_skipped(self, tmp_path):
+        self.prepare_env('3.12-env', '3.12.9')
+        root_link = tmp_path / 'root_link'
+        root_link.symlink_to(self.versions_dir)
+        env_link = self.versions_dir / '3.12-env'
+        env_link.unlink()
+        env_link.symlink_to(root_link / '3.12.9' / 'envs' / '3.12-env')
+
+        assert self.scan() == ['3.12.9']
+
+    def test_other_links_kept(self):
+        (self.versions_dir / '3.12.9').mkdir()
+        (self.versions_dir / '3.12').symlink_to('3.12.9')
+        # the name of the env does not match the name of the link
+        self.prepare_env('3.11-env', '3.11.9')
+        (self.versions_dir / '3.11').symlink_to(
+            self.versions_dir / '3.11.9' / 'envs' / '3.11-env')
+
+        assert sorted(self.scan()) == [
+            '3.11', '3.11.9', '3.12', '3.12.9']
+
+    def test_syscalls_per_entry(self, monkeypatch):
+        for patch in range(50):
+            (self.versions_dir / f'3.12.{patch}').mkdir()
+        for index in range(5):
+            self.prepare_env(f'3.11-env{index}', '3.11.9')
+        calls = Counter()
+
+        def counting(name, func):
+            def wrapper(*args, **kwargs):
+                calls[name] += 1
+                return func(*args, **kwargs)
+            return wrapper
+
+        for name in ['stat', 'lstat', 'readlink']:
+            monkeypatch.setattr(os, name, counting(name, getattr(os, name)))
+        monkeypatch.setattr(
+            Path, 'resolve', counting('resolve', Path.resolve))
+        monkeypatch.setattr(
+            Path, 'is_symlink', counting('is_symlink', Path.is_symlink))
+
+        assert len(self.scan()) == 51
+        # one readlink per symlink, nothing for regular directories
+        assert calls == {'readlink': 5}
+
+
+class TestIterPyenvVersions:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch, tmp_path):
+        self.pyenv_root = tmp_path / 'pyenv_root'
+        monkeypatch.setenv('PYENV_ROOT', str(self.pyenv_root))
+        self.versions_dir = self.pyenv_root / 'versions'
+        self.versions_dir.mkdir(parents=True)
+
+    def test_yields_spec_version_path(self):
+        (self.versions_dir / '3.13.0t').mkdir()
+        (self.versions_dir / 'pypy3.10-7.3.15').mkdir()
+        (self.versions_dir / '3.x').mkdir()
+
+        assert list(iter_pyenv_versions()) == [(
+            PyenvPythonSpec.from_string_spec('3.13.0t'),
+            Version.from_string_version('3.13.0t'),
+            self.versions_dir / '3.13.0t',
+        )]
+
+    def test_explicit_versions_dir(self, tmp_path):
+        (tmp_path / '3.12.4').mkdir()
+
+        assert [path for _, _, path in iter_pyenv_versions(tmp_path)] == [
+            tmp_path / '3.12.4']
+
+    def test_lazy(self, monkeypatch):
+        for patch in range(10):
+            (self.versions_dir / f'3.12.{patch}').mkdir()
+        parsed = []
+        _from_string_spec = PyenvPythonSpec.from_string_spec
+
+        def from_string_spec(string_spec):
+            parsed.append(string_spec)
+            return _from_string_spec(string_spec)
+
+        monkeypatch.setattr(
+            PyenvPythonSpec, 'from_string_spec', from_string_spec)
+
+        iterator = iter_pyenv_versions()
+        assert parsed == []
+        next(iterator)
+        assert len(parsed) == 1
+        iterator.close()
+
+
+class TestPyenvInventoryThreadSafety:
+    thread_count = 32
+    iterations = 5
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch, tmp_path):
+        self.versions_dir = tmp_path / 'versions'
+        for minor in range(8, 15):
+            for patch in range(20):
+                version_dir = self.versions_dir / f'3.{minor}.{patch}'
+                exec_path = version_dir / 'bin' / 'python'
+                exec_path.parent.mkdir(parents=True)
+                exec_path.touch(mode=0o777)
+        (self.versions_dir / 'miniconda3-latest').mkdir()
+        self.scan_count = 0
+        self.scan_count_lock = threading.Lock()
+        _scan = inventory_module._scan_versions_directory
+
+        def _slow_counting_scan(versions_dir):
+            with self.scan_count_lock:
+                self.scan_count += 1
+            time.sleep(0.005)
+            return _scan(versions_dir)
+
+        monkeypatch.setattr(
+            inventory_module, '_scan_versions_directory', _slow_counting_scan)
+
+    def run_threads(self, inventory):
+        barrier = threading.Barrier(self.thread_count)
+        specs = ['3', '3.12', '3.9.5', '3.13']
+
+        def resolve():
+            barrier.wait()
+            results = set()
+            for _ in range(self.iterations):
+                results.add(tuple(
+                    find_pyenv_python_executable(spec, inventory=inventory)
+                    for spec in specs
+                ))
+            return results
+
+        with ThreadPoolExecutor(self.thread_count) as executor:
+            futures = [
+                executor.submit(resolve) for _ in range(self.thread_count)]
+            results = set()
+            for future in futures:
+                results.update(future.result())
+        assert results == {tuple(
+            self.versions_dir / version / 'bin' / 'python'
+            for version in ['3.14.19', '3.12.19', '3.9.5', '3.13.19']
+        )}
+
+    def test_single_scan(self):
+        os.utime(self.versions_dir, ns=(0, 0))
+
+        self.run_threads(PyenvInventory(self.versions_dir))
+
+        assert self.scan_count == 1
+
+    def test_racy(self):
+        # the racy state is rescanned on every call, so scans and lookups
+        # are interleaved
+        self.run_threads(PyenvInventory(self.versions_dir))
@@ -0,0 +1,179 @@
+import sys
+import sysconfig
+from pathlib import Path
+
+import pytest
+
+from pyenv_inspect.metadata import StaticInterpreterInfo, read_static_metadata
+from pyenv_inspect.version import Version
+
+
+def make_patchlevel(path, py_version):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        '#define PY_MAJOR_VERSION        3\n'
+        f'#define PY_VERSION              "{py_version}"\n'
+    )
+
+
+def make_sysconfigdata(path, build_vars):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lines = [f'    {key!r}: {value!r},' for key, value in build_vars.items()]
+    path.write_text(
+        '# system configuration generated and used by the sysconfig module\n'
+        'build_time_vars = {\n' + '\n'.join(lines) + '\n}\n'
+    )
+
+
+def test_free_threaded(tmp_path):
+    version_dir = tmp_path / '3.13.0rc2t'
+    make_patchlevel(
+        version_dir / 'include' / 'python3.13t' / 'patchlevel.h', '3.13.0rc2')
+    lib_dir = version_dir / 'lib' / 'python3.13t'
+    make_sysconfigdata(
+        lib_dir / '_sysconfigdata_t_linux_x86_64-linux-gnu.py', {
+            'ABIFLAGS': 't',
+            'CFLAGS': '-O2, -Wall }',
+            'MACHDEP': 'linux',
+            'MULTIARCH': 'x86_64-linux-gnu',
+            'Py_DEBUG': 0,
+            'Py_GIL_DISABLED': 1,
+            'SOABI': 'cpython-313t-x86_64-linux-gnu',
+        },
+    )
+
+    info = read_static_metadata(version_dir)
+
+    assert info == StaticInterpreterInfo(
+        version_dir=version_dir,
+        version=Version.from_string_version('3.13.0rc2t'),
+        patchlevel='3.13.0rc2',
+        abiflags='t',
+        free_threaded=True,
+        debug=False,
+        platform='linux',
+        multiarch='x86_64-linux-gnu',
+        soabi='cpython-313t-x86_64-linux-gnu',
+    )
+
+
+def test_first_line_format(tmp_path):
+    # older versions print the first key on the same line
+    version_dir = tmp_path / '3.6.15'
+    path = (
+        version_dir / 'lib' / 'python3.6'
+        / '_sysconfigdata_m_linux_x86_64-linux-gnu.py'
+    )
+    path.parent.mkdir(parents=True)
+    path.write_text(
+        "build_time_vars = {'ABIFLAGS': 'm',\n"
+        " 'Py_DEBUG': 0,\n"
+        " 'SOABI': 'cpython-36m-x86_64-linux-gnu'}\n"
+    )
+
+    info = read_static_metadata(version_dir)
+
+    assert info.abiflags == 'm'
+    assert info.soabi == 'cpython-36m-x86_64-linux-gnu'
+    assert info.free_threaded is False
+
+
+def test_python27(tmp_path):
+    version_dir = tmp_path / '2.7.18'
+    make_patchlevel(
+        version_dir / 'include' / 'python2.7' / 'patchlevel.h', '2.7.18')
+    make_sysconfigdata(
+        version_dir / 'lib' / 'python2.7' / '_sysconfigdata.py',
+        {'MACHDEP': 'linux2', 'Py_DEBUG': 0},
+    )
+
+    info = read_static_metadata(version_dir)
+
+    assert info.version == Version.from_string_version('2.7.18')
+    assert info.abiflags is None
+    assert info.platform == 'linux2'
+    assert info.free_threaded is False
+
+
+def test_debug_from_abiflags(tmp_path):
+    version_dir = tmp_path / '3.12.4'
+    make_sysconfigdata(
+        version_dir / 'lib' / 'python3.12'
+        / '_sysconfigdata_d_linux_x86_64-linux-gnu.py',
+        {},
+    )
+
+    info = read_static_metadata(version_dir)
+
+    assert info.abiflags == 'd'
+    assert info.debug is True
+    assert info.platform == 'linux'
+
+
+def test_dev_version(tmp_path):
+    version_dir = tmp_path / '3.14-dev'
+    make_patchlevel(
+        version_dir / 'include' / 'python3.14' / 'patchlevel.h', '3.14.0a7+')
+
+    info = read_static_metadata(version_dir)
+
+    assert info.patchlevel == '3.14.0a7+'
+    assert info.version == Version(base=(3, 14, 0), pre=('a', 7), dev=True)
+
+
+def test_windows_layout(tmp_path):
+    version_dir = tmp_path / '3.12.4'
+    make_patchlevel(version_dir / 'include' / 'patchlevel.h', '3.12.4')
+
+    info = read_static_metadata(version_dir)
+
+    assert info.patchlevel == '3.12.4'
+    assert info.abiflags is None
+
+
+def test_free_threaded_binary_name(tmp_path):
+    version_dir = tmp_path / '3.13.1'
+    (version_dir / 'bin').mkdir(parents=True)
+    (version_dir / 'bin' / 'python3.13t').touch()
+
+    info = read_static_metadata(version_dir)
+
+    assert info.free_threaded is True
+    assert info.version == Version.from_string_version('3.13.1t')
+
+
+def test_truncated_patchlevel(tmp_path):
+    version_dir = tmp_path / '3.12.4'
+    path = version_dir / 'include' / 'python3.12' / 'patchlevel.h'
+    path.parent.mkdir(parents=True)
+    path.write_text('#define PY_MAJOR_VERSION 3\n#define PY_VERSION')
+
+    info = read_static_metadata(version_dir)
+
+    assert info.patchlevel is None
+    assert info.version == Version.from_string_version('3.12.4')
+
+
+def test_empty(tmp_path):
+    version_dir = tmp_path / '3.12'
+    version_dir.mkdir()
+
+    info = read_static_metadata(version_dir)
+
+    assert info.version == Version.from_string_version('3.12')
+    assert info.patchlevel is None
+    assert info.soabi is None
+
+
+def test_current_interpreter():
+    prefix = Path(sys.base_prefix)
+    if not list(prefix.glob('include/python*/patchlevel.h')):
+        pytest.skip('headers are not installed')
+
+    info = read_static_metadata(prefix, Version(base=sys.version_info[:2]))
+
+    assert info.version.base == tuple(sys.version_info[:3])
+    assert info.free_threaded is bool(
+        sysconfig.get_config_var('Py_GIL_DISABLED'))
+    if info.soabi is not None:
+        assert info.soabi == sysconfig.get_config_var('SOABI')
@@ -1,11 +1,12 @@
+import os
 import re
 
 import pytest
 
 from pyenv_inspect.exceptions import PathError
 from pyenv_inspect.path import (
-    get_pyenv_python_executable_path, get_pyenv_root,
-    get_pyenv_versions_directory,
+    get_pyenv_python_executable_path, get_pyenv_root, get_pyenv_roots,
+    get_pyenv_versions_directories, get_pyenv_versions_directory,
 )
 
 from tests.testlib import posix_test, windows_test
@@ -93,6 +94,67 @@ class TestGetPyenvRootWindows(BaseTestGetPyenvRoot):
         assert get_pyenv_root() == pyenv_root_custom
 
 
+class TestGetPyenvRoots:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch, tmp_path):
+        self.user_root = tmp_path / 'user'
+        self.shared_root = tmp_path / 'shared'
+        for pyenv_root in [self.user_root, self.shared_root]:
+            (pyenv_root / 'versions').mkdir(parents=True)
+        self.env_var = 'PYENV_ROOT'
+        for env_var in ['PYENV_ROOT', 'PYENV_HOME', 'PYENV']:
+            monkeypatch.delenv(env_var, raising=False)
+        self.monkeypatch = monkeypatch
+
+    def set_roots(self, *pyenv_roots):
+        self.monkeypatch.setenv(
+            self.env_var, os.pathsep.join(map(str, pyenv_roots)))
+
+    def test_single(self):
+        self.set_roots(self.user_root)
+
+        assert get_pyenv_roots() == [self.user_root]
+
+    def test_several(self):
+        self.set_roots(self.user_root, '', self.shared_root)
+
+        assert get_pyenv_roots() == [self.user_root, self.shared_root]
+        assert get_pyenv_root() == self.user_root
+        assert get_pyenv_versions_directory() == self.user_root / 'versions'
+        assert get_pyenv_versions_directories() == [
+            self.user_root / 'versions', self.shared_root / 'versions']
+
+    def test_missing_skipped(self, tmp_path):
+        self.set_roots(tmp_path / 'missing', self.shared_root)
+
+        assert get_pyenv_roots() == [self.shared_root]
+
+    def test_error_none_exists(self, tmp_path):
+        self.set_roots(tmp_path / 'missing', tmp_path / 'missing2')
+        message = f'pyenv root does not exist: {tmp_path / "missing"}'
+
+        with pytest.raises(PathError, match=re.escape(message)):
+            get_pyenv_roots()
+
+    def test_versions_directory_missing_skipped(self):
+        (self.user_root / 'versions').rmdir()
+        self.set_roots(self.user_root, self.shared_root)
+
+        assert get_pyenv_versions_directories() == [
+            self.shared_root / 'versions']
+
+    def test_error_no_versions_directory(self):
+        (self.user_root / 'versions').rmdir()
+        (self.shared_root / 'versions').rmdir()
+        self.set_roots(self.user_root, self.shared_root)
+        versions_dir = self.user_root / 'versions'
+        message = f'pyenv versions path does not exist: {versions_dir}'
+
+        with pytest.raises(PathError, match=re.escape(message)):
+            get_pyenv_versions_directories()
+
+
 class TestGetPyenvVersionsDirectory:
 
     @pytest.fixture
@@ -186,6 +248,36 @@ class TestGetPyenvPythonExecutablePathPOSIX(
         with pytest.raises(PathError, match=re.escape(message)):
             get_pyenv_python_executable_path(version_dir)
 
+    def test_symlink_resolved(self, version_dir, exec_path):
+        target = exec_path.parent / 'python3.10'
+        target.touch(mode=0o755)
+        exec_path.symlink_to(target.name)
+
+        assert get_pyenv_python_executable_path(version_dir) == target
+
+    def test_error_broken_symlink(self, version_dir, exec_path):
+        exec_path.symlink_to('python3.10')
+        message = f'pyenv python binary does not exist: {version_dir}'
+
+        with pytest.raises(PathError, match=re.escape(message)):
+            get_pyenv_python_executable_path(version_dir)
+
+    def test_error_access_denied(self, monkeypatch, version_dir, exec_path):
+        # e.g., a noexec mount
+        exec_path.touch(mode=0o755)
+        monkeypatch.setattr(os, 'access', lambda path, mode: False)
+        message = f'pyenv python binary is not executable: {version_dir}'
+
+        with pytest.raises(PathError, match=re.escape(message)):
+            get_pyenv_python_executable_path(version_dir)
+
+    def test_error_symlink_loop(self, version_dir, exec_path):
+        exec_path.symlink_to(exec_path.name)
+        message = f'pyenv python binary is not accessible: {version_dir}'
+
+        with pytest.raises(PathError, match=re.escape(message)):
+            get_pyenv_python_executable_path(version_dir)
+
 
 @windows_test
 class TestGetPyenvPythonExecutablePathWindows(
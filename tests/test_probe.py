@@ -0,0 +1,165 @@
+import json
+import os
+import platform
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from pyenv_inspect import probe as probe_module
+from pyenv_inspect.exceptions import ProbeError
+from pyenv_inspect.probe import (
+    InterpreterInfo, probe_python_executable, probe_python_executables,
+)
+from pyenv_inspect.version import Version
+
+from tests.testlib import posix_test
+
+
+FAKE_OUTPUT = {
+    'version_info': [3, 13, 0, 'candidate', 2],
+    'implementation': 'cpython',
+    'abiflags': 't',
+    'gil_disabled': True,
+    'platform': 'linux-x86_64',
+    'machine': 'x86_64',
+    'pointer_bits': 64,
+}
+
+
+@pytest.fixture(autouse=True)
+def setup(monkeypatch, tmp_path):
+    monkeypatch.setattr(probe_module, '_memory_cache', {})
+    monkeypatch.delenv('PYENV_INSPECT_CACHE', raising=False)
+    monkeypatch.delenv('XDG_CACHE_HOME', raising=False)
+    pyenv_root = tmp_path / 'pyenv_root'
+    pyenv_root.mkdir()
+    monkeypatch.setenv('PYENV_ROOT', str(pyenv_root))
+
+
+@pytest.fixture
+def probe_count(monkeypatch):
+    calls = []
+    _run = subprocess.run
+
+    def counting_run(args, **kwargs):
+        calls.append(args[0])
+        return _run(args, **kwargs)
+
+    monkeypatch.setattr(subprocess, 'run', counting_run)
+    return calls
+
+
+def make_fake_python(path, output):
+    path.write_text(f"#!/bin/sh\necho '{json.dumps(output)}'\n")
+    path.chmod(0o755)
+    return path
+
+
+def test_probe_current_interpreter():
+    exec_path = Path(sys.executable)
+
+    info = probe_python_executable(exec_path)
+
+    assert info.executable == exec_path
+    assert info.version.base == tuple(sys.version_info[:3])
+    assert info.implementation == platform.python_implementation().lower()
+    assert info.machine == platform.machine()
+
+
+@posix_test
+def test_probe_fake_interpreter(tmp_path):
+    exec_path = make_fake_python(tmp_path / 'python', FAKE_OUTPUT)
+
+    info = probe_python_executable(exec_path)
+
+    assert info == InterpreterInfo(
+        executable=exec_path,
+        version=Version.from_string_version('3.13.0rc2t'),
+        implementation='cpython',
+        abiflags='t',
+        free_threaded=True,
+        platform='linux-x86_64',
+        machine='x86_64',
+        pointer_bits=64,
+    )
+
+
+@posix_test
+def test_cached_in_memory(tmp_path, probe_count):
+    exec_path = make_fake_python(tmp_path / 'python', FAKE_OUTPUT)
+
+    info1 = probe_python_executable(exec_path)
+    info2 = probe_python_executable(exec_path)
+
+    assert info1 is info2
+    assert len(probe_count) == 1
+
+
+@posix_test
+def test_cache_invalidated_on_change(tmp_path, probe_count):
+    exec_path = make_fake_python(tmp_path / 'python', FAKE_OUTPUT)
+    probe_python_executable(exec_path)
+    make_fake_python(exec_path, {**FAKE_OUTPUT, 'machine': 'arm64'})
+
+    info = probe_python_executable(exec_path)
+
+    assert info.machine == 'arm64'
+    assert len(probe_count) == 2
+
+
+@posix_test
+def test_cached_on_disk(monkeypatch, tmp_path, probe_count):
+    exec_path = make_fake_python(tmp_path / 'python', FAKE_OUTPUT)
+    info = probe_python_executable(exec_path, cache=True)
+    monkeypatch.setattr(probe_module, '_memory_cache', {})
+
+    assert probe_python_executable(exec_path, cache=True) == info
+    assert len(probe_count) == 1
+    assert (tmp_path / 'pyenv_root' / '.pyenv-inspect' / 'probe.json').exists()
+
+
+@posix_test
+def test_probe_many(tmp_path, probe_count):
+    exec_paths = [
+        make_fake_python(tmp_path / f'python{index}', {
+            **FAKE_OUTPUT, 'version_info': [3, index, 1, 'final', 0],
+        })
+        for index in range(8)
+    ]
+    broken_path = tmp_path / 'broken'
+    broken_path.write_text('#!/bin/sh\necho oops\n')
+    broken_path.chmod(0o755)
+
+    results = probe_python_executables(
+        [*exec_paths, broken_path, tmp_path / 'missing'], max_workers=4)
+
+    assert [str(results[path].version) for path in exec_paths] == [
+        f'3.{index}.1t' for index in range(8)]
+    assert isinstance(results[broken_path], ProbeError)
+    assert isinstance(results[tmp_path / 'missing'], ProbeError)
+    assert len(probe_count) == 9
+
+
+@pytest.mark.parametrize('exec_name', ['missing', 'not_executable'])
+def test_probe_error(tmp_path, exec_name):
+    (tmp_path / 'not_executable').touch(mode=0o644)
+
+    with pytest.raises(ProbeError):
+        probe_python_executable(tmp_path / exec_name)
+
+
+def test_info_dict_roundtrip():
+    info = InterpreterInfo(
+        executable=Path(os.sep, 'python'),
+        version=Version.from_string_version('3.12.4'),
+        implementation='cpython',
+        abiflags='',
+        free_threaded=False,
+        platform='linux-x86_64',
+        machine='x86_64',
+        pointer_bits=64,
+    )
+
+    assert InterpreterInfo.from_dict(info.to_dict()) == info
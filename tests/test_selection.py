@@ -0,0 +1,198 @@
+import pytest
+
+from pyenv_inspect.selection import (
+    PyenvVersionSelection, PyenvVersionSelector,
+    find_selected_pyenv_python_executable, read_version_file,
+)
+
+from tests.test_inspect import BaseTestFind
+from tests.testlib import posix_test
+
+
+class TestPyenvVersionSelector:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch, tmp_path):
+        monkeypatch.delenv('PYENV_VERSION', raising=False)
+        self.pyenv_root = tmp_path / 'pyenv_root'
+        self.pyenv_root.mkdir()
+        monkeypatch.setenv('PYENV_ROOT', str(self.pyenv_root))
+        self.project_dir = tmp_path / 'project'
+        self.sub_dir = self.project_dir / 'src' / 'package'
+        self.sub_dir.mkdir(parents=True)
+        self.selector = PyenvVersionSelector()
+
+    def test_env_var(self, monkeypatch):
+        monkeypatch.setenv('PYENV_VERSION', '3.12.4:3.11')
+        (self.project_dir / '.python-version').write_text('3.10\n')
+
+        selection = self.selector.get_selection(self.sub_dir)
+
+        assert selection == PyenvVersionSelection(
+            ('3.12.4', '3.11'), 'PYENV_VERSION environment variable')
+
+    def test_local(self):
+        version_file = self.project_dir / '.python-version'
+        version_file.write_text('3.12\n3.11.9\n')
+        (self.pyenv_root / 'version').write_text('3.10\n')
+
+        selection = self.selector.get_selection(self.sub_dir)
+
+        assert selection == PyenvVersionSelection(
+            ('3.12', '3.11.9'), str(version_file))
+
+    def test_nearest_local(self):
+        (self.project_dir / '.python-version').write_text('3.12\n')
+        version_file = self.sub_dir / '.python-version'
+        version_file.write_text('3.11\n')
+
+        selection = self.selector.get_selection(self.sub_dir)
+
+        assert selection == PyenvVersionSelection(
+            ('3.11',), str(version_file))
+
+    def test_global(self):
+        version_file = self.pyenv_root / 'version'
+        version_file.write_text('3.10.14\n')
+
+        selection = self.selector.get_selection(self.sub_dir)
+
+        assert selection == PyenvVersionSelection(
+            ('3.10.14',), str(version_file))
+
+    def test_system(self):
+        selection = self.selector.get_selection(self.sub_dir)
+
+        assert selection == PyenvVersionSelection(
+            ('system',), str(self.pyenv_root / 'version'))
+
+    def test_empty_local_is_system(self):
+        version_file = self.project_dir / '.python-version'
+        version_file.write_text('# comment\n')
+        (self.pyenv_root / 'version').write_text('3.10\n')
+
+        selection = self.selector.get_selection(self.sub_dir)
+
+        assert selection == PyenvVersionSelection(
+            ('system',), str(version_file))
+
+    def test_current_directory(self, monkeypatch):
+        (self.project_dir / '.python-version').write_text('3.12\n')
+        monkeypatch.chdir(self.sub_dir)
+
+        assert self.selector.get_selection().names == ('3.12',)
+
+    def test_cached(self):
+        (self.project_dir / '.python-version').write_text('3.12\n')
+        assert self.selector.get_selection(self.sub_dir).names == ('3.12',)
+
+        (self.sub_dir / '.python-version').write_text('3.11\n')
+        (self.project_dir / '.python-version').write_text('3.10\n')
+
+        assert self.selector.get_selection(self.sub_dir).names == ('3.12',)
+        assert self.selector.get_selection(
+            self.project_dir / 'src').names == ('3.12',)
+        self.selector.invalidate()
+        assert self.selector.get_selection(self.sub_dir).names == ('3.11',)
+        assert self.selector.get_selection(
+            self.project_dir).names == ('3.10',)
+
+    def test_walk_cached_for_parents(self, monkeypatch):
+        (self.project_dir / '.python-version').write_text('3.12\n')
+        self.selector.get_selection(self.sub_dir)
+        checked = []
+        monkeypatch.setattr(
+            'os.path.isfile', lambda path: checked.append(path) or False)
+
+        self.selector.get_selection(self.project_dir / 'src' / 'other')
+
+        assert checked == [
+            str(self.project_dir / 'src' / 'other' / '.python-version')]
+
+    def test_no_ttl(self):
+        selector = PyenvVersionSelector(ttl=0)
+        (self.project_dir / '.python-version').write_text('3.12\n')
+        assert selector.get_selection(self.sub_dir).names == ('3.12',)
+
+        (self.project_dir / '.python-version').write_text('3.11\n')
+
+        assert selector.get_selection(self.sub_dir).names == ('3.11',)
+
+    def test_explicit_pyenv_root(self, tmp_path):
+        pyenv_root = tmp_path / 'other_root'
+        pyenv_root.mkdir()
+        (pyenv_root / 'version').write_text('3.9\n')
+        selector = PyenvVersionSelector(pyenv_root)
+
+        assert selector.get_selection(self.sub_dir).names == ('3.9',)
+
+
+def test_read_version_file(tmp_path):
+    version_file = tmp_path / '.python-version'
+    version_file.write_text(
+        '# comment\n\n  3.12.4  trailing words\n../3.11\n..\r\n3.11\r\n'
+        'pypy3.10-7.3.15')
+
+    assert read_version_file(version_file) == (
+        '3.12.4', '3.11', 'pypy3.10-7.3.15')
+
+
+def test_read_version_file_missing(tmp_path):
+    assert read_version_file(tmp_path / 'version') == ()
+
+
+class TestFindSelectedPyenvPythonExecutable(BaseTestFind):
+
+    @pytest.fixture(autouse=True)
+    def setup_selection(self, monkeypatch, tmp_path):
+        monkeypatch.delenv('PYENV_VERSION', raising=False)
+        self.project_dir = tmp_path / 'project'
+        self.project_dir.mkdir()
+        self.selector = PyenvVersionSelector(ttl=0)
+
+    def find(self):
+        return find_selected_pyenv_python_executable(
+            self.project_dir, selector=self.selector)
+
+    def select(self, *names):
+        (self.project_dir / '.python-version').write_text(
+            ''.join(f'{name}\n' for name in names))
+
+    def test_prefix(self):
+        self.prepare_versions('3.12.1', '3.12.4', '3.13.0')
+        self.select('3.12')
+
+        assert self.find() == (
+            self.versions_dir / '3.12.4' / self.bin_dir / self.exec_name)
+
+    def test_first_installed(self):
+        self.prepare_versions('3.11.9')
+        self.select('3.12', 'pypy3.10-7.3.15', '3.11')
+
+        assert self.find() == (
+            self.versions_dir / '3.11.9' / self.bin_dir / self.exec_name)
+
+    def test_system(self):
+        self.prepare_versions('3.11.9')
+        self.select('system', '3.11')
+
+        assert self.find() is None
+
+    def test_installed_unsupported(self):
+        self.prepare_versions('3.12.4')
+        (self.versions_dir / 'pypy3.10-7.3.15').mkdir()
+        self.select('pypy3.10-7.3.15', '3.12')
+
+        assert self.find() is None
+
+    @posix_test
+    def test_installed_virtualenv(self):
+        self.prepare_env('myenv', '3.12.4')
+        self.select('myenv', '3.12')
+
+        assert self.find() is None
+
+    def test_not_installed(self):
+        self.select('3.12')
+
+        assert self.find() is None
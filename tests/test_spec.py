@@ -2,6 +2,7 @@ import pytest
 
 from pyenv_inspect.exceptions import UnsupportedImplementation
 from pyenv_inspect.spec import Implementation, PyenvPythonSpec
+from pyenv_inspect.version import Version
 
 from tests.testlib import spec_fixture
 
@@ -46,3 +47,28 @@ def test_is_not_supported_raise_exception():
 
     with pytest.raises(UnsupportedImplementation):
         spec.is_supported(raise_exception=True)
+
+
+def test_compile():
+    matcher = PyenvPythonSpec.from_string_spec('3.12').compile()
+
+    assert matcher.version == Version.from_string_version('3.12')
+    assert matcher.matches(Version.from_string_version('3.12.4'))
+    assert not matcher.matches(Version.from_string_version('3.13.0'))
+
+
+def test_compile_unsupported():
+    spec = PyenvPythonSpec.from_string_spec('unsupported-3.10.3')
+
+    with pytest.raises(UnsupportedImplementation):
+        spec.compile()
+
+
+def test_parse_cached():
+    PyenvPythonSpec.from_string_spec.cache_clear()
+
+    spec1 = PyenvPythonSpec.from_string_spec('3.12.4')
+    spec2 = PyenvPythonSpec.from_string_spec('3.12.4')
+
+    assert spec1 is spec2
+    assert PyenvPythonSpec.from_string_spec.cache_info().hits == 1
@@ -0,0 +1,112 @@
+import os
+
+import pytest
+
+from pyenv_inspect import validation as validation_module
+from pyenv_inspect.exceptions import PathError
+from pyenv_inspect.validation import ExecutableValidator
+
+from tests.testlib import posix_test
+
+
+@posix_test
+class TestExecutableValidator:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch, tmp_path):
+        self.version_dir = tmp_path / '3.12.4'
+        self.exec_path = self.version_dir / 'bin' / 'python'
+        self.exec_path.parent.mkdir(parents=True)
+        self.validation_count = 0
+        _get_path = validation_module.get_pyenv_python_executable_path
+
+        def _counting_get_path(version_dir):
+            self.validation_count += 1
+            return _get_path(version_dir)
+
+        monkeypatch.setattr(
+            validation_module, 'get_pyenv_python_executable_path',
+            _counting_get_path)
+        self.now = 1000.0
+        monkeypatch.setattr(
+            validation_module.time, 'monotonic', lambda: self.now)
+
+    def test_valid_cached(self):
+        self.exec_path.touch(mode=0o755)
+        validator = ExecutableValidator()
+
+        assert validator.get_executable_path(self.version_dir) == (
+            self.exec_path)
+        assert validator.get_executable_path(self.version_dir) == (
+            self.exec_path)
+        assert self.validation_count == 1
+
+    def test_broken_cached(self):
+        validator = ExecutableValidator()
+
+        with pytest.raises(PathError) as exc_info_1:
+            validator.get_executable_path(self.version_dir)
+        with pytest.raises(PathError) as exc_info_2:
+            validator.get_executable_path(self.version_dir)
+
+        assert self.validation_count == 1
+        assert str(exc_info_2.value) == str(exc_info_1.value)
+        assert 'does not exist' in str(exc_info_2.value)
+
+    def test_expired(self):
+        validator = ExecutableValidator(ttl=2.0)
+        with pytest.raises(PathError):
+            validator.get_executable_path(self.version_dir)
+        self.exec_path.touch(mode=0o755)
+
+        self.now += 1.0
+        with pytest.raises(PathError):
+            validator.get_executable_path(self.version_dir)
+        self.now += 1.5
+        exec_path = validator.get_executable_path(self.version_dir)
+
+        assert exec_path == self.exec_path
+        assert self.validation_count == 2
+
+    def test_version_directory_modified(self):
+        validator = ExecutableValidator()
+        os.utime(self.version_dir, ns=(0, 0))
+        with pytest.raises(PathError):
+            validator.get_executable_path(self.version_dir)
+        self.exec_path.touch(mode=0o755)
+
+        os.utime(self.version_dir, ns=(1, 1))
+        exec_path = validator.get_executable_path(self.version_dir)
+
+        assert exec_path == self.exec_path
+        assert self.validation_count == 2
+
+    def test_version_directory_does_not_exist(self):
+        validator = ExecutableValidator()
+        version_dir = self.version_dir.parent / '3.13.0'
+
+        for _ in range(2):
+            with pytest.raises(PathError):
+                validator.get_executable_path(version_dir)
+
+        assert self.validation_count == 2
+
+    def test_invalidate(self):
+        validator = ExecutableValidator()
+        with pytest.raises(PathError):
+            validator.get_executable_path(self.version_dir)
+        self.exec_path.touch(mode=0o755)
+
+        validator.invalidate()
+
+        assert validator.get_executable_path(self.version_dir) == (
+            self.exec_path)
+
+    def test_ttl_zero(self):
+        self.exec_path.touch(mode=0o755)
+        validator = ExecutableValidator(ttl=0)
+
+        validator.get_executable_path(self.version_dir)
+        validator.get_executable_path(self.version_dir)
+
+        assert self.validation_count == 2
@@ -1,7 +1,12 @@
+import random
+import re
+
 import pytest
 
 from pyenv_inspect.exceptions import VersionParseError
-from pyenv_inspect.version import Version
+from pyenv_inspect.version import (
+    VERSION_PATTERN, Version, VersionMatcher, parse_version_fields,
+)
 
 from tests.testlib import spec_fixture
 
@@ -15,6 +20,56 @@ def test_parse_fixture_cpython_specs(string_version):
     Version.from_string_version(string_version)
 
 
+def _parse_version_fields_regex(string_version):
+    # reference implementation
+    match = re.fullmatch(VERSION_PATTERN, string_version)
+    if not match:
+        return None
+    fields = match.groupdict()
+    pre = None
+    if _pre := fields['pre']:
+        if _pre.startswith('rc'):
+            pre = ('rc', int(_pre[2:]))
+        else:
+            pre = (_pre[0], int(_pre[1:]))
+    return (
+        tuple(map(int, fields['base'].split('.'))),
+        pre,
+        bool(fields['dev']),
+        bool(fields['free_threaded']),
+    )
+
+
+def _random_string_versions(count):
+    rnd = random.Random(0)
+    tokens = ['3', '1', '0', '12', '.', 'a', 'b', 'r', 'rc', 'c', 't', '-dev',
+              '-', 'dev', '\u0663', '\u00b2', 'x', ' ']
+    return [
+        ''.join(rnd.choices(tokens, k=rnd.randint(0, 7)))
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize('string_version', [
+    *(
+        spec_dict['string_spec'] for spec_dict in spec_fixture['specs']
+    ),
+    '', '3', '3.', '3..1', '3.1.2.3', '3.1.2.', '31', '3.12a', '3.12rc',
+    '3.12r1', '3.12c1', '3.12a1b1', '3.12tt', '3.12-dev-dev', '3.12-devt',
+    '3.12t-dev', '3.12rc1t-dev', '3.012', '\u0663.\u0661\u0662', '\u00b2',
+    '3.12 ', ' 3.12', '3.12\n',
+])
+def test_parse_same_as_regex(string_version):
+    assert parse_version_fields(string_version) == (
+        _parse_version_fields_regex(string_version))
+
+
+def test_parse_same_as_regex_random():
+    for string_version in _random_string_versions(5000):
+        assert parse_version_fields(string_version) == (
+            _parse_version_fields_regex(string_version)), string_version
+
+
 def test_parse_error():
     with pytest.raises(VersionParseError):
         Version.from_string_version('1.a.0')
@@ -113,7 +168,7 @@ def test_gt_le(str_v1, str_v2, expected):
     assert le_result is (not expected)
 
 
-@pytest.mark.parametrize('str_v1,str_v2,expected', [
+_contains_parametrize_values = [
     ('2.6.7', '2', True),
     ('2.6.7', '3', False),
     ('2.6.7', '2.6', True),
@@ -133,7 +188,11 @@ def test_gt_le(str_v1, str_v2, expected):
     ('3.14.0t', '3.14', False),
     ('3.14.0', '3.14t', False),
     ('3.14.0', '3.14', True),
-])
+]
+
+
+@pytest.mark.parametrize(
+    'str_v1,str_v2,expected', _contains_parametrize_values)
 def test_contains(str_v1, str_v2, expected):
     v1 = Version.from_string_version(str_v1)
     v2 = Version.from_string_version(str_v2)
@@ -141,3 +200,99 @@ def test_contains(str_v1, str_v2, expected):
     result = v1 in v2
 
     assert result is expected
+
+
+def test_parse_cached():
+    Version.from_string_version.cache_clear()
+
+    v1 = Version.from_string_version('3.12.4')
+    v2 = Version.from_string_version('3.12.4')
+
+    assert v1 is v2
+    assert Version.from_string_version.cache_info().hits == 1
+
+
+def test_parse_cache_clear():
+    v1 = Version.from_string_version('3.12.4')
+
+    Version.from_string_version.cache_clear()
+
+    assert Version.from_string_version('3.12.4') is not v1
+
+
+def test_no_instance_dict():
+    version = Version.from_string_version('3.12.4')
+
+    assert not hasattr(version, '__dict__')
+
+
+def test_sort():
+    string_versions = [
+        '3.12', '3.12.1', '3.12.0a1', '3.12-dev', '3.11.9', '3.12.0rc1', '3']
+    versions = [Version.from_string_version(s) for s in string_versions]
+
+    assert [str(version) for version in sorted(versions)] == [
+        '3', '3.11.9', '3.12-dev', '3.12.0a1', '3.12.0rc1', '3.12', '3.12.1']
+
+
+@pytest.mark.parametrize('str_v1,str_v2', [
+    ('3.12', '3.12.0'),
+    ('3.12.0a1', '3.12a1'),
+    ('3.12t', '3.12.0t'),
+])
+def test_hash(str_v1, str_v2):
+    v1 = Version.from_string_version(str_v1)
+    v2 = Version.from_string_version(str_v2)
+
+    assert hash(v1) == hash(v2)
+    assert len({v1, v2}) == 1
+
+
+@pytest.mark.parametrize(
+    'str_v1,str_v2,expected', _contains_parametrize_values)
+def test_matcher_matches(str_v1, str_v2, expected):
+    v1 = Version.from_string_version(str_v1)
+    matcher = VersionMatcher(Version.from_string_version(str_v2))
+
+    assert matcher.matches(v1) is expected
+
+
+def test_matcher_matches_same_as_contains_all():
+    string_versions = [
+        f'{base}{pre}{free_threaded}{dev}'
+        for base in ['3', '3.0', '3.12', '3.12.0', '3.12.4', '3.13.0']
+        for pre in ['', 'a1', 'rc1', 'rc2']
+        for free_threaded in ['', 't']
+        for dev in ['', '-dev']
+    ]
+    versions = [Version.from_string_version(s) for s in string_versions]
+    for requested_version in versions:
+        matcher = VersionMatcher(requested_version)
+        for version in versions:
+            assert matcher.matches(version) is (
+                version in requested_version), (version, requested_version)
+
+
+@pytest.mark.parametrize('string_versions,requested,expected', [
+    (['3.11.9', '3.12.1', '3.12.4', '3.13.0'], '3.12', '3.12.4'),
+    (['3.11.9', '3.12.1', '3.12.4t'], '3.12t', '3.12.4t'),
+    (['3.11.9', '3.12.1'], '3.13', None),
+    ([], '3', None),
+    (['3.14-dev', '3.14.1-dev'], '3.14-dev', '3.14-dev'),
+])
+def test_matcher_select_best(string_versions, requested, expected):
+    versions = [Version.from_string_version(s) for s in string_versions]
+    matcher = VersionMatcher(Version.from_string_version(requested))
+
+    result = matcher.select_best(iter(versions))
+
+    assert (result and str(result)) == expected
+
+
+def test_matcher_select_best_first_equal_version_wins():
+    v1 = Version.from_string_version('3.12')
+    v2 = Version.from_string_version('3.12.0')
+    matcher = VersionMatcher(Version.from_string_version('3'))
+
+    assert matcher.select_best([v1, v2]) is v1
+    assert matcher.select_best([v2, v1]) is v2
@@ -0,0 +1,261 @@
+import os
+import shutil
+
+import pytest
+
+from pyenv_inspect import watch as watch_module
+from pyenv_inspect.inspect import find_pyenv_python_executable
+from pyenv_inspect.version import Version
+from pyenv_inspect.watch import (
+    PyenvVersionsWatcher, WatchEvent, WatchEventType,
+)
+
+from tests.testlib import posix_test
+
+
+def version_event(event_type, string_version, version_dir):
+    return WatchEvent(
+        event_type, Version.from_string_version(string_version), version_dir)
+
+
+class TestPyenvVersionsWatcher:
+
+    @pytest.fixture(autouse=True, params=['inotify', 'poll'])
+    def setup(self, request, monkeypatch, tmp_path):
+        self.use_inotify = request.param == 'inotify'
+        if self.use_inotify and watch_module._load_libc() is None:
+            pytest.skip('inotify is not available')
+        self.pyenv_root = tmp_path / 'pyenv_root'
+        monkeypatch.setenv('PYENV_ROOT', str(self.pyenv_root))
+        self.versions_dir = self.pyenv_root / 'versions'
+        self.versions_dir.mkdir(parents=True)
+        self.parsed_names = []
+        _parse_entry_name = watch_module._parse_entry_name
+
+        def _counting_parse_entry_name(name):
+            self.parsed_names.append(name)
+            return _parse_entry_name(name)
+
+        monkeypatch.setattr(
+            watch_module, '_parse_entry_name', _counting_parse_entry_name)
+
+    @pytest.fixture
+    def watcher(self):
+        with PyenvVersionsWatcher(
+            use_inotify=self.use_inotify, poll_interval=0.01,
+        ) as watcher:
+            yield watcher
+
+    def poll(self, watcher):
+        return watcher.poll(timeout=5)
+
+    def make_version(self, name):
+        exec_path = self.versions_dir / name / 'bin' / 'python'
+        exec_path.parent.mkdir(parents=True)
+        exec_path.touch(mode=0o755)
+        return self.versions_dir / name
+
+    def test_backend(self, watcher):
+        assert watcher.is_native() is self.use_inotify
+        assert watcher.get_versions_directory() == self.versions_dir
+
+    def test_initial_entries(self):
+        self.make_version('3.12.4')
+        (self.versions_dir / 'miniconda3-latest').mkdir()
+
+        with PyenvVersionsWatcher(use_inotify=self.use_inotify) as watcher:
+            assert watcher.get_entries() == [
+                (Version.from_string_version('3.12.4'),
+                 self.versions_dir / '3.12.4'),
+            ]
+            assert watcher.poll() == []
+
+    def test_added(self, watcher):
+        version_dir = self.make_version('3.12.4')
+
+        assert self.poll(watcher) == [
+            version_event(WatchEventType.ADDED, '3.12.4', version_dir),
+        ]
+        assert watcher.get_entries() == [
+            (Version.from_string_version('3.12.4'), version_dir),
+        ]
+        assert watcher.poll() == []
+
+    def test_removed(self):
+        version_dir = self.make_version('3.12.4t')
+
+        with PyenvVersionsWatcher(
+            use_inotify=self.use_inotify, poll_interval=0.01,
+        ) as watcher:
+            shutil.rmtree(version_dir)
+
+            assert self.poll(watcher) == [
+                version_event(WatchEventType.REMOVED, '3.12.4t', version_dir),
+            ]
+            assert watcher.get_entries() == []
+
+    def test_changed(self, tmp_path):
+        version_dir = self.make_version('3.12.4')
+
+        with PyenvVersionsWatcher(
+            use_inotify=self.use_inotify, poll_interval=0.01,
+        ) as watcher:
+            new_version_dir = tmp_path / 'new'
+            new_version_dir.mkdir()
+            shutil.rmtree(version_dir)
+            new_version_dir.rename(version_dir)
+
+            events = self.poll(watcher)
+
+        # inotify reports deletion and creation separately
+        assert events[-1] in (
+            version_event(WatchEventType.CHANGED, '3.12.4', version_dir),
+            version_event(WatchEventType.ADDED, '3.12.4', version_dir),
+        )
+        assert watcher.get_entries() == [
+            (Version.from_string_version('3.12.4'), version_dir),
+        ]
+
+    def test_unsupported_names_ignored(self, watcher):
+        (self.versions_dir / 'miniconda3-latest').mkdir()
+        (self.versions_dir / 'pypy3.10-7.3.15').mkdir()
+
+        assert watcher.poll(timeout=0.2) == []
+        assert watcher.get_entries() == []
+
+    @posix_test
+    def test_virtualenv_symlink_ignored(self, watcher):
+        env_dir = self.make_version('3.12.4') / 'envs' / 'venv'
+        env_dir.mkdir(parents=True)
+        (self.versions_dir / 'venv').symlink_to(env_dir)
+
+        assert self.poll(watcher) == [
+            version_event(
+                WatchEventType.ADDED, '3.12.4', self.versions_dir / '3.12.4'),
+        ]
+        assert watcher.poll(timeout=0.2) == []
+
+    def test_work_proportional_to_changes(self):
+        for index in range(50):
+            self.make_version(f'3.12.{index}')
+        with PyenvVersionsWatcher(
+            use_inotify=self.use_inotify, poll_interval=0.01,
+        ) as watcher:
+            self.parsed_names.clear()
+
+            self.make_version('3.13.0')
+            shutil.rmtree(self.versions_dir / '3.12.0')
+            events = []
+            while len(events) < 2:
+                events.extend(self.poll(watcher))
+
+            assert sorted(self.parsed_names) == ['3.13.0']
+            assert len(watcher.get_entries()) == 50
+
+    def test_find(self, watcher):
+        assert find_pyenv_python_executable('3.12', inventory=watcher) is None
+
+        version_dir = self.make_version('3.12.4')
+        self.poll(watcher)
+
+        assert find_pyenv_python_executable('3.12', inventory=watcher) == (
+            version_dir / 'bin' / 'python').resolve()
+
+    def test_executable_cache_dropped(self, watcher):
+        version_dir = self.make_version('3.12.4')
+        self.poll(watcher)
+        exec_path = watcher.get_executable_path(version_dir)
+        assert exec_path == (version_dir / 'bin' / 'python').resolve()
+
+        shutil.rmtree(version_dir)
+        self.poll(watcher)
+
+        assert version_dir not in watcher._validator._results
+
+    def test_versions_directory_removed(self, watcher):
+        version_dir = self.make_version('3.12.4')
+        self.poll(watcher)
+
+        shutil.rmtree(self.versions_dir)
+
+        assert self.poll(watcher) == [
+            version_event(WatchEventType.REMOVED, '3.12.4', version_dir),
+        ]
+        assert not watcher.is_native()
+        self.versions_dir.mkdir()
+        self.make_version('3.12.4')
+        assert self.poll(watcher) == [
+            version_event(WatchEventType.ADDED, '3.12.4', version_dir),
+        ]
+
+    def test_poll_timeout(self, watcher):
+        assert watcher.poll(timeout=0.05) == []
+
+
+class TestMultiRootPyenvVersionsWatcher:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch, tmp_path):
+        self.user_versions_dir = tmp_path / 'user' / 'versions'
+        self.shared_versions_dir = tmp_path / 'shared' / 'versions'
+        for versions_dir in [self.user_versions_dir, self.shared_versions_dir]:
+            versions_dir.mkdir(parents=True)
+        monkeypatch.setenv('PYENV_ROOT', os.pathsep.join(
+            str(tmp_path / name) for name in ['user', 'shared']))
+
+    @pytest.fixture
+    def watcher(self):
+        with PyenvVersionsWatcher(poll_interval=0.01) as watcher:
+            yield watcher
+
+    def make_version(self, versions_dir, name):
+        exec_path = versions_dir / name / 'bin' / 'python'
+        exec_path.parent.mkdir(parents=True)
+        exec_path.touch(mode=0o755)
+        return versions_dir / name
+
+    def test_all_roots_watched(self, watcher):
+        assert watcher.get_versions_directories() == [
+            self.user_versions_dir, self.shared_versions_dir]
+
+        shared_version_dir = self.make_version(
+            self.shared_versions_dir, '3.12.4')
+        assert watcher.poll(timeout=5) == [
+            version_event(
+                WatchEventType.ADDED, '3.12.4', shared_version_dir),
+        ]
+        user_version_dir = self.make_version(self.user_versions_dir, '3.11.9')
+        assert watcher.poll(timeout=5) == [
+            version_event(WatchEventType.ADDED, '3.11.9', user_version_dir),
+        ]
+
+        assert find_pyenv_python_executable('3.12', inventory=watcher) == (
+            shared_version_dir / 'bin' / 'python').resolve()
+
+    def test_earlier_root_shadows_later(self, watcher):
+        user_version_dir = self.make_version(self.user_versions_dir, '3.12.4')
+        self.make_version(self.shared_versions_dir, '3.12.4')
+        events = []
+        while len(events) < 2:
+            events.extend(watcher.poll(timeout=5))
+
+        assert watcher.get_entries() == [
+            (Version.from_string_version('3.12.4'), user_version_dir),
+        ]
+
+
+def test_inotify_unavailable(monkeypatch, tmp_path):
+    monkeypatch.setattr(watch_module, '_load_libc', lambda: None)
+
+    with PyenvVersionsWatcher(tmp_path) as watcher:
+        assert not watcher.is_native()
+
+
+def test_close_idempotent(tmp_path):
+    watcher = PyenvVersionsWatcher(tmp_path)
+
+    watcher.close()
+    watcher.close()
+
+    assert not watcher.is_native()
+    assert os.path.isdir(tmp_path)